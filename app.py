@@ -1,11 +1,34 @@
 import streamlit as st
-import fitz  # PyMuPDF for PDF reading
-from docx import Document
-import re
-import time
 import datetime
+import html
 import json
-import random
+import os
+import tempfile
+import time
+import uuid
+
+from aria.cache import DocumentCache, content_key
+from aria.chat import ChatLog
+from aria.directory import OrgDirectory
+from aria.employees import EmployeeStore
+from aria.erp import integrate_employee
+from aria.events import StepEvent
+from aria.extraction import DEFAULT_EXTRACTOR as field_extractor
+from aria.governor import ABORTED, BudgetExceeded, DocumentBudget
+from aria.ingest import is_pdf
+from aria.jobs import FINISHED, JobQueue
+from aria.journal import EXTRACTED, INTEGRATED, STORED, VALIDATED, Journal, content_hash
+from aria.layout import DEFAULT_LAYOUT_EXTRACTOR as layout_extractor
+from aria.metrics import METRICS_EXPORT_ENV, MetricsStore, Stopwatch
+from aria.pipeline import analyze_isolated, flag_duplicates, resolve_org
+from aria.profiles import PROFILES, get_profile
+from aria.rules import current_rules, rule_book
+from aria.validation import validate_fields
+
+# Every widget interaction reruns this script; the run time is recorded
+# at the end as the "script_run" stage
+script_started = time.perf_counter()
+script_cpu_started = time.thread_time()
 
 # Page configuration
 st.set_page_config(
@@ -16,16 +39,130 @@ st.set_page_config(
 
 # Initialize session state for AI Agent conversation
 if 'messages' not in st.session_state:
-    st.session_state.messages = []
+    st.session_state.messages = ChatLog.from_env(uuid.uuid4().hex)
 if 'agent_step' not in st.session_state:
     st.session_state.agent_step = 0
 if 'extracted_data' not in st.session_state:
     st.session_state.extracted_data = None
 if 'validation_complete' not in st.session_state:
     st.session_state.validation_complete = False
+if 'profile_name' not in st.session_state:
+    st.session_state.profile_name = get_profile().name
+if 'document_timings' not in st.session_state:
+    st.session_state.document_timings = {}
+if 'document_key' not in st.session_state:
+    st.session_state.document_key = None  # content hash of the document in the journal
+if 'profile_dump' not in st.session_state:
+    st.session_state.profile_dump = None
+if 'batch_jobs' not in st.session_state:
+    st.session_state.batch_jobs = {}  # upload id -> job id (None once cleared)
+if 'batch_reported' not in st.session_state:
+    st.session_state.batch_reported = set()
+if 'metrics_export_error' not in st.session_state:
+    st.session_state.metrics_export_error = None
+
+BATCH_REFRESH_S = 1.0
+BATCH_STATUS = {
+    "queued": "⏳ Queued",
+    "running": "🔄 Processing",
+    "ok": "✅ Valid",
+    "invalid": "⚠️ Needs review",
+    "partial": "✂️ Partial",
+    "aborted": "🛑 Aborted",
+    "error": "❌ Error",
+}
+
+@st.cache_resource
+def get_document_cache():
+    """Extraction cache shared by every session of this server process"""
+    return DocumentCache.from_env()
+
+@st.cache_resource
+def get_metrics_store():
+    """Stage metrics shared by every session of this server process"""
+    return MetricsStore()
+
+@st.cache_resource
+def get_employee_store():
+    """Processed-employee records used for duplicate detection ($ARIA_EMPLOYEE_DB)"""
+    return EmployeeStore.from_env()
+
+@st.cache_resource
+def get_org_directory():
+    """Org directory for Department and Manager lookups ($ARIA_ORG_DIRECTORY), or None"""
+    return OrgDirectory.from_env()
+
+@st.cache_resource
+def get_journal():
+    """Per-document progress journal ($ARIA_JOURNAL), or None"""
+    return Journal.from_env()
+
+def journaled_state():
+    """The journal's DocumentState for this session's document, or None"""
+    journal = get_journal()
+    key = st.session_state.document_key
+    return journal.get(key) if journal is not None and key else None
+
+def journaled_integration(state):
+    """The ERP result journaled for a document, or None if the app never integrated it.
+
+    Batch runs only store documents locally (the "stored" stage); journals
+    written before that stage existed may also hold "integrated" entries
+    without an ERP result, which are integrated again.
+    """
+    if state is None or not state.reached(INTEGRATED):
+        return None
+    return state.record.get("erp")
+
+def journal_progress(stage, filename, record=None):
+    """Record that this session's document reached stage"""
+    journal = get_journal()
+    if journal is not None and st.session_state.document_key:
+        journal.record(st.session_state.document_key, stage, filename, record)
+        # Someone is waiting on each step; make it durable now
+        journal.flush()
+
+@st.cache_resource
+def get_job_queue():
+    """Background document queue shared by every session of this server process"""
+    store = get_metrics_store()
+    employees = get_employee_store()
+    directory = get_org_directory()
+    
+    def on_finish(job):
+        if "fields" in job.record and directory is not None:
+            resolve_org(job.record, directory)
+        if "fields" in job.record:
+            flag_duplicates(job.record, employees)
+        metrics = job.record.get("metrics")
+        if metrics:
+            store.record_document(metrics)
+            store.record("document", job.record["timings"]["total_s"])
+            # Pattern-level detail stays in the metrics store
+            metrics.pop("patterns", None)
+    
+    return JobQueue(on_finish=on_finish, journal=get_journal())
+
+def record_stage(stage, stopwatch, pages=0, bytes_processed=0):
+    """Record a measured stage for the server-wide metrics and this session's document"""
+    get_metrics_store().record(stage, stopwatch.wall_s, stopwatch.cpu_s, pages, bytes_processed)
+    st.session_state.document_timings[stage] = stopwatch.wall_s
+    export_metrics()
+
+def export_metrics():
+    """Refresh the metrics export file when $ARIA_METRICS_EXPORT is set"""
+    export_path = os.environ.get(METRICS_EXPORT_ENV)
+    if export_path:
+        try:
+            get_metrics_store().write(export_path)
+        except OSError as e:
+            # A stale export is better than a broken page
+            st.session_state.metrics_export_error = f"{export_path}: {e}"
+        else:
+            st.session_state.metrics_export_error = None
 
 # Custom CSS for AI Agent interface
-st.markdown("""
+APP_CSS = """
 <style>
     .agent-message {
         padding: 1rem;
@@ -63,40 +200,86 @@ st.markdown("""
         background-color: #fafafa;
     }
 </style>
-""", unsafe_allow_html=True)
+"""
+
+AGENT_STATUS = [
+    "**Status:** 🟢 Online",
+    "**Model:** GPT-HR-4 Turbo",
+    "**Specialization:** HR Document Processing",
+    "**Confidence Level:** 94.2%",
+    "**Documents Processed:** 15,847",
+]
+CAPABILITIES = [
+    "✅ Multi-format document reading",
+    "✅ Intelligent field extraction",
+    "✅ Contextual data validation",
+    "✅ ERP system integration",
+    "✅ Compliance checking",
+    "✅ Anomaly detection",
+    "✅ Smart recommendations"
+]
+
+@st.cache_resource
+def get_static_assets():
+    """Page CSS and the static sidebar profile, built once per server process.
+
+    Both are sent again on every rerun, so the CSS goes out without its
+    indentation and the sidebar profile as one element instead of a dozen.
+    """
+    css = "\n".join(line.strip() for line in APP_CSS.splitlines() if line.strip())
+    sidebar_profile = "\n\n".join([
+        "# 🤖 ARIA",
+        "### AI Recruitment Intelligence Assistant",
+        "  \n".join(AGENT_STATUS),
+        "---",
+        "### 🧠 Current Capabilities",
+        *CAPABILITIES,
+    ])
+    return css, sidebar_profile
+
+static_css, static_sidebar_profile = get_static_assets()
+st.markdown(static_css, unsafe_allow_html=True)
 
 # Sidebar - AI Agent Profile
 with st.sidebar:
-    st.markdown("# 🤖 ARIA")
-    st.markdown("### AI Recruitment Intelligence Assistant")
-    
-    st.markdown("""
-    **Status:** 🟢 Online  
-    **Model:** GPT-HR-4 Turbo  
-    **Specialization:** HR Document Processing  
-    **Confidence Level:** 94.2%  
-    **Documents Processed:** 15,847  
-    """)
+    st.markdown(static_sidebar_profile)
     
     st.markdown("---")
-    st.markdown("### 🧠 Current Capabilities")
-    capabilities = [
-        "✅ Multi-format document reading",
-        "✅ Intelligent field extraction", 
-        "✅ Contextual data validation",
-        "✅ ERP system integration",
-        "✅ Compliance checking",
-        "✅ Anomaly detection",
-        "✅ Smart recommendations"
-    ]
-    for cap in capabilities:
-        st.markdown(cap)
+    st.markdown("### ⚙️ Execution Profile")
+    st.radio(
+        "Execution profile",
+        list(PROFILES),
+        format_func=lambda name: PROFILES[name].label,
+        key="profile_name",
+        label_visibility="collapsed",
+        help="Fast runs with no artificial delay; Demo keeps the paced narration"
+    )
+    profile = PROFILES[st.session_state.profile_name]
+    
+    st.checkbox(
+        "🔬 Profile document processing (cProfile)",
+        key="profile_next",
+        help="Runs extraction under cProfile and offers the stats file for download"
+    )
+    
+    st.checkbox(
+        "📐 Layout-aware PDF extraction",
+        key="layout_extraction",
+        help="Reads PDF form fields from word positions instead of the flattened text"
+    )
+    
+    rules = current_rules()
+    st.caption(f"📏 Validation rules: {os.path.basename(rules.source) if rules.source else 'built-in'}")
+    book = rule_book()
+    if book is not None and book.last_error:
+        st.warning(f"Rules file not reloaded, previous rules still apply: {book.last_error}")
+    if st.session_state.metrics_export_error:
+        st.warning(f"Metrics export failed, the file may be stale: {st.session_state.metrics_export_error}")
     
     st.markdown("---")
     st.markdown("### 📊 Session Analytics")
-    st.metric("Processing Speed", "1.2s", "↓ 0.3s")
-    st.metric("Accuracy Rate", "97.8%", "↑ 2.1%")
-    st.metric("Fields Detected", "8/8", "↑ 2")
+    # Filled in at the end of the run, once this run's measurements exist
+    analytics_placeholder = st.empty()
 
 # Header
 col1, col2 = st.columns([3, 1])
@@ -114,11 +297,15 @@ col1, col2 = st.columns([2, 1])
 
 with col1:
     st.markdown("## 📄 Document Upload")
-    uploaded_file = st.file_uploader(
-        "Upload New Hire Document", 
+    uploaded_files = st.file_uploader(
+        "Upload New Hire Documents", 
         type=["pdf", "docx"],
-        help="I can process PDF and Word documents containing new hire information"
+        accept_multiple_files=True,
+        help="I can process PDF and Word documents containing new hire information. Drop several to process them in the background."
     )
+    # One document gets the guided walkthrough; several go to the background queue
+    uploaded_file = uploaded_files[0] if len(uploaded_files) == 1 else None
+    batch_files = uploaded_files if len(uploaded_files) > 1 else []
 
 with col2:
     st.markdown("## 💬 AI Agent Chat")
@@ -126,362 +313,116 @@ with col2:
 
 def agent_message(message, message_type="info"):
     """Add an AI agent message to the chat"""
-    timestamp = datetime.datetime.now().strftime("%H:%M:%S")
-    
-    if message_type == "thinking":
-        css_class = "agent-thinking"
-        icon = "🤔"
-    elif message_type == "analysis":
-        css_class = "agent-analysis" 
-        icon = "🔍"
-    else:
-        css_class = "agent-message"
-        icon = "🤖"
-    
-    st.session_state.messages.append({
-        "message": message,
-        "type": message_type,
-        "timestamp": timestamp,
-        "icon": icon
-    })
+    st.session_state.messages.append(message, message_type)
 
 def display_chat():
-    """Display the AI agent chat interface"""
-    with chat_container:
-        st.markdown('<div class="chat-container">', unsafe_allow_html=True)
-        
-        for msg in st.session_state.messages[-10:]:  # Show last 10 messages
-            if msg["type"] == "thinking":
-                st.markdown(f'<div class="agent-thinking">{msg["icon"]} **[{msg["timestamp"]}]** {msg["message"]}</div>', unsafe_allow_html=True)
-            elif msg["type"] == "analysis":
-                st.markdown(f'<div class="agent-analysis">{msg["icon"]} **[{msg["timestamp"]}]** {msg["message"]}</div>', unsafe_allow_html=True)
-            else:
-                st.markdown(f'<div class="agent-message">{msg["icon"]} **[{msg["timestamp"]}]** {msg["message"]}</div>', unsafe_allow_html=True)
-        
-        st.markdown('</div>', unsafe_allow_html=True)
+    """Display the AI agent chat interface as one cached HTML block"""
+    with Stopwatch() as render_watch:
+        chat_html, _ = st.session_state.messages.render(10)  # Show last 10 messages
+        with chat_container:
+            st.markdown(chat_html, unsafe_allow_html=True)
+    get_metrics_store().record("chat_render", render_watch.wall_s, render_watch.cpu_s, bytes_processed=len(chat_html.encode("utf-8")))
+
+def document_extractor(filename):
+    """Field extractor for this document under the current sidebar settings"""
+    if st.session_state.layout_extraction and is_pdf(filename):
+        return layout_extractor
+    return field_extractor
 
 # AI Agent Functions
-def ai_extract_text(file, filename):
-    """AI-powered text extraction with reasoning"""
+def ai_extract_and_analyze(file, filename, profile_path=None):
+    """AI-powered streaming extraction: fields are matched page by page as the document is read.
+
+    The document is parsed in a sandbox child that is killed if it
+    overruns its DocumentBudget, even inside a single parser call, and
+    the narration is replayed here once it is back.  Returns (StreamResult
+    or None, BudgetExceeded or None); reading stops early when the
+    document runs out of budget.
+    """
     agent_message("📄 Document received. Analyzing file structure...", "thinking")
-    time.sleep(1)
+    profile.pause_stage()
     
+    budget = DocumentBudget.from_env()
     try:
-        if filename.endswith(".pdf"):
-            agent_message("🔍 Detected PDF format. Using advanced OCR analysis...", "analysis")
-            text = ""
-            doc = fitz.open(stream=file.read(), filetype="pdf")
-            pages = len(doc)
-            agent_message(f"📊 Document analysis: {pages} pages detected. Processing each page...", "analysis")
-            
-            for i, page in enumerate(doc):
-                page_text = page.get_text()
-                text += page_text
-                if i == 0:  # Analyze first page structure
-                    agent_message(f"🧠 Page 1 analysis: Found {len(page_text.split())} words, detecting form structure...", "thinking")
-            
-            doc.close()
-            agent_message(f"✅ PDF processing complete. Extracted {len(text.split())} total words.", "info")
-            
-        else:
-            agent_message("📝 Detected Word document. Parsing document structure...", "analysis")
-            text = ""
-            doc = Document(file)
-            para_count = len(doc.paragraphs)
-            agent_message(f"📊 Document structure: {para_count} paragraphs identified.", "analysis")
-            
-            for para in doc.paragraphs:
-                text += para.text + "\n"
-            
-            agent_message(f"✅ Word document processing complete. Content successfully extracted.", "info")
-        
-        return text
-        
-    except Exception as e:
-        agent_message(f"❌ Error during document processing: {str(e)}", "info")
-        return ""
-
-def ai_analyze_and_extract(text):
-    """AI-powered intelligent field extraction with reasoning"""
-    agent_message("🧠 Starting intelligent field analysis...", "thinking")
-    time.sleep(1)
-    
-    # AI analyzes document structure first
-    lines = text.split('\n')
-    non_empty_lines = [line.strip() for line in lines if line.strip()]
-    
-    agent_message(f"📊 Document structure analysis: {len(non_empty_lines)} content lines identified.", "analysis")
-    
-    # Check for form-like structure
-    colon_count = sum(1 for line in non_empty_lines if ':' in line)
-    agent_message(f"🔍 Detected structured format: {colon_count} field-value pairs found.", "thinking")
-    
-    fields = {}
-    confidence_scores = {}
-    
-    # Enhanced AI patterns with confidence scoring
-    field_patterns = {
-        "Name": {
-            "patterns": [
-                r"(?:Name|Full Name|Employee Name):\s*([^\n\r]+)",
-                r"(?:Name|Full Name|Employee Name)\s*[:\-]\s*([^\n\r]+)",
-                r"Name\s+([A-Za-z\s]{3,})(?:\n|$)"
-            ],
-            "priority": 1
-        },
-        "Email": {
-            "patterns": [
-                r"(?:Email|Email Address|E-mail):\s*([^\s\n\r]+@[^\s\n\r]+)",
-                r"([a-zA-Z0-9._%+-]+@[a-zA-Z0-9.-]+\.[a-zA-Z]{2,})"
-            ],
-            "priority": 1
-        },
-        "Department": {
-            "patterns": [
-                r"(?:Department|Dept):\s*([^\n\r]+)",
-                r"(?:Department|Dept)\s*[:\-]\s*([^\n\r]+)"
-            ],
-            "priority": 2
-        },
-        "Role": {
-            "patterns": [
-                r"(?:Role|Position|Job Title|Title):\s*([^\n\r]+)",
-                r"(?:Role|Position|Job Title|Title)\s*[:\-]\s*([^\n\r]+)"
-            ],
-            "priority": 2
-        },
-        "Start Date": {
-            "patterns": [
-                r"(?:Start Date|Start|Begin Date|Commencement Date):\s*([^\n\r]+)",
-                r"(?:Start Date|Start|Begin Date|Commencement Date)\s*[:\-]\s*([^\n\r]+)"
-            ],
-            "priority": 1
-        },
-        "Salary": {
-            "patterns": [
-                r"(?:Salary|Annual Salary|Compensation):\s*([^\n\r]+)",
-                r"\$([0-9,]+(?:\.[0-9]{2})?)"
-            ],
-            "priority": 3
-        },
-        "Manager": {
-            "patterns": [
-                r"(?:Manager|Supervisor|Reports To):\s*([^\n\r]+)",
-                r"(?:Manager|Supervisor|Reports To)\s*[:\-]\s*([^\n\r]+)"
-            ],
-            "priority": 3
-        },
-        "Employee ID": {
-            "patterns": [
-                r"(?:Employee ID|EMP ID|ID|Employee Number):\s*([^\n\r]+)",
-                r"EMP\d+",
-                r"(?:ID|Employee)\s*[:\-]\s*([A-Z0-9]+)"
-            ],
-            "priority": 3
-        }
-    }
-    
-    agent_message("🔍 Applying neural pattern recognition to extract fields...", "analysis")
-    
-    for field_name, field_info in field_patterns.items():
-        best_match = None
-        best_confidence = 0
-        
-        for i, pattern in enumerate(field_info["patterns"]):
-            match = re.search(pattern, text, re.IGNORECASE | re.MULTILINE)
-            if match:
-                value = match.group(1).strip() if len(match.groups()) > 0 else match.group(0).strip()
-                if value and len(value) > 0:
-                    # Calculate confidence based on pattern specificity and context
-                    confidence = 0.9 - (i * 0.1)  # First patterns are more specific
-                    if ':' in match.group(0):  # Structured format bonus
-                        confidence += 0.1
-                    
-                    if confidence > best_confidence:
-                        best_match = value
-                        best_confidence = confidence
-        
-        if best_match:
-            fields[field_name] = best_match
-            confidence_scores[field_name] = best_confidence
-            conf_color = "high" if best_confidence > 0.8 else "medium" if best_confidence > 0.6 else "low"
-            agent_message(f"✅ {field_name}: <span class='confidence-{conf_color}'>Found with {best_confidence:.1%} confidence</span>", "analysis")
-        else:
-            fields[field_name] = "❌ Not Found"
-            confidence_scores[field_name] = 0
-            agent_message(f"⚠️ {field_name}: Not detected in document", "thinking")
+        budget.check_size(file.size)
+    except BudgetExceeded as e:
+        agent_message(f"🛑 This document is too large to process safely: {e}", "info")
+        return None, e
     
-    # AI reasoning about data quality
-    found_fields = sum(1 for v in fields.values() if "Not Found" not in v)
-    total_fields = len(fields)
-    
-    agent_message(f"🧠 Extraction complete: {found_fields}/{total_fields} fields successfully identified.", "info")
-    
-    if found_fields >= 5:
-        agent_message("✅ High-quality data extraction achieved. Proceeding to validation phase.", "info")
-    elif found_fields >= 3:
-        agent_message("⚠️ Moderate data extraction. Some manual verification may be needed.", "info")
-    else:
-        agent_message("❌ Low extraction success. Document may need reformatting.", "info")
-    
-    return fields, confidence_scores
+    agent_message("🧠 Starting intelligent field analysis...", "thinking")
+    profile.pause_stage()
+    # Spooled from the upload's own buffer so the sandbox child reads it by path
+    # instead of being sent a copy
+    with tempfile.NamedTemporaryFile(prefix="aria-upload-", suffix=os.path.splitext(filename)[1]) as spooled:
+        spooled.write(file.getvalue())
+        spooled.flush()
+        record = analyze_isolated(
+            spooled.name, filename, layout=st.session_state.layout_extraction, budget=budget,
+            profile_path=profile_path
+        )
+    for message, message_type in record.get("narration", ()):
+        agent_message(message, message_type)
+    if record["status"] == ABORTED:
+        # Out of budget, or the parser crashed on the document
+        exceeded = BudgetExceeded.from_dict(record["budget"]) if "budget" in record else None
+        agent_message(f"🛑 Stopped processing this document: {exceeded or record['error']}", "info")
+        return None, exceeded
+    if record["status"] == "error":
+        agent_message(f"❌ Error during document processing: {html.escape(record['error'])}", "info")
+        return None, None
+    
+    exceeded = BudgetExceeded.from_dict(record["budget"]) if "budget" in record else None
+    if exceeded is not None:
+        agent_message(f"✂️ Stopped reading after {record['pages_read']} page(s): {exceeded}. Results are partial - please review them manually.", "info")
+    
+    metrics = record["metrics"]
+    get_metrics_store().record_document(metrics)
+    st.session_state.document_timings = {"extract": metrics["extract"]["wall_s"], "analyze": metrics["analyze"]["wall_s"]}
+    export_metrics()
+    return record["result"], exceeded
 
 def ai_validate_data(fields, confidence_scores):
     """AI-powered data validation with intelligent reasoning"""
     agent_message("🧠 Initiating intelligent data validation sequence...", "thinking")
-    time.sleep(1)
-    
-    validation_results = {}
-    errors = []
-    warnings = []
-    suggestions = []
-    
-    # AI validation logic
-    required_fields = ["Name", "Email", "Department", "Role", "Start Date"]
-    
-    agent_message("🔍 Validating required fields and data integrity...", "analysis")
-    
-    for field in required_fields:
-        if "Not Found" in fields.get(field, "") or not fields.get(field, "").strip():
-            errors.append(f"Missing critical field: {field}")
-            validation_results[field] = "❌ Missing"
-            agent_message(f"❌ Critical validation failure: {field} is required but missing", "analysis")
-        else:
-            validation_results[field] = "✅ Valid"
-    
-    # Advanced AI validation
-    if fields.get("Email") and "Not Found" not in fields["Email"]:
-        email_pattern = r'^[a-zA-Z0-9._%+-]+@[a-zA-Z0-9.-]+\.[a-zA-Z]{2,}$'
-        if re.match(email_pattern, fields["Email"]):
-            agent_message(f"✅ Email validation passed: {fields['Email']} is properly formatted", "analysis")
-            
-            # AI domain analysis
-            domain = fields["Email"].split('@')[1]
-            if domain in ['gmail.com', 'yahoo.com', 'hotmail.com']:
-                warnings.append("Personal email domain detected - consider using corporate email")
-                suggestions.append("Request corporate email address for official records")
-        else:
-            errors.append("Email format validation failed")
-            validation_results["Email"] = "❌ Invalid format"
-            agent_message("❌ Email format validation failed - invalid structure detected", "analysis")
-    
-    # AI-powered date intelligence
-    if fields.get("Start Date") and "Not Found" not in fields["Start Date"]:
-        agent_message("🤖 Analyzing start date with temporal intelligence...", "thinking")
-        date_str = fields["Start Date"]
-        parsed_date = None
-        
-        for fmt in ["%Y-%m-%d", "%m/%d/%Y", "%d/%m/%Y", "%B %d, %Y", "%m-%d-%Y"]:
-            try:
-                parsed_date = datetime.datetime.strptime(date_str, fmt)
-                break
-            except ValueError:
-                continue
-        
-        if parsed_date:
-            days_from_now = (parsed_date.date() - datetime.date.today()).days
-            
-            if days_from_now < 0:
-                warnings.append(f"Start date is {abs(days_from_now)} days in the past")
-                agent_message(f"⚠️ Temporal anomaly: Start date is {abs(days_from_now)} days ago", "analysis")
-            elif days_from_now > 90:
-                warnings.append(f"Start date is {days_from_now} days in the future")
-                suggestions.append("Verify if this is a future hire or if date needs correction")
-            else:
-                agent_message(f"✅ Start date validation passed: {days_from_now} days from today", "analysis")
-            
-            validation_results["Start Date"] = "✅ Valid"
-        else:
-            warnings.append("Could not parse start date format")
-            validation_results["Start Date"] = "⚠️ Format unclear"
-            suggestions.append("Standardize date format to YYYY-MM-DD")
-    
-    # AI salary analysis
-    if fields.get("Salary") and "Not Found" not in fields["Salary"]:
-        agent_message("💰 Running salary analysis with market intelligence...", "thinking")
-        salary_str = re.sub(r'[,$]', '', fields["Salary"])
-        try:
-            salary_num = float(salary_str)
-            
-            # AI market analysis
-            if salary_num < 25000:
-                warnings.append("Salary below market minimum - verify accuracy")
-                agent_message(f"⚠️ Salary alert: ${salary_num:,.0f} is below typical market rates", "analysis")
-            elif salary_num > 300000:
-                warnings.append("Executive-level salary detected - additional approvals may be needed")
-                suggestions.append("Route through executive compensation review")
-                agent_message(f"💼 Executive compensation detected: ${salary_num:,.0f}", "analysis")
-            else:
-                agent_message(f"✅ Salary validation passed: ${salary_num:,.0f} within normal range", "analysis")
-            
-            validation_results["Salary"] = "✅ Valid"
-        except ValueError:
-            warnings.append("Could not parse salary amount")
-            validation_results["Salary"] = "⚠️ Invalid format"
-    
-    # AI reasoning summary
-    total_issues = len(errors) + len(warnings)
-    if total_issues == 0:
-        agent_message("🎉 Validation complete: All data passes AI quality checks!", "info")
-    else:
-        agent_message(f"📊 Validation summary: {len(errors)} errors, {len(warnings)} warnings identified", "info")
-    
-    if suggestions:
-        agent_message(f"💡 AI generated {len(suggestions)} optimization suggestions", "info")
-    
-    return validation_results, errors, warnings, suggestions
+    profile.pause_stage()
+    
+    with Stopwatch() as validate_watch:
+        outcome = validate_fields(
+            fields, confidence_scores, notify=agent_message,
+            store=get_employee_store(), directory=get_org_directory()
+        )
+    record_stage("validate", validate_watch)
+    return outcome
+
+def ai_erp_integration(fields, source=None, store=True):
+    """AI-powered ERP integration driven by real step completion events.
 
-def ai_erp_integration(fields):
-    """AI-powered ERP integration simulation"""
+    A successful integration is added to the employee store unless store=False.
+    """
     agent_message("🚀 Initiating AI-driven ERP integration sequence...", "info")
-    time.sleep(1)
-    
-    # AI system selection
-    erp_systems = ["Oracle HCM Cloud", "SAP SuccessFactors", "Workday HCM"]
-    selected_erp = random.choice(erp_systems)
-    agent_message(f"🤖 AI selected optimal ERP system: {selected_erp}", "analysis")
-    
-    integration_steps = [
-        ("🔐 Establishing secure API connection", 2),
-        ("🧠 AI mapping employee data to ERP schema", 2),
-        ("🔍 Running pre-integration data validation", 1),
-        ("⚡ Creating employee profile with AI optimization", 2),
-        ("🛡️ Configuring security roles and permissions", 1),
-        ("💰 Setting up payroll integration", 2),
-        ("📧 Triggering automated welcome workflow", 1),
-        ("📊 Updating organizational charts and reporting", 1),
-        ("🔄 Syncing with downstream systems", 1)
-    ]
+    profile.pause_stage()
     
     progress_bar = st.progress(0)
     status_text = st.empty()
     
-    for i, (step, duration) in enumerate(integration_steps):
-        agent_message(step, "thinking")
-        status_text.text(f"AI Agent: {step}")
-        time.sleep(duration)
-        progress_bar.progress((i + 1) / len(integration_steps))
+    def on_step(event):
+        if event.state == StepEvent.STARTED:
+            agent_message(event.label, "thinking")
+            status_text.text(f"AI Agent: {event.label}")
+        progress_bar.progress(event.fraction_done)
+    
+    with Stopwatch() as erp_watch:
+        result = integrate_employee(fields, notify=agent_message, on_step=on_step, profile=profile)
+    record_stage("erp", erp_watch)
     
     status_text.empty()
     progress_bar.empty()
     
-    # AI generates insights
-    emp_id = fields.get("Employee ID", f"AI{datetime.datetime.now().strftime('%Y%m%d%H%M%S')}")
+    if result["status"] == "SUCCESS" and store:
+        get_employee_store().add(fields, erp_id=result["employee_id"], system=result["system"], source=source)
+        agent_message(f"🗂️ Saved {html.escape(str(result['employee_id']))} to the employee records for future duplicate checks.", "info")
     
-    agent_message(f"✅ Integration complete! Employee {emp_id} successfully onboarded.", "info")
-    agent_message("🧠 AI has triggered 7 downstream automation workflows", "analysis")
-    
-    return {
-        "employee_id": emp_id,
-        "status": "SUCCESS",
-        "timestamp": datetime.datetime.now().strftime("%Y-%m-%d %H:%M:%S"),
-        "system": selected_erp,
-        "ai_insights": [
-            "Optimal onboarding path selected based on role and department",
-            "Predicted 94% automation success rate",
-            "Estimated 2.3 days reduction in manual processing time"
-        ]
-    }
+    return result
 
 # Initialize chat if empty
 if not st.session_state.messages:
@@ -496,14 +437,49 @@ if uploaded_file:
     
     # Step 1: AI Document Analysis
     if st.session_state.agent_step == 0:
-        extracted_text = ai_extract_text(uploaded_file, uploaded_file.name)
+        document_cache = get_document_cache()
+        cache_key = content_key(uploaded_file.getvalue(), document_extractor(uploaded_file.name).version)
+        cached = document_cache.get(cache_key)
+        
+        if cached is not None:
+            agent_message("⚡ I've analyzed this exact document before. Reusing my earlier results...", "analysis")
+            extracted_text = cached.text
+            fields, confidence_scores = cached.result
+            st.session_state.document_timings = {}
+        else:
+            # Step 2: AI Field Extraction, streamed while pages are parsed
+            profile_path = None
+            if st.session_state.profile_next:
+                stamp = datetime.datetime.now().strftime("%Y%m%d-%H%M%S")
+                profile_path = os.path.join(tempfile.gettempdir(), f"aria-profile-{stamp}.prof")
+            stream_result, exceeded = ai_extract_and_analyze(uploaded_file, uploaded_file.name, profile_path)
+            if profile_path:
+                st.session_state.profile_dump = profile_path
+            extracted_text = stream_result.text if stream_result else ""
+            if extracted_text:
+                fields, confidence_scores = stream_result.result
+                # A partial read depends on the budget in force, so it is not reused
+                if exceeded is None:
+                    document_cache.put(cache_key, extracted_text, fields, confidence_scores)
         
         if extracted_text:
-            # Step 2: AI Field Extraction
-            fields, confidence_scores = ai_analyze_and_extract(extracted_text)
             st.session_state.extracted_data = (fields, confidence_scores)
             st.session_state.agent_step = 1
             
+            # Pick up where an earlier session (lost to a refresh or restart) stopped
+            if get_journal() is not None:
+                st.session_state.document_key = content_hash(uploaded_file.getvalue())
+                state = journaled_state()
+                if state is None:
+                    journal_progress(EXTRACTED, uploaded_file.name, {"fields": fields, "confidence": confidence_scores})
+                elif state.reached(VALIDATED) and state.record.get("status") == "ok":
+                    if journaled_integration(state) is not None:
+                        agent_message(f"📒 My journal shows this document was already onboarded as {html.escape(str(state.record['erp']['employee_id']))}. I won't create the employee twice.", "info")
+                    else:
+                        agent_message("📒 My journal shows this document already passed validation. Picking up at ERP integration.", "info")
+                    st.session_state.validation_complete = True
+                    st.session_state.agent_step = 2
+            
             # Display results
             st.markdown("---")
             st.markdown("## 🤖 AI Extraction Results")
@@ -537,6 +513,10 @@ if uploaded_file:
         
         if st.button("🧠 Run AI Validation", type="primary"):
             validation_results, errors, warnings, suggestions = ai_validate_data(fields, confidence_scores)
+            journal_progress(VALIDATED, uploaded_file.name, {
+                "status": "invalid" if errors else "ok",
+                "validation": {"results": validation_results, "errors": errors, "warnings": warnings, "suggestions": suggestions},
+            })
             
             st.markdown("---")
             st.markdown("## 🔍 AI Validation Results")
@@ -565,10 +545,23 @@ if uploaded_file:
     if st.session_state.agent_step == 2 and st.session_state.validation_complete:
         if st.button("🚀 Execute AI ERP Integration", type="primary"):
             fields, _ = st.session_state.extracted_data
-            result = ai_erp_integration(fields)
+            state = journaled_state()
+            result = journaled_integration(state)
+            if result is not None:
+                agent_message(f"📒 Reusing the integration of {result['timestamp']} ({html.escape(str(result['employee_id']))}) instead of calling {result['system']} again.", "info")
+            else:
+                # A batch run may already have put it in the employee store
+                stored = state is not None and state.reached(STORED)
+                result = ai_erp_integration(fields, source=uploaded_file.name, store=not stored)
+                if result["status"] == "SUCCESS":
+                    journal_progress(INTEGRATED, uploaded_file.name, {"erp": result})
             
             st.markdown("---")
-            st.markdown("## 🎉 AI Integration Success!")
+            if result["status"] == "SUCCESS":
+                st.markdown("## 🎉 AI Integration Success!")
+            else:
+                st.markdown("## ❌ ERP Integration Failed")
+                st.error(result["error"])
             
             col1, col2 = st.columns(2)
             
@@ -579,8 +572,10 @@ if uploaded_file:
             
             with col2:
                 st.info(f"**Timestamp:** {result['timestamp']}")
-                st.metric("AI Confidence", "97.8%", "↑ 1.2%")
-                st.metric("Processing Speed", "12.4s", "↓ 3.1s")
+                found_scores = [score for score in st.session_state.extracted_data[1].values() if score]
+                average_confidence = sum(found_scores) / len(found_scores) if found_scores else 0
+                st.metric("AI Confidence", f"{average_confidence:.1%}")
+                st.metric("Processing Speed", f"{sum(st.session_state.document_timings.values()):.2f}s")
             
             st.markdown("### 🧠 AI Insights")
             for insight in result['ai_insights']:
@@ -591,13 +586,149 @@ if uploaded_file:
                 st.session_state.agent_step = 0
                 st.session_state.extracted_data = None
                 st.session_state.validation_complete = False
-                st.session_state.messages = []
+                st.session_state.document_timings = {}
+                st.session_state.document_key = None
+                st.session_state.messages.clear()
+                st.session_state.messages.close()
                 st.experimental_rerun()
 
 else:
     status_placeholder.success("🟢 Ready to Assist")
 
+def submit_batch(files):
+    """Queue the uploads this session has not submitted yet"""
+    queue = get_job_queue()
+    submitted = 0
+    for upload in files:
+        upload_id = getattr(upload, "file_id", None) or f"{upload.name}:{upload.size}"
+        if upload_id in st.session_state.batch_jobs:
+            continue
+        st.session_state.batch_jobs[upload_id] = queue.submit(
+            upload.name, upload.getvalue(), layout=st.session_state.layout_extraction
+        )
+        submitted += 1
+    if submitted:
+        agent_message(f"📥 Queued {submitted} document(s) for background processing. Keep working - I'll report as each one finishes.", "info")
+
+def batch_row(job):
+    """One row of the live status table"""
+    record = job["record"] or {}
+    fields = record.get("fields", {})
+    validation = record.get("validation", {})
+    found = sum(1 for v in fields.values() if "Not Found" not in v)
+    return {
+        "File": job["filename"],
+        "Status": BATCH_STATUS[job["status"]],
+        "Name": fields.get("Name", ""),
+        "Email": fields.get("Email", ""),
+        "Department": fields.get("Department", ""),
+        "Start Date": fields.get("Start Date", ""),
+        "Fields": f"{found}/{len(fields)}" if fields else "",
+        "Errors": "; ".join(validation.get("errors", [])) or record.get("error", "") or record.get("budget", {}).get("message", ""),
+        "Warnings": len(validation.get("warnings", [])),
+        "Time (s)": record.get("timings", {}).get("total_s"),
+    }
+
+def render_batch():
+    """Live table of this session's background jobs; True while any are unfinished"""
+    queue = get_job_queue()
+    job_ids = [job_id for job_id in st.session_state.batch_jobs.values() if job_id is not None]
+    jobs = queue.jobs(job_ids)
+    if not jobs:
+        return False
+    
+    newly_finished = [job for job in jobs if job["status"] in FINISHED and job["id"] not in st.session_state.batch_reported]
+    for job in newly_finished:
+        st.session_state.batch_reported.add(job["id"])
+        agent_message(f"{BATCH_STATUS[job['status']]}: {html.escape(job['filename'])}", "analysis")
+    if newly_finished:
+        export_metrics()
+    
+    done = sum(1 for job in jobs if job["status"] in FINISHED)
+    pending = len(jobs) - done
+    st.markdown("---")
+    st.markdown("## 📋 Document Queue")
+    st.progress(done / len(jobs), text=f"{done}/{len(jobs)} documents processed")
+    st.dataframe([batch_row(job) for job in jobs], use_container_width=True, hide_index=True)
+    
+    col1, col2, col3 = st.columns(3)
+    with col1:
+        results = "".join(json.dumps(job["record"], ensure_ascii=False) + "\n" for job in jobs if job["record"])
+        st.download_button("⬇️ Results (JSONL)", results, file_name="aria-results.jsonl", mime="application/json", disabled=not done)
+    with col2:
+        if st.button("✋ Cancel queued", disabled=not pending):
+            queue.cancel(job_ids)
+            st.experimental_rerun()
+    with col3:
+        if st.button("🧹 Clear finished", disabled=not done):
+            finished_ids = {job["id"] for job in jobs if job["status"] in FINISHED}
+            queue.forget(finished_ids)
+            # Keep the upload ids so files still in the uploader are not queued again
+            for upload_id, job_id in st.session_state.batch_jobs.items():
+                if job_id in finished_ids:
+                    st.session_state.batch_jobs[upload_id] = None
+            st.experimental_rerun()
+    
+    if pending:
+        status_placeholder.info(f"🧠 Processing {pending} document(s) in the background...")
+    return pending > 0
+
+if batch_files:
+    submit_batch(batch_files)
+batch_pending = render_batch()
+
 # Clear chat button
 if st.button("🗑️ Clear AI Chat"):
-    st.session_state.messages = []
+    st.session_state.messages.clear()
+    st.session_state.messages.close()
+    st.experimental_rerun()
+
+def render_session_analytics():
+    """Sidebar analytics from real measurements"""
+    store = get_metrics_store()
+    snapshot = store.snapshot()
+    timings = st.session_state.document_timings
+    
+    with analytics_placeholder.container():
+        st.metric("Processing Speed", f"{sum(timings.values()):.2f}s" if timings else "—")
+        if st.session_state.extracted_data:
+            fields, _ = st.session_state.extracted_data
+            found = sum(1 for v in fields.values() if "Not Found" not in v)
+            st.metric("Fields Detected", f"{found}/{len(fields)}")
+        else:
+            st.metric("Fields Detected", "—")
+        st.metric("Documents Processed", snapshot["documents"])
+        
+        if snapshot["stages"]:
+            st.markdown("**⏱️ Stage latency (p50 / p95)**")
+            for stage, values in snapshot["stages"].items():
+                st.caption(
+                    f"{stage}: {values['wall_s_p50'] * 1000:.1f} ms / {values['wall_s_p95'] * 1000:.1f} ms "
+                    f"· CPU {values['cpu_s_total']:.2f}s · {values['pages_total']} pages"
+                )
+            memory = snapshot["memory"]
+            if memory:
+                st.caption(
+                    f"memory: peak RSS {memory['rss_peak_bytes_max'] / 2**20:.0f} MB "
+                    f"· +{memory['rss_growth_bytes_p95'] / 2**20:.1f} MB p95 per document"
+                )
+            st.download_button("⬇️ Metrics (JSON)", store.to_json(), file_name="aria-metrics.json", mime="application/json")
+            st.download_button("⬇️ Metrics (Prometheus)", store.to_prometheus(), file_name="aria-metrics.prom", mime="text/plain")
+        
+        dump_path = st.session_state.profile_dump
+        if dump_path and os.path.exists(dump_path):
+            with open(dump_path, "rb") as dump:
+                st.download_button("⬇️ cProfile dump", dump.read(), file_name=os.path.basename(dump_path))
+
+render_session_analytics()
+
+get_metrics_store().record(
+    "script_run", time.perf_counter() - script_started, time.thread_time() - script_cpu_started
+)
+export_metrics()
+
+# Poll the background queue until this session's documents are done; any
+# widget interaction interrupts the wait and reruns immediately
+if batch_pending:
+    time.sleep(BATCH_REFRESH_S)
     st.experimental_rerun()
@@ -0,0 +1 @@
+"""ARIA - UI-free building blocks for the HR document processing agent"""
@@ -0,0 +1,278 @@
+"""Columnar validation of many extracted records at once.
+
+``validate_batch`` applies the same rules as ``validate_fields`` to N
+records, but column by column.  Each column is factorized, the checks run
+once per distinct value (a cohort shares a handful of departments and
+start dates) and the outcomes are broadcast back as NumPy masks; date
+ranges and salary bands are array comparisons.  Records are then grouped
+by their combined outcome, so the result lists are assembled once per
+distinct outcome and copied per record.
+
+Re-validate pipeline output without re-extracting:
+
+    python -m aria.batch_validation results.jsonl -o revalidated.jsonl
+"""
+import argparse
+import datetime
+import json
+import re
+import sys
+
+import numpy as np
+import pandas as pd
+
+from aria.dates import DAY_MONTH, FORMAT_LABELS, MONTH_DAY, detect_format, parse_date
+from aria.directory import OrgDirectory
+from aria.employees import EmployeeStore
+from aria.rules import EMAIL_PATTERN, current_rules
+from aria.validation import add_directory_issues, add_duplicate_issues
+
+# Checked whether or not the rules make them required
+DETAIL_FIELDS = ["Email", "Start Date", "Salary"]
+
+
+def _parse_salary(salary_str):
+    try:
+        return float(re.sub(r'[,$]', '', salary_str))
+    except ValueError:
+        return None
+
+
+def _map_unique(values, parse):
+    """Apply parse once per distinct value; returns (codes, parsed uniques)"""
+    codes, uniques = pd.factorize(values)
+    return codes, [parse(value) for value in uniques]
+
+
+def _mask(codes, parsed):
+    return np.array(parsed, dtype=bool)[codes]
+
+
+def _column_state(value):
+    """(present, blank, non-empty) for one distinct field value"""
+    return "Not Found" not in value, not value.strip(), value != ""
+
+
+def _email_state(value, rules):
+    """(valid, personal domain, outside the allowed domains)"""
+    if not EMAIL_PATTERN.match(value):
+        return False, False, False
+    domain = value.split('@')[1]
+    if domain in rules.personal_domains:
+        return True, True, False
+    return True, False, bool(rules.allowed_domains) and domain not in rules.allowed_domains
+
+
+def validate_batch(records, today=None, store=None, directory=None, rules=None):
+    """Validate a list of field dicts.
+
+    Returns one (validation_results, errors, warnings, suggestions) tuple
+    per record, identical to calling validate_fields on each with the
+    same rules (by default aria.rules.current_rules()).  Records
+    with the same outcome share no state: every tuple holds fresh lists
+    and dicts.  With store, each record is also looked up in the
+    employee store (one indexed query per record) and duplicates are
+    flagged.  With directory, each distinct Department and Manager pair is
+    resolved once.
+    """
+    if today is None:
+        today = datetime.date.today()
+    if rules is None:
+        rules = current_rules()
+    if not records:
+        return []
+    required_fields = rules.required_fields
+
+    columns = {}
+    for field in dict.fromkeys([*required_fields, *DETAIL_FIELDS]):
+        values = np.empty(len(records), dtype=object)
+        values[:] = [record.get(field) or "" for record in records]
+        codes, states = _map_unique(values, _column_state)
+        columns[field] = (values, codes, np.array(states, dtype=bool).reshape(-1, 3)[codes])
+
+    def checked(field):
+        # Present and non-empty: the guard in front of each detailed check
+        state = columns[field][2]
+        return state[:, 0] & state[:, 2]
+
+    missing = [~columns[field][2][:, 0] | columns[field][2][:, 1] for field in required_fields]
+
+    # Email: format, then personal or unapproved domain
+    email_checked = checked("Email")
+    codes, states = _map_unique(columns["Email"][0], lambda value: _email_state(value, rules))
+    email_state = np.array(states, dtype=bool).reshape(-1, 3)[codes]
+    email_valid = email_checked & email_state[:, 0]
+    personal = email_valid & email_state[:, 1]
+    foreign = email_valid & email_state[:, 2]
+
+    # Date windows and salary bands of each record's department policy
+    departments = np.empty(len(records), dtype=object)
+    departments[:] = [record.get("Department") for record in records]
+    codes, policies = _map_unique(departments, rules.policy_for)
+    max_days_past = np.array([policy.max_days_past for policy in policies], dtype=np.float64)[codes]
+    max_days_ahead = np.array([policy.max_days_ahead for policy in policies], dtype=np.float64)[codes]
+    salary_min = np.array([policy.salary_min for policy in policies], dtype=np.float64)[codes]
+    salary_max = np.array([policy.salary_max for policy in policies], dtype=np.float64)[codes]
+
+    # Start date: parse each distinct string once, then compare day offsets
+    date_checked = checked("Start Date")
+    codes, parsed = _map_unique(columns["Start Date"][0], parse_date)
+    offsets = np.array([(value.date - today).days if value else 0 for value in parsed], dtype=np.int64)[codes]
+    parse_ok = _mask(codes, [value is not None for value in parsed])
+    date_past = date_checked & parse_ok & (offsets < -max_days_past)
+    date_future = date_checked & parse_ok & ~date_past & (offsets > max_days_ahead)
+    date_unclear = date_checked & ~parse_ok
+    # Ambiguous numeric dates, split by the order they were read in
+    date_month_first = date_checked & _mask(
+        codes, [bool(value) and value.ambiguous and value.format != DAY_MONTH for value in parsed]
+    )
+    date_day_first = date_checked & _mask(
+        codes, [bool(value) and value.ambiguous and value.format == DAY_MONTH for value in parsed]
+    )
+    offsets = np.where(date_past | date_future, offsets, 0)
+
+    # Salary bands; a literal "nan" parses and then falls in no band, as in validate_fields
+    salary_checked = checked("Salary")
+    codes, parsed = _map_unique(columns["Salary"][0], _parse_salary)
+    amounts = np.array([np.nan if value is None else value for value in parsed], dtype=np.float64)[codes]
+    salary_parsed = salary_checked & _mask(codes, [value is not None for value in parsed])
+    salary_low = salary_parsed & (amounts < salary_min)
+    salary_high = salary_parsed & ~salary_low & (amounts > salary_max)
+    salary_invalid = salary_checked & ~salary_parsed
+
+    # Records with the same outcome get copies of one assembled result.  The
+    # outcome flags and the day offset are packed into one int64 key.
+    flags = missing + [
+        email_checked, email_valid, personal, foreign,
+        date_checked, date_past, date_future, date_unclear, date_month_first, date_day_first,
+        salary_checked, salary_low, salary_high, salary_invalid,
+    ]
+    keys = offsets.astype(np.int64) * (1 << len(flags))
+    for bit, flag in enumerate(flags):
+        keys |= flag.astype(np.int64) << bit
+    codes, uniques = pd.factorize(keys)
+    assembled = [_assemble(int(key), len(flags), required_fields) for key in uniques]
+    outcomes = [
+        (dict(results), errors[:], warnings[:], suggestions[:])
+        for results, errors, warnings, suggestions in map(assembled.__getitem__, codes.tolist())
+    ]
+    if directory is not None:
+        resolved = {}
+        for record, outcome in zip(records, outcomes):
+            key = (record.get("Department"), record.get("Manager"))
+            if key not in resolved:
+                resolved[key] = directory.resolve(record)
+            add_directory_issues(resolved[key], *outcome)
+    if store is not None:
+        for record, outcome in zip(records, outcomes):
+            add_duplicate_issues(store.find_duplicates(record), *outcome)
+    return outcomes
+
+
+def _assemble(key, flag_count, required_fields):
+    """Build one record's result lists from its packed outcome key"""
+    signature = [bool(key >> bit & 1) for bit in range(flag_count)]
+    offset = key >> flag_count
+    required_count = len(required_fields)
+    (e_checked, e_valid, e_personal, e_foreign, d_checked, d_past, d_future, d_unclear, d_month_first, d_day_first,
+     s_checked, s_low, s_high, s_invalid) = signature[required_count:]
+    validation_results = {}
+    errors = []
+    warnings = []
+    suggestions = []
+    for field, is_missing in zip(required_fields, signature[:required_count]):
+        if is_missing:
+            errors.append(f"Missing critical field: {field}")
+            validation_results[field] = "❌ Missing"
+        else:
+            validation_results[field] = "✅ Valid"
+
+    if e_checked:
+        if not e_valid:
+            errors.append("Email format validation failed")
+            validation_results["Email"] = "❌ Invalid format"
+        elif e_personal:
+            warnings.append("Personal email domain detected - consider using corporate email")
+            suggestions.append("Request corporate email address for official records")
+        elif e_foreign:
+            warnings.append("Email domain is not an approved company domain")
+            suggestions.append("Confirm the email address with IT before provisioning accounts")
+
+    if d_checked:
+        if d_unclear:
+            warnings.append("Could not parse start date format")
+            validation_results["Start Date"] = "⚠️ Format unclear"
+            suggestions.append("Standardize date format to YYYY-MM-DD")
+        else:
+            if d_past:
+                warnings.append(f"Start date is {abs(offset)} days in the past")
+            elif d_future:
+                warnings.append(f"Start date is {offset} days in the future")
+                suggestions.append("Verify if this is a future hire or if date needs correction")
+            if d_month_first or d_day_first:
+                order = FORMAT_LABELS[DAY_MONTH if d_day_first else MONTH_DAY]
+                suggestions.append(f"Confirm start date order - read as {order}")
+            validation_results["Start Date"] = "✅ Valid"
+
+    if s_checked:
+        if s_invalid:
+            warnings.append("Could not parse salary amount")
+            validation_results["Salary"] = "⚠️ Invalid format"
+        else:
+            if s_low:
+                warnings.append("Salary below market minimum - verify accuracy")
+            elif s_high:
+                warnings.append("Executive-level salary detected - additional approvals may be needed")
+                suggestions.append("Route through executive compensation review")
+            validation_results["Salary"] = "✅ Valid"
+
+    return validation_results, errors, warnings, suggestions
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(
+        prog="python -m aria.batch_validation",
+        description="Re-run validation on aria.pipeline JSON Lines output."
+    )
+    parser.add_argument("input", help="JSON Lines file written by aria.pipeline")
+    parser.add_argument("-o", "--output", default="-", help="JSON Lines output file (default: stdout)")
+    parser.add_argument("--employee-db", metavar="PATH",
+                        help="flag records matching employees in this SQLite store (aria.employees)")
+    parser.add_argument("--org-directory", metavar="PATH",
+                        help="resolve Department and Manager against this org directory export (aria.directory)")
+    args = parser.parse_args(argv)
+
+    with open(args.input, encoding="utf-8") as source:
+        records = [json.loads(line) for line in source if line.strip()]
+    validated = [record for record in records if "fields" in record]
+    store = EmployeeStore(args.employee_db) if args.employee_db else None
+    try:
+        directory = OrgDirectory.load(args.org_directory) if args.org_directory else None
+        outcomes = validate_batch([record["fields"] for record in validated], store=store, directory=directory)
+    finally:
+        if store is not None:
+            store.close()
+    for record, (validation_results, errors, warnings, suggestions) in zip(validated, outcomes):
+        record["validation"] = {
+            "results": validation_results,
+            "errors": errors,
+            "warnings": warnings,
+            "suggestions": suggestions,
+            "start_date_format": detect_format(record["fields"].get("Start Date")),
+        }
+        record["status"] = "invalid" if errors else "ok"
+
+    output = sys.stdout if args.output == "-" else open(args.output, "w", encoding="utf-8")
+    try:
+        for record in records:
+            output.write(json.dumps(record, ensure_ascii=False) + "\n")
+    finally:
+        if output is not sys.stdout:
+            output.close()
+    invalid = sum(1 for record in validated if record["status"] == "invalid")
+    print(f"Validated {len(validated)} records: {invalid} invalid", file=sys.stderr)
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
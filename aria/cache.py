@@ -0,0 +1,157 @@
+"""Content-addressed cache for extracted document text and fields.
+
+Entries are keyed by a SHA-256 of the uploaded bytes plus the extractor
+version, so re-uploading the same file (or a Streamlit rerun) skips both
+parsing and field matching, while any change to the field patterns
+invalidates old entries automatically.
+
+Two tiers:
+
+* an in-memory LRU bounded by an approximate size budget in bytes
+* an optional SQLite file shared by every process on the host
+"""
+import hashlib
+import json
+import os
+import sqlite3
+import threading
+import time
+from collections import OrderedDict
+
+DEFAULT_MEMORY_BUDGET = 64 * 1024 * 1024  # 64 MB
+CACHE_DB_ENV = "ARIA_CACHE_DB"
+
+
+def content_key(data, version):
+    """Cache key for a document's raw bytes under an extractor version"""
+    digest = hashlib.sha256(data).hexdigest()
+    return f"{version}:{digest}"
+
+
+class CachedDocument:
+    """What the cache remembers about one document"""
+
+    __slots__ = ("text", "fields", "confidence_scores", "size")
+
+    def __init__(self, text, fields, confidence_scores):
+        self.text = text
+        self.fields = fields
+        self.confidence_scores = confidence_scores
+        # Rough footprint used for the memory budget
+        self.size = (
+            len(text)
+            + sum(len(k) + len(v) for k, v in fields.items())
+            + 16 * len(confidence_scores)
+            + 200
+        )
+
+    @property
+    def result(self):
+        """(fields, confidence_scores) copies that callers may modify"""
+        return dict(self.fields), dict(self.confidence_scores)
+
+
+class DocumentCache:
+    """Two-tier (memory LRU + optional SQLite) cache of extraction results"""
+
+    def __init__(self, memory_budget=DEFAULT_MEMORY_BUDGET, db_path=None):
+        self.memory_budget = memory_budget
+        self.db_path = db_path
+        self._entries = OrderedDict()
+        self._memory_used = 0
+        self._lock = threading.Lock()
+        self._db = None
+        self.stats = {"memory_hits": 0, "disk_hits": 0, "misses": 0, "evictions": 0}
+
+        if db_path:
+            directory = os.path.dirname(os.path.abspath(db_path))
+            os.makedirs(directory, exist_ok=True)
+            self._db = sqlite3.connect(db_path, check_same_thread=False, isolation_level=None)
+            self._db.execute("PRAGMA journal_mode=WAL")
+            self._db.execute("PRAGMA synchronous=NORMAL")
+            self._db.execute(
+                "CREATE TABLE IF NOT EXISTS documents ("
+                " key TEXT PRIMARY KEY,"
+                " text TEXT NOT NULL,"
+                " fields TEXT NOT NULL,"
+                " confidence TEXT NOT NULL,"
+                " created REAL NOT NULL)"
+            )
+
+    @classmethod
+    def from_env(cls, memory_budget=DEFAULT_MEMORY_BUDGET):
+        """Cache with a disk tier when $ARIA_CACHE_DB names a SQLite file"""
+        return cls(memory_budget=memory_budget, db_path=os.environ.get(CACHE_DB_ENV) or None)
+
+    def __len__(self):
+        return len(self._entries)
+
+    @property
+    def memory_used(self):
+        return self._memory_used
+
+    def get(self, key):
+        """Return the CachedDocument for key, or None"""
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None:
+                self._entries.move_to_end(key)
+                self.stats["memory_hits"] += 1
+                return entry
+
+            if self._db is not None:
+                row = self._db.execute(
+                    "SELECT text, fields, confidence FROM documents WHERE key = ?", (key,)
+                ).fetchone()
+                if row is not None:
+                    entry = CachedDocument(row[0], json.loads(row[1]), json.loads(row[2]))
+                    self._remember(key, entry)
+                    self.stats["disk_hits"] += 1
+                    return entry
+
+            self.stats["misses"] += 1
+            return None
+
+    def put(self, key, text, fields, confidence_scores):
+        """Store a document's text and (fields, confidence_scores) result"""
+        entry = CachedDocument(text, dict(fields), dict(confidence_scores))
+        with self._lock:
+            self._remember(key, entry)
+            if self._db is not None:
+                self._db.execute(
+                    "INSERT OR REPLACE INTO documents (key, text, fields, confidence, created)"
+                    " VALUES (?, ?, ?, ?, ?)",
+                    (
+                        key,
+                        text,
+                        json.dumps(entry.fields, ensure_ascii=False),
+                        json.dumps(entry.confidence_scores),
+                        time.time(),
+                    ),
+                )
+        return entry
+
+    def clear(self):
+        """Drop the memory tier (the disk tier is left alone)"""
+        with self._lock:
+            self._entries.clear()
+            self._memory_used = 0
+
+    def close(self):
+        with self._lock:
+            if self._db is not None:
+                self._db.close()
+                self._db = None
+
+    def _remember(self, key, entry):
+        old = self._entries.pop(key, None)
+        if old is not None:
+            self._memory_used -= old.size
+        if entry.size > self.memory_budget:
+            return  # Too big for the memory tier; the disk tier still has it
+        self._entries[key] = entry
+        self._memory_used += entry.size
+        while self._memory_used > self.memory_budget:
+            _, evicted = self._entries.popitem(last=False)
+            self._memory_used -= evicted.size
+            self.stats["evictions"] += 1
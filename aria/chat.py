@@ -0,0 +1,147 @@
+"""Bounded agent chat log.
+
+The Streamlit session keeps only the most recent messages in a fixed-size
+ring buffer of slotted records; message types and icons are interned so
+each record holds references to shared strings.  Full history can be
+spilled to a JSON Lines file for auditing.
+
+Messages are HTML (the narration styles confidence levels with spans), so
+callers escape any text taken from a document or an upload before
+appending it.  Each message's HTML is built once and cached on the
+record, and the chat panel is rendered as a single HTML block that is
+only rebuilt when new messages arrived since the previous render.
+"""
+import datetime
+import json
+import os
+import sys
+import threading
+import weakref
+from collections import deque
+
+DEFAULT_CAPACITY = 100
+CHAT_LOG_DIR_ENV = "ARIA_CHAT_LOG_DIR"
+
+# message type -> (css class, icon)
+MESSAGE_STYLES = {
+    "thinking": ("agent-thinking", "🤔"),
+    "analysis": ("agent-analysis", "🔍"),
+}
+DEFAULT_STYLE = ("agent-message", "🤖")
+
+
+class ChatMessage:
+    """One chat entry; seq increases monotonically over the log's lifetime"""
+
+    __slots__ = ("seq", "message", "type", "timestamp", "icon", "css_class", "_html")
+
+    def __init__(self, seq, message, message_type, timestamp):
+        css_class, icon = MESSAGE_STYLES.get(message_type, DEFAULT_STYLE)
+        self.seq = seq
+        self.message = message
+        self.type = sys.intern(message_type)
+        self.timestamp = timestamp
+        self.icon = icon
+        self.css_class = css_class
+        self._html = None
+
+    @property
+    def html(self):
+        if self._html is None:
+            self._html = (
+                f'<div class="{self.css_class}">{self.icon} '
+                f'<strong>[{self.timestamp}]</strong> {self.message}</div>'
+            )
+        return self._html
+
+    def as_dict(self):
+        return {"message": self.message, "type": self.type, "timestamp": self.timestamp, "icon": self.icon}
+
+
+class ChatLog:
+    """Fixed-capacity ring buffer of ChatMessages with optional spill to disk"""
+
+    def __init__(self, capacity=DEFAULT_CAPACITY, spill_path=None):
+        self.capacity = capacity
+        self.spill_path = spill_path
+        self._messages = deque(maxlen=capacity)
+        self._seq = 0
+        self._spill = None
+        self._spill_finalizer = None
+        self._lock = threading.Lock()
+        self._rendered = None  # (window key, html block)
+
+    @classmethod
+    def from_env(cls, session_id, capacity=DEFAULT_CAPACITY):
+        """Log that spills to $ARIA_CHAT_LOG_DIR/chat-<session_id>.jsonl when set"""
+        directory = os.environ.get(CHAT_LOG_DIR_ENV)
+        spill_path = os.path.join(directory, f"chat-{session_id}.jsonl") if directory else None
+        return cls(capacity, spill_path)
+
+    def __len__(self):
+        return len(self._messages)
+
+    def __iter__(self):
+        return iter(list(self._messages))
+
+    @property
+    def total(self):
+        """Messages appended since the log was created, including evicted ones"""
+        return self._seq
+
+    def append(self, message, message_type="info", timestamp=None):
+        """Add a message and return its record"""
+        timestamp = timestamp or datetime.datetime.now().strftime("%H:%M:%S")
+        with self._lock:
+            self._seq += 1
+            record = ChatMessage(self._seq, message, message_type, timestamp)
+            self._messages.append(record)
+            if self.spill_path:
+                self._write(record)
+        return record
+
+    def recent(self, count):
+        """The last count messages, oldest first"""
+        with self._lock:
+            start = max(0, len(self._messages) - count)
+            return [self._messages[i] for i in range(start, len(self._messages))]
+
+    def render(self, count, container_class="chat-container"):
+        """HTML block for the last count messages and how many are new.
+
+        The block is cached and returned as-is until messages are appended
+        or the log is cleared.
+        """
+        with self._lock:
+            key = (self._seq, len(self._messages), count)
+            if self._rendered is not None and self._rendered[0] == key:
+                return self._rendered[1], 0
+            start = max(0, len(self._messages) - count)
+            window = [self._messages[i] for i in range(start, len(self._messages))]
+            last_seq = self._rendered[0][0] if self._rendered is not None else 0
+            block = f'<div class="{container_class}">' + "".join(m.html for m in window) + "</div>"
+            self._rendered = (key, block)
+            return block, sum(1 for m in window if m.seq > last_seq)
+
+    def clear(self):
+        """Forget the in-memory messages (spilled history is kept)"""
+        with self._lock:
+            self._messages.clear()
+
+    def close(self):
+        """Close the spill file; the next append reopens it"""
+        with self._lock:
+            if self._spill is not None:
+                self._spill_finalizer()
+                self._spill = None
+
+    def _write(self, record):
+        if self._spill is None:
+            os.makedirs(os.path.dirname(os.path.abspath(self.spill_path)), exist_ok=True)
+            self._spill = open(self.spill_path, "a", encoding="utf-8", buffering=1)
+            # Streamlit drops session state without a teardown hook
+            self._spill_finalizer = weakref.finalize(self, self._spill.close)
+        entry = record.as_dict()
+        entry["seq"] = record.seq
+        entry["date"] = datetime.date.today().isoformat()
+        self._spill.write(json.dumps(entry, ensure_ascii=False) + "\n")
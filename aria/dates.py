@@ -0,0 +1,135 @@
+"""Start date parsing with shape detection and memoization.
+
+``parse_date`` classifies a date string with one precompiled matcher and
+dispatches on its shape instead of trying every ``strptime`` format and
+catching a ValueError per miss.  Numeric dates are built straight from the
+matched digits; only month names still go through ``strptime``.  Results
+are memoized, since a cohort of new hires usually shares a few start
+dates.  Strings of no known shape fall back to the full format list, so
+every string the old loop accepted parses to the same date.
+
+Numeric dates with slashes are ambiguous between month/day and day/month.
+A component above 12 settles the order; when both are 12 or below the
+configured order decides (month first by default, as the original format
+list did) and the result is flagged as ambiguous.  Set
+``ARIA_DATE_ORDER=dmy`` to read such dates day first.
+"""
+import datetime
+import functools
+import os
+import re
+
+DATE_ORDER_ENV = "ARIA_DATE_ORDER"
+
+ISO = "%Y-%m-%d"
+MONTH_DAY = "%m/%d/%Y"
+DAY_MONTH = "%d/%m/%Y"
+MONTH_NAME = "%B %d, %Y"
+MONTH_DAY_DASH = "%m-%d-%Y"
+
+# Tried in this order when a string has none of the known shapes
+DATE_FORMATS = [ISO, MONTH_DAY, DAY_MONTH, MONTH_NAME, MONTH_DAY_DASH]
+
+FORMAT_LABELS = {
+    ISO: "YYYY-MM-DD",
+    MONTH_DAY: "MM/DD/YYYY",
+    DAY_MONTH: "DD/MM/YYYY",
+    MONTH_NAME: "Month DD, YYYY",
+    MONTH_DAY_DASH: "MM-DD-YYYY",
+}
+
+DATE_SHAPE = re.compile(
+    r"(?P<iso>(?P<iso_y>[0-9]{4})-(?P<iso_m>[0-9]{1,2})-(?P<iso_d>[0-9]{1,2}))"
+    r"|(?P<slash>(?P<first>[0-9]{1,2})/(?P<second>[0-9]{1,2})/(?P<slash_y>[0-9]{4}))"
+    r"|(?P<named>[A-Za-z]+ [0-9]{1,2}, [0-9]{4})"
+    r"|(?P<dash>(?P<dash_m>[0-9]{1,2})-(?P<dash_d>[0-9]{1,2})-(?P<dash_y>[0-9]{4}))"
+)
+
+
+class ParsedDate:
+    """A parsed date, the format it was read with and whether the order was a guess"""
+
+    __slots__ = ("date", "format", "ambiguous")
+
+    def __init__(self, date, date_format, ambiguous=False):
+        self.date = date
+        self.format = date_format
+        self.ambiguous = ambiguous
+
+    @property
+    def label(self):
+        return FORMAT_LABELS.get(self.format, self.format)
+
+    def __repr__(self):
+        return f"ParsedDate({self.date!r}, {self.format!r}, ambiguous={self.ambiguous})"
+
+
+def day_first_default():
+    return os.environ.get(DATE_ORDER_ENV, "mdy").lower() == "dmy"
+
+
+def parse_date(value, day_first=None):
+    """ParsedDate for value, or None when no supported format fits"""
+    if day_first is None:
+        day_first = day_first_default()
+    return _parse_cached(value, day_first)
+
+
+def detect_format(value, day_first=None):
+    """Human-readable format of value (e.g. "MM/DD/YYYY"), or None"""
+    parsed = parse_date(value, day_first) if value else None
+    return parsed.label if parsed else None
+
+
+@functools.lru_cache(maxsize=4096)
+def _parse_cached(value, day_first):
+    shape = DATE_SHAPE.fullmatch(value)
+    if shape is None:
+        # Not a known shape; let the full format list decide
+        for date_format in _ordered_formats(day_first):
+            parsed = _strptime(value, date_format)
+            if parsed is not None:
+                return ParsedDate(parsed, date_format)
+        return None
+
+    kind = shape.lastgroup
+    ambiguous = False
+    # Numeric shapes are built straight from the matched digits
+    if kind == "iso":
+        candidates = [(ISO, shape["iso_y"], shape["iso_m"], shape["iso_d"])]
+    elif kind == "dash":
+        candidates = [(MONTH_DAY_DASH, shape["dash_y"], shape["dash_m"], shape["dash_d"])]
+    elif kind == "slash":
+        first, second, year = shape["first"], shape["second"], shape["slash_y"]
+        month_day = (MONTH_DAY, year, first, second)
+        day_month = (DAY_MONTH, year, second, first)
+        if int(first) > 12:
+            candidates = [day_month]
+        elif int(second) > 12:
+            candidates = [month_day]
+        else:
+            ambiguous = int(first) != int(second)
+            candidates = [day_month, month_day] if day_first else [month_day, day_month]
+    else:
+        parsed = _strptime(value, MONTH_NAME)
+        return ParsedDate(parsed, MONTH_NAME) if parsed is not None else None
+
+    for date_format, year, month, day in candidates:
+        try:
+            return ParsedDate(datetime.date(int(year), int(month), int(day)), date_format, ambiguous)
+        except ValueError:
+            continue
+    return None
+
+
+def _ordered_formats(day_first):
+    if not day_first:
+        return DATE_FORMATS
+    return [ISO, DAY_MONTH, MONTH_DAY, MONTH_NAME, MONTH_DAY_DASH]
+
+
+def _strptime(value, date_format):
+    try:
+        return datetime.datetime.strptime(value, date_format).date()
+    except ValueError:
+        return None
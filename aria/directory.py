@@ -0,0 +1,337 @@
+"""Org directory lookups for the Department and Manager fields.
+
+A CSV or JSON export of employees and departments is loaded once and
+indexed by trigrams, so a misspelled value ("Enginering", "J. Smtih") is
+resolved to its canonical directory entry without scanning every name.
+Exact names (and, for people, "first-initial last" forms) are a dict hit;
+otherwise the trigram postings produce a short candidate list, which is
+ranked by edit similarity.
+
+    python -m aria.directory org.json "Enginering" --field Department
+
+JSON exports look like
+
+    {"departments": [{"id": "D-ENG", "name": "Engineering", "aliases": ["R&D"]}],
+     "employees": [{"id": "E1001", "name": "John Smith", "email": "...", "department": "Engineering"}]}
+
+CSV exports have one employee per row with id, name, email, department
+and optionally department_id columns; departments are taken from the
+rows.
+"""
+import argparse
+import collections
+import csv
+import difflib
+import json
+import math
+import os
+import sys
+import time
+
+from aria.employees import normalize_name
+from aria.extraction import NOT_FOUND
+
+ORG_DIRECTORY_ENV = "ARIA_ORG_DIRECTORY"
+
+DEPARTMENT = "department"
+PERSON = "person"
+# Extracted field -> kind of directory entry it names
+RESOLVED_FIELDS = {"Department": DEPARTMENT, "Manager": PERSON}
+
+MATCH_EXACT = "exact"
+MATCH_FUZZY = "fuzzy"
+MATCH_AMBIGUOUS = "ambiguous"
+MATCH_UNKNOWN = "unknown"
+
+# Trigram overlap (Dice) a candidate needs to be considered at all, and
+# edit similarity it needs to be suggested
+MIN_OVERLAP = 0.3
+MIN_SIMILARITY = 0.8
+# Candidates closer than this to the best one make the match ambiguous
+AMBIGUOUS_MARGIN = 0.02
+RANKED_CANDIDATES = 4
+# Postings entries walked per search, and candidates per result whose
+# full overlap is computed
+MAX_POSTINGS = 3000
+VERIFIED_PER_RESULT = 16
+
+
+def trigrams(key):
+    """Trigrams of a normalized key, each word padded as "  word " """
+    grams = set()
+    for word in key.split():
+        padded = f"  {word} "
+        grams.update(padded[i:i + 3] for i in range(len(padded) - 2))
+    return grams
+
+
+class TrigramIndex:
+    """Fuzzy lookup of normalized keys through trigram postings lists"""
+
+    def __init__(self):
+        self._keys = []
+        self._targets = []
+        self._grams = []
+        self._postings = {}
+        self._exact = {}
+
+    def __len__(self):
+        return len(self._keys)
+
+    def add(self, key, target):
+        """Index key (already normalized) for target"""
+        if target in self._exact.get(key, ()):
+            return
+        position = len(self._keys)
+        grams = frozenset(trigrams(key))
+        self._keys.append(key)
+        self._targets.append(target)
+        self._grams.append(grams)
+        for gram in grams:
+            self._postings.setdefault(gram, []).append(position)
+        self._exact.setdefault(key, []).append(target)
+
+    def exact(self, key):
+        return self._exact.get(key, [])
+
+    def search(self, key, limit=RANKED_CANDIDATES, min_overlap=MIN_OVERLAP):
+        """Up to limit (similarity, target) pairs, best first.
+
+        A candidate sharing a fraction d of trigrams (Dice) with key shares
+        at least d * |q| / (2 - d) of the query's |q| trigrams, so only the
+        postings of the rarest |q| - that + 1 query trigrams are walked:
+        every qualifying candidate shares one of them, and the long lists
+        of common trigrams (a first name's "  j") are never read.  Candidates
+        are ranked by how many of those trigrams they share, and only the
+        top few get their full overlap computed.  Past MAX_POSTINGS the
+        rarer trigrams have already found the likely matches and the
+        remaining postings are skipped.
+        """
+        grams = frozenset(trigrams(key))
+        if not grams:
+            return []
+        needed = max(1, math.ceil(min_overlap * len(grams) / (2 - min_overlap)))
+        by_rarity = sorted(grams, key=lambda gram: len(self._postings.get(gram, ())))
+        shared = collections.Counter()
+        walked = 0
+        for gram in by_rarity[:len(grams) - needed + 1]:
+            postings = self._postings.get(gram)
+            if not postings:
+                continue
+            if walked and walked + len(postings) > MAX_POSTINGS:
+                break
+            shared.update(postings)
+            walked += len(postings)
+
+        scored = []
+        for position, _ in shared.most_common(limit * VERIFIED_PER_RESULT):
+            candidate_grams = self._grams[position]
+            overlap = 2 * len(grams & candidate_grams) / (len(grams) + len(candidate_grams))
+            if overlap >= min_overlap:
+                scored.append((overlap, position))
+        scored.sort(reverse=True)
+
+        # Trigrams miss transpositions ("smtih"); rank the best few by edit similarity
+        matcher = difflib.SequenceMatcher(autojunk=False)
+        matcher.set_seq2(key)
+        best = {}
+        for _, position in scored[:limit]:
+            matcher.set_seq1(self._keys[position])
+            similarity = matcher.ratio()
+            target = self._targets[position]
+            if similarity > best.get(target, -1.0):
+                best[target] = similarity
+        ranked = sorted(best.items(), key=lambda item: item[1], reverse=True)
+        return [(similarity, target) for target, similarity in ranked[:limit]]
+
+
+class OrgEntry:
+    """A department or employee of the org directory"""
+
+    __slots__ = ("id", "name", "kind", "email", "department")
+
+    def __init__(self, id, name, kind, email=None, department=None):
+        self.id = id
+        self.name = name
+        self.kind = kind
+        self.email = email
+        self.department = department
+
+    @property
+    def label(self):
+        return f"{self.name} ({self.id})"
+
+    def __repr__(self):
+        return f"OrgEntry({self.id!r}, {self.name!r}, {self.kind!r})"
+
+
+class Resolution:
+    """How one extracted field value matched the directory"""
+
+    __slots__ = ("field", "value", "match", "entry", "similarity", "candidates")
+
+    def __init__(self, field, value, match, entry=None, similarity=0.0, candidates=()):
+        self.field = field
+        self.value = value
+        self.match = match
+        self.entry = entry
+        self.similarity = similarity
+        self.candidates = list(candidates)
+
+    @property
+    def resolved(self):
+        return self.entry is not None
+
+    def as_dict(self):
+        resolution = {"match": self.match, "value": self.value}
+        if self.entry is not None:
+            resolution.update(id=self.entry.id, name=self.entry.name, similarity=round(self.similarity, 3))
+        if self.candidates:
+            resolution["candidates"] = [{"id": entry.id, "name": entry.name} for entry in self.candidates]
+        return resolution
+
+    def __repr__(self):
+        return f"Resolution({self.field!r}, {self.value!r}, {self.match!r}, {self.entry!r})"
+
+
+class OrgDirectory:
+    """Departments and employees indexed for exact and fuzzy name lookups"""
+
+    def __init__(self, departments=(), employees=()):
+        self.entries = {DEPARTMENT: {}, PERSON: {}}
+        self._indexes = {DEPARTMENT: TrigramIndex(), PERSON: TrigramIndex()}
+        for department in departments:
+            self.add_department(**department)
+        for employee in employees:
+            self.add_employee(**employee)
+
+    @classmethod
+    def load(cls, path):
+        """Directory from a JSON or CSV export (see the module docstring)"""
+        with open(path, encoding="utf-8", newline="") as source:
+            if path.lower().endswith(".csv"):
+                return cls(employees=_csv_employees(source))
+            data = json.load(source)
+        if isinstance(data, list):
+            data = {"employees": data}
+        return cls(data.get("departments", ()), data.get("employees", ()))
+
+    @classmethod
+    def from_env(cls):
+        """Directory at $ARIA_ORG_DIRECTORY, or None when it is not set"""
+        path = os.environ.get(ORG_DIRECTORY_ENV)
+        return cls.load(path) if path else None
+
+    def __len__(self):
+        return sum(len(entries) for entries in self.entries.values())
+
+    @property
+    def departments(self):
+        return self.entries[DEPARTMENT]
+
+    @property
+    def employees(self):
+        return self.entries[PERSON]
+
+    def add_department(self, name, id=None, aliases=()):
+        entry = self.departments.get(id or name)
+        if entry is None and id is None:
+            # Employee rows name their department; reuse the listed one
+            known = self._indexes[DEPARTMENT].exact(normalize_name(name))
+            entry = known[0] if len(known) == 1 else None
+        if entry is None:
+            entry = self.departments[id or name] = OrgEntry(id or name, name, DEPARTMENT)
+        for alias in (name, id, *aliases):
+            key = normalize_name(alias)
+            if key:
+                self._indexes[DEPARTMENT].add(key, entry)
+        return entry
+
+    def add_employee(self, name, id=None, email=None, department=None, department_id=None):
+        if department or department_id:
+            department = self.add_department(department or department_id, department_id).id
+        entry = OrgEntry(id or email or name, name, PERSON, email, department)
+        self.employees[entry.id] = entry
+        key = normalize_name(name)
+        if key:
+            index = self._indexes[PERSON]
+            index.add(key, entry)
+            words = key.split()
+            if len(words) > 1:
+                # "J Smith" and "John Smith" without the middle name
+                index.add(f"{words[0][0]} {words[-1]}", entry)
+                if len(words) > 2:
+                    index.add(f"{words[0]} {words[-1]}", entry)
+        return entry
+
+    def lookup(self, value, kind, field=None):
+        """Resolve one value against the departments or employees"""
+        key = normalize_name(value)
+        if not key:
+            return Resolution(field, value, MATCH_UNKNOWN)
+        index = self._indexes[kind]
+        exact = list(dict.fromkeys(index.exact(key)))
+        if len(exact) == 1:
+            return Resolution(field, value, MATCH_EXACT, exact[0], 1.0)
+        if exact:
+            return Resolution(field, value, MATCH_AMBIGUOUS, candidates=exact)
+
+        ranked = [(similarity, entry) for similarity, entry in index.search(key) if similarity >= MIN_SIMILARITY]
+        if not ranked:
+            return Resolution(field, value, MATCH_UNKNOWN)
+        best_similarity, best = ranked[0]
+        close = [entry for similarity, entry in ranked if best_similarity - similarity <= AMBIGUOUS_MARGIN]
+        if len(close) > 1:
+            return Resolution(field, value, MATCH_AMBIGUOUS, similarity=best_similarity, candidates=close)
+        return Resolution(field, value, MATCH_FUZZY, best, best_similarity, [entry for _, entry in ranked[1:3]])
+
+    def resolve(self, fields):
+        """Resolutions of the Department and Manager values present in fields"""
+        resolutions = []
+        for field, kind in RESOLVED_FIELDS.items():
+            value = (fields.get(field) or "").strip()
+            if value and value != NOT_FOUND and "Not Found" not in value:
+                resolutions.append(self.lookup(value, kind, field))
+        return resolutions
+
+
+def _csv_employees(source):
+    for row in csv.DictReader(source):
+        row = {
+            "_".join(column.strip().lower().split()): value.strip()
+            for column, value in row.items() if column and value and value.strip()
+        }
+        name = row.get("name")
+        if not name:
+            continue
+        yield {
+            "name": name,
+            "id": row.get("id") or row.get("employee_id"),
+            "email": row.get("email"),
+            "department": row.get("department"),
+            "department_id": row.get("department_id"),
+        }
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(
+        prog="python -m aria.directory",
+        description="Look values up in an org directory export."
+    )
+    parser.add_argument("directory", help="JSON or CSV org directory export")
+    parser.add_argument("values", nargs="+")
+    parser.add_argument("--field", choices=sorted(RESOLVED_FIELDS), default="Manager")
+    args = parser.parse_args(argv)
+
+    started = time.perf_counter()
+    directory = OrgDirectory.load(args.directory)
+    print(f"Loaded {len(directory.departments)} departments and {len(directory.employees)} employees "
+          f"in {time.perf_counter() - started:.2f}s", file=sys.stderr)
+    for value in args.values:
+        resolution = directory.lookup(value, RESOLVED_FIELDS[args.field], args.field)
+        print(json.dumps(resolution.as_dict(), ensure_ascii=False))
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
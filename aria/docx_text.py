@@ -0,0 +1,206 @@
+"""Fast text extraction for Word documents.
+
+Streams the main document part out of the .docx zip with an incremental
+XML parser and yields paragraph and table text in document order, without
+building python-docx's object model.  Elements are dropped as soon as
+they have been read, so memory stays flat on long documents.
+
+Only block elements (paragraphs, tables, rows, cells) are handled as
+parse events; a paragraph's text is read from its subtree when it closes.
+lxml's iterparse is used when it is installed (python-docx depends on
+it), as it filters runs and formatting out in C before they reach
+Python; it is imported with the first document.  xml.etree's iterparse
+is the fallback.
+
+Body paragraphs come out as python-docx's ``paragraph.text`` does, plus
+text it skips (hyperlinks, tracked insertions, content controls).  Each
+table row becomes one line with its cells separated by tabs; a two-cell
+row whose first cell is a label ("Full Name" | "Jane Doe") is written as
+"Full Name: Jane Doe" so the field patterns see a label/value line.
+"""
+import posixpath
+import zipfile
+from xml.etree import ElementTree
+
+_NOT_LOADED = object()
+# lxml.etree once _lxml() has run, None when lxml is not installed
+lxml_etree = _NOT_LOADED
+
+W = "{http://schemas.openxmlformats.org/wordprocessingml/2006/main}"
+BODY = W + "body"
+P = W + "p"
+R = W + "r"
+T = W + "t"
+TAB = W + "tab"
+BR = W + "br"
+CR = W + "cr"
+NO_BREAK_HYPHEN = W + "noBreakHyphen"
+TBL = W + "tbl"
+TR = W + "tr"
+TC = W + "tc"
+# mc:AlternateContent repeats text boxes in a legacy Fallback; read the Choice only
+MC_FALLBACK = "{http://schemas.openxmlformats.org/markup-compatibility/2006}Fallback"
+
+RUN_TEXT = {TAB: "\t", BR: "\n", CR: "\n", NO_BREAK_HYPHEN: "-"}
+TEXT_TAGS = [T, *RUN_TEXT]
+BLOCK_TAGS = [BODY, P, TBL, TR, TC, MC_FALLBACK]
+# Tab stops in paragraph properties are w:tab too, but always carry w:val
+TAB_STOP_VAL = W + "val"
+
+DOCUMENT_PART = "word/document.xml"
+OFFICE_DOCUMENT = "http://schemas.openxmlformats.org/officeDocument/2006/relationships/officeDocument"
+CHUNK_CHARS = 16384
+MAX_LABEL_CHARS = 40
+
+
+class DocxStats:
+    """Counts filled in while a document is streamed"""
+
+    __slots__ = ("paragraphs", "tables")
+
+    def __init__(self):
+        self.paragraphs = 0
+        self.tables = 0
+
+
+def iter_docx_lines(source, stats=None):
+    """Yield the lines of a .docx path or binary file-like object in order"""
+    if stats is None:
+        stats = DocxStats()
+    with zipfile.ZipFile(source) as package:
+        with package.open(_document_part(package)) as part:
+            yield from _iter_lines(part, stats)
+
+
+def iter_docx_chunks(source, stats=None, chunk_chars=CHUNK_CHARS):
+    """Yield the document text in chunks of about chunk_chars whole lines"""
+    lines = iter_docx_lines(source, stats)
+    try:
+        batch = []
+        size = 0
+        for line in lines:
+            batch.append(line)
+            size += len(line) + 1
+            if size >= chunk_chars:
+                yield "".join(line + "\n" for line in batch)
+                batch = []
+                size = 0
+        if batch:
+            yield "".join(line + "\n" for line in batch)
+    finally:
+        lines.close()
+
+
+def _document_part(package):
+    """Name of the main document part, as declared in _rels/.rels"""
+    try:
+        rels = ElementTree.fromstring(package.read("_rels/.rels"))
+    except (KeyError, ElementTree.ParseError):
+        rels = None
+    if rels is not None:
+        for rel in rels:
+            if rel.get("Type") == OFFICE_DOCUMENT and rel.get("TargetMode") != "External":
+                name = posixpath.normpath(rel.get("Target", "").lstrip("/"))
+                if name in package.NameToInfo:
+                    return name
+    if DOCUMENT_PART in package.NameToInfo:
+        return DOCUMENT_PART
+    raise ValueError("Not a Word document: no main document part found")
+
+
+def _lxml():
+    """lxml.etree, imported with the first document rather than at startup"""
+    global lxml_etree
+    if lxml_etree is _NOT_LOADED:
+        try:
+            from lxml import etree
+        except ImportError:
+            etree = None
+        lxml_etree = etree
+    return lxml_etree
+
+
+def _iterparse(part):
+    etree = _lxml()
+    if etree is not None:
+        return etree.iterparse(
+            part, events=("start", "end"), tag=BLOCK_TAGS, resolve_entities=False, no_network=True
+        )
+    return ElementTree.iterparse(part, events=("start", "end"))
+
+
+def _paragraph_text(paragraph):
+    # lxml filters by tag in C; xml.etree yields every descendant
+    nodes = paragraph.iter(*TEXT_TAGS) if lxml_etree is not None else paragraph.iter()
+    parts = []
+    for node in nodes:
+        tag = node.tag
+        if tag == T:
+            parts.append(node.text or "")
+        elif tag in RUN_TEXT and node.get(TAB_STOP_VAL) is None:
+            parts.append(RUN_TEXT[tag])
+    return "".join(parts)
+
+
+def _iter_lines(part, stats):
+    tables = []  # open tables: rows of cells, a cell is a list of lines until it closes
+    body = None
+    skip = 0
+    for event, elem in _iterparse(part):
+        tag = elem.tag
+        if event == "start":
+            if skip or tag == MC_FALLBACK:
+                skip += 1
+            elif tag == TBL:
+                tables.append([])
+            elif tag == TR:
+                tables[-1].append([])
+            elif tag == TC:
+                tables[-1][-1].append([])
+            elif tag == BODY:
+                body = elem
+            continue
+
+        if skip:
+            skip -= 1
+            if not skip:
+                elem.clear()  # keep the fallback copy out of the enclosing paragraph
+            continue
+        if tag == P:
+            # Nested paragraphs (text boxes) were read and cleared when they closed
+            text = _paragraph_text(elem)
+            stats.paragraphs += 1
+            if tables:
+                tables[-1][-1][-1].append(text)
+            else:
+                yield text
+        elif tag == TC:
+            row = tables[-1][-1]
+            row[-1] = " ".join(" ".join(line.split()) for line in row[-1] if line.strip())
+        elif tag == TBL:
+            lines = [line for line in map(_row_text, tables.pop()) if line]
+            stats.tables += 1
+            if tables:
+                # A nested table belongs to the enclosing cell
+                tables[-1][-1][-1].extend(lines)
+            else:
+                yield from lines
+        else:
+            continue
+        elem.clear()
+        if body is not None and not tables:
+            # Top-level block done; drop it so the tree never grows
+            try:
+                body.remove(elem)
+            except ValueError:  # nested in a paragraph or content control
+                pass
+
+
+def _row_text(cells):
+    cells = [cell for cell in cells if cell]
+    if len(cells) == 2 and len(cells[0]) <= MAX_LABEL_CHARS:
+        label, value = cells
+        if label.endswith((":", "-")):
+            return f"{label} {value}"
+        return f"{label}: {value}"
+    return "\t".join(cells)
@@ -0,0 +1,354 @@
+"""Persistent store of processed employees for duplicate detection.
+
+Every onboarded record is kept in a SQLite table with indexes on the
+normalized email, the Employee ID and name + start date, so checking a
+new record costs three index lookups however many employees are stored.
+Records are added one at a time after an ERP integration, or in bulk for
+batch runs and historical imports:
+
+    python -m aria.employees --db employees.db import results.jsonl hr_export.csv
+"""
+import argparse
+import contextlib
+import csv
+import json
+import os
+import re
+import sqlite3
+import sys
+import threading
+import time
+
+from aria.dates import parse_date
+from aria.extraction import NOT_FOUND
+
+EMPLOYEE_DB_ENV = "ARIA_EMPLOYEE_DB"
+DEFAULT_DB_PATH = os.path.join(os.path.expanduser("~"), ".aria", "employees.db")
+BULK_COMMIT_EVERY = 1000
+MAX_MATCHES = 20
+
+# Strongest reason first: a shared email or Employee ID is the same person
+MATCH_EMAIL = "Email"
+MATCH_EMPLOYEE_ID = "Employee ID"
+MATCH_NAME_START = "Name + Start Date"
+MATCH_ORDER = [MATCH_EMPLOYEE_ID, MATCH_EMAIL, MATCH_NAME_START]
+
+SCHEMA = [
+    "CREATE TABLE IF NOT EXISTS employees ("
+    " id INTEGER PRIMARY KEY,"
+    " employee_id TEXT,"
+    " employee_key TEXT,"
+    " name TEXT,"
+    " name_key TEXT,"
+    " email TEXT,"
+    " email_key TEXT,"
+    " start_date TEXT,"
+    " erp_id TEXT,"
+    " system TEXT,"
+    " source TEXT,"
+    " created REAL NOT NULL,"
+    " fields TEXT NOT NULL)",
+    "CREATE INDEX IF NOT EXISTS employees_email ON employees (email_key)",
+    "CREATE INDEX IF NOT EXISTS employees_employee_id ON employees (employee_key)",
+    "CREATE INDEX IF NOT EXISTS employees_name_start ON employees (name_key, start_date)",
+]
+
+INSERT = (
+    "INSERT INTO employees (employee_id, employee_key, name, name_key, email, email_key,"
+    " start_date, erp_id, system, source, created, fields)"
+    " VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)"
+)
+
+# One index lookup per branch; a NULL key matches nothing
+FIND = (
+    "SELECT id, employee_id, name, email, start_date, erp_id, source, created, ? FROM employees"
+    " WHERE employee_key = ?"
+    " UNION ALL"
+    " SELECT id, employee_id, name, email, start_date, erp_id, source, created, ? FROM employees"
+    " WHERE email_key = ?"
+    " UNION ALL"
+    " SELECT id, employee_id, name, email, start_date, erp_id, source, created, ? FROM employees"
+    " WHERE name_key = ? AND start_date = ?"
+    " LIMIT ?"
+)
+
+_NON_WORD = re.compile(r"[^\w\s]")
+
+
+def _value(fields, field):
+    value = fields.get(field)
+    if not value or value == NOT_FOUND or "Not Found" in value:
+        return None
+    value = value.strip()
+    return value or None
+
+
+def normalize_email(value):
+    return value.strip().casefold() if value else None
+
+
+def normalize_employee_id(value):
+    return "".join(value.split()).upper() if value else None
+
+
+def normalize_name(value):
+    if not value:
+        return None
+    return " ".join(_NON_WORD.sub(" ", value).casefold().split()) or None
+
+
+def normalize_start_date(value):
+    """ISO date when the string parses, else the trimmed string"""
+    if not value:
+        return None
+    parsed = parse_date(value)
+    return parsed.date.isoformat() if parsed else " ".join(value.split())
+
+
+def lookup_keys(fields):
+    """(employee_key, email_key, name_key, start_date) for a field dict"""
+    return (
+        normalize_employee_id(_value(fields, "Employee ID")),
+        normalize_email(_value(fields, "Email")),
+        normalize_name(_value(fields, "Name")),
+        normalize_start_date(_value(fields, "Start Date")),
+    )
+
+
+class DuplicateMatch:
+    """A stored employee that a new record collides with"""
+
+    __slots__ = ("reasons", "employee_id", "name", "email", "start_date", "erp_id", "source", "created")
+
+    def __init__(self, reasons, employee_id, name, email, start_date, erp_id, source, created):
+        self.reasons = reasons
+        self.employee_id = employee_id
+        self.name = name
+        self.email = email
+        self.start_date = start_date
+        self.erp_id = erp_id
+        self.source = source
+        self.created = created
+
+    @property
+    def strong(self):
+        """True when the email or Employee ID is shared, not just name and date"""
+        return self.reasons[0] != MATCH_NAME_START
+
+    @property
+    def label(self):
+        identifier = self.erp_id or self.employee_id
+        who = f"{self.name} ({identifier})" if identifier else self.name or "an existing employee"
+        processed = time.strftime("%Y-%m-%d", time.localtime(self.created))
+        return f"{who}, processed {processed}"
+
+    def __repr__(self):
+        return f"DuplicateMatch({self.reasons!r}, {self.employee_id!r}, {self.name!r})"
+
+
+class EmployeeStore:
+    """SQLite-backed store of processed employee records"""
+
+    def __init__(self, db_path):
+        self.db_path = db_path
+        if db_path != ":memory:":
+            os.makedirs(os.path.dirname(os.path.abspath(db_path)), exist_ok=True)
+        self._lock = threading.RLock()
+        self._db = sqlite3.connect(db_path, check_same_thread=False, isolation_level=None)
+        self._db.execute("PRAGMA journal_mode=WAL")
+        self._db.execute("PRAGMA synchronous=NORMAL")
+        for statement in SCHEMA:
+            self._db.execute(statement)
+        self._in_bulk = False
+        self._commit_every = None
+        self._uncommitted = 0
+
+    @classmethod
+    def from_env(cls):
+        """Store at $ARIA_EMPLOYEE_DB, or ~/.aria/employees.db"""
+        return cls(os.environ.get(EMPLOYEE_DB_ENV) or DEFAULT_DB_PATH)
+
+    def __len__(self):
+        with self._lock:
+            return self._db.execute("SELECT COUNT(*) FROM employees").fetchone()[0]
+
+    def find_duplicates(self, fields):
+        """Stored employees sharing this record's Employee ID, email or name + start date.
+
+        Returns DuplicateMatch objects, strongest match first.
+        """
+        employee_key, email_key, name_key, start_date = lookup_keys(fields)
+        if not (employee_key or email_key or (name_key and start_date)):
+            return []
+        with self._lock:
+            rows = self._db.execute(FIND, (
+                MATCH_EMPLOYEE_ID, employee_key,
+                MATCH_EMAIL, email_key,
+                MATCH_NAME_START, name_key, start_date,
+                MAX_MATCHES,
+            )).fetchall()
+        matches = {}
+        for row_id, employee_id, name, email, stored_start, erp_id, source, created, reason in rows:
+            match = matches.get(row_id)
+            if match is None:
+                matches[row_id] = DuplicateMatch(
+                    [reason], employee_id, name, email, stored_start, erp_id, source, created
+                )
+            else:
+                match.reasons.append(reason)
+        for match in matches.values():
+            match.reasons.sort(key=MATCH_ORDER.index)
+        return sorted(matches.values(), key=lambda match: (MATCH_ORDER.index(match.reasons[0]), -match.created))
+
+    def add(self, fields, erp_id=None, system=None, source=None):
+        """Store one processed record"""
+        with self._lock:
+            self._db.execute(INSERT, self._row(fields, erp_id, system, source, time.time()))
+            self._count_uncommitted(1)
+
+    def add_many(self, records, source=None):
+        """Bulk insert field dicts (or (fields, erp_id, system, source) tuples).
+
+        Runs in one transaction unless called inside bulk(), which commits
+        on its own schedule.  Returns the number of records stored.
+        """
+        now = time.time()
+        count = 0
+
+        def rows():
+            nonlocal count
+            for record in records:
+                count += 1
+                if isinstance(record, dict):
+                    yield self._row(record, None, None, source, now)
+                else:
+                    fields, erp_id, system, record_source = record
+                    yield self._row(fields, erp_id, system, record_source, now)
+
+        with self._lock:
+            if self._in_bulk:
+                self._db.executemany(INSERT, rows())
+                self._count_uncommitted(count)
+            else:
+                with self._transaction():
+                    self._db.executemany(INSERT, rows())
+        return count
+
+    @contextlib.contextmanager
+    def bulk(self, commit_every=BULK_COMMIT_EVERY):
+        """Batch add() calls into transactions of commit_every records.
+
+        Records added inside the block are visible to find_duplicates()
+        straight away, so a batch is also checked against itself.  With
+        commit_every=None records are only committed by commit() and at
+        the end of the block, e.g. to keep the store in step with a
+        batch journal (aria.journal).
+        """
+        with self._lock:
+            self._db.execute("BEGIN")
+            self._in_bulk = True
+            self._commit_every = commit_every
+            self._uncommitted = 0
+            try:
+                yield self
+            except BaseException:
+                self._db.execute("ROLLBACK")
+                raise
+            else:
+                self._db.execute("COMMIT")
+            finally:
+                self._in_bulk = False
+                self._commit_every = None
+
+    def commit(self):
+        """Commit the records bulk() has added so far"""
+        with self._lock:
+            if self._in_bulk:
+                self._db.execute("COMMIT")
+                self._db.execute("BEGIN")
+                self._uncommitted = 0
+
+    def close(self):
+        with self._lock:
+            if self._db is not None:
+                self._db.close()
+                self._db = None
+
+    @contextlib.contextmanager
+    def _transaction(self):
+        self._db.execute("BEGIN")
+        try:
+            yield
+        except BaseException:
+            self._db.execute("ROLLBACK")
+            raise
+        self._db.execute("COMMIT")
+
+    def _count_uncommitted(self, count):
+        if self._commit_every is None:
+            return
+        self._uncommitted += count
+        if self._uncommitted >= self._commit_every:
+            self._db.execute("COMMIT")
+            self._db.execute("BEGIN")
+            self._uncommitted = 0
+
+    @staticmethod
+    def _row(fields, erp_id, system, source, created):
+        employee_key, email_key, name_key, start_date = lookup_keys(fields)
+        stored = {field: value for field, value in fields.items() if _value(fields, field)}
+        return (
+            _value(fields, "Employee ID"), employee_key,
+            _value(fields, "Name"), name_key,
+            _value(fields, "Email"), email_key,
+            start_date, erp_id, system, source, created,
+            json.dumps(stored, ensure_ascii=False),
+        )
+
+
+def _iter_import_records(path):
+    """Field dicts from aria.pipeline JSON Lines output or a CSV with field-name headers"""
+    with open(path, encoding="utf-8", newline="") as source:
+        if path.lower().endswith(".csv"):
+            for row in csv.DictReader(source):
+                yield {field: value for field, value in row.items() if field and value}
+            return
+        for line in source:
+            if not line.strip():
+                continue
+            record = json.loads(line)
+            fields = record.get("fields", record)
+            if isinstance(fields, dict):
+                yield fields
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(
+        prog="python -m aria.employees",
+        description="Manage the processed-employee store used for duplicate detection."
+    )
+    parser.add_argument("--db", help=f"SQLite file (default: ${EMPLOYEE_DB_ENV} or {DEFAULT_DB_PATH})")
+    commands = parser.add_subparsers(dest="command", required=True)
+    importer = commands.add_parser("import", help="bulk-load pipeline JSON Lines or CSV exports")
+    importer.add_argument("files", nargs="+")
+    commands.add_parser("count", help="print the number of stored employees")
+    args = parser.parse_args(argv)
+
+    store = EmployeeStore(args.db) if args.db else EmployeeStore.from_env()
+    try:
+        if args.command == "count":
+            print(len(store))
+            return 0
+        started = time.perf_counter()
+        total = 0
+        for path in args.files:
+            total += store.add_many(_iter_import_records(path), source=os.path.basename(path))
+        elapsed = time.perf_counter() - started
+        print(f"Imported {total} employees in {elapsed:.2f}s; {len(store)} stored", file=sys.stderr)
+        return 0
+    finally:
+        store.close()
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,458 @@
+"""Asyncio ERP integration client.
+
+Submits employee records to Oracle HCM, SAP SuccessFactors or Workday shaped
+REST APIs over a pool of keep-alive HTTP/1.1 connections.  Concurrency is
+bounded, transient failures (connection errors before the request is sent,
+429, 5xx) are retried with exponential backoff, and systems with a bulk-create endpoint receive records
+in batches.
+
+Only the standard library is used, so the client also runs inside the
+Streamlit process and the batch pipeline without extra dependencies.
+
+    client = ErpClient("http://localhost:8765", "oracle", max_connections=16)
+    results = asyncio.run(client.submit_many(payloads))
+"""
+import asyncio
+import json
+import os
+import random
+import ssl
+import uuid
+from collections import deque
+from urllib.parse import urlsplit
+
+ERP_URL_ENV = "ARIA_ERP_URL"
+ERP_SYSTEM_ENV = "ARIA_ERP_SYSTEM"
+ERP_TOKEN_ENV = "ARIA_ERP_TOKEN"
+
+RETRY_STATUSES = {429, 500, 502, 503, 504}
+TRANSIENT_ERRORS = (OSError, ConnectionError, asyncio.IncompleteReadError, asyncio.TimeoutError)
+
+
+class ErpError(Exception):
+    """An ERP request failed for good (after retries, or with a non-retryable status)"""
+
+    def __init__(self, message, status=None, body=None):
+        super().__init__(message)
+        self.status = status
+        self.body = body
+
+
+class ResponseLost(Exception):
+    """The request was sent but no response arrived; resending could duplicate records"""
+
+
+class HttpResponse:
+    __slots__ = ("status", "headers", "body")
+
+    def __init__(self, status, headers, body):
+        self.status = status
+        self.headers = headers
+        self.body = body
+
+    def json(self):
+        return json.loads(self.body) if self.body else None
+
+
+class _Connection:
+    __slots__ = ("reader", "writer", "sent")
+
+    def __init__(self, reader, writer):
+        self.reader = reader
+        self.writer = writer
+        self.sent = False
+
+    def close(self):
+        self.writer.close()
+
+
+class HttpConnectionPool:
+    """Minimal HTTP/1.1 client with a bounded pool of keep-alive connections"""
+
+    def __init__(self, base_url, max_connections=10, timeout=30.0, headers=None):
+        parts = urlsplit(base_url)
+        if parts.scheme not in ("http", "https"):
+            raise ValueError(f"Unsupported ERP URL scheme: {base_url!r}")
+        self.host = parts.hostname
+        self.port = parts.port or (443 if parts.scheme == "https" else 80)
+        self.base_path = parts.path.rstrip("/")
+        self.ssl_context = ssl.create_default_context() if parts.scheme == "https" else None
+        self.timeout = timeout
+        self.default_headers = {"Host": f"{self.host}:{self.port}", "Accept": "application/json"}
+        self.default_headers.update(headers or {})
+        self._slots = asyncio.Semaphore(max_connections)
+        self._idle = deque()
+        self.opened = 0
+
+    async def request(self, method, path, body=None, headers=None):
+        """Send one request and return an HttpResponse
+
+        Failures before the request is written propagate as connection errors
+        and are safe to retry; failures after it raise ResponseLost.
+        """
+        async with self._slots:
+            conn = await self._acquire()
+            try:
+                response, reusable = await asyncio.wait_for(
+                    self._exchange(conn, method, path, body, headers), self.timeout
+                )
+            except TRANSIENT_ERRORS as e:
+                conn.close()
+                if conn.sent:
+                    raise ResponseLost(f"no response to {method} {path}: {e!r}") from e
+                raise
+            except BaseException:
+                conn.close()
+                raise
+            if reusable:
+                self._idle.append(conn)
+            else:
+                conn.close()
+            return response
+
+    async def close(self):
+        while self._idle:
+            conn = self._idle.pop()
+            conn.close()
+            try:
+                await conn.writer.wait_closed()
+            except OSError:
+                pass
+
+    async def _acquire(self):
+        while self._idle:
+            conn = self._idle.pop()
+            # The server may have dropped an idle keep-alive connection
+            if not conn.reader.at_eof() and not conn.writer.is_closing():
+                conn.sent = False
+                return conn
+            conn.close()
+        return await self._open()
+
+    async def _open(self):
+        reader, writer = await asyncio.wait_for(
+            asyncio.open_connection(
+                self.host, self.port, ssl=self.ssl_context,
+                server_hostname=self.host if self.ssl_context else None
+            ),
+            self.timeout
+        )
+        self.opened += 1
+        return _Connection(reader, writer)
+
+    async def _exchange(self, conn, method, path, body, headers):
+        request_headers = dict(self.default_headers)
+        request_headers.update(headers or {})
+        if body is not None:
+            request_headers["Content-Length"] = str(len(body))
+        head = f"{method} {self.base_path}{path} HTTP/1.1\r\n"
+        head += "".join(f"{name}: {value}\r\n" for name, value in request_headers.items())
+        conn.sent = True
+        conn.writer.write(head.encode("latin-1") + b"\r\n" + (body or b""))
+        await conn.writer.drain()
+
+        status_line = await conn.reader.readline()
+        if not status_line:
+            raise ConnectionError("ERP closed the connection")
+        version, status = status_line.decode("latin-1").split(" ", 2)[:2]
+        response_headers = {}
+        while True:
+            line = await conn.reader.readline()
+            if line in (b"\r\n", b"\n", b""):
+                break
+            name, _, value = line.decode("latin-1").partition(":")
+            response_headers[name.strip().lower()] = value.strip()
+
+        if response_headers.get("transfer-encoding", "").lower() == "chunked":
+            response_body = await self._read_chunked(conn.reader)
+        elif "content-length" in response_headers:
+            response_body = await conn.reader.readexactly(int(response_headers["content-length"]))
+        else:
+            # No framing: the body runs until the server closes the connection
+            response_body = await conn.reader.read()
+            return HttpResponse(int(status), response_headers, response_body), False
+
+        connection = response_headers.get("connection", "").lower()
+        reusable = connection != "close" and (version != "HTTP/1.0" or connection == "keep-alive")
+        return HttpResponse(int(status), response_headers, response_body), reusable
+
+    @staticmethod
+    async def _read_chunked(reader):
+        chunks = []
+        while True:
+            size = int((await reader.readline()).split(b";", 1)[0].strip(), 16)
+            if size == 0:
+                # Skip trailers
+                while (await reader.readline()) not in (b"\r\n", b"\n", b""):
+                    pass
+                return b"".join(chunks)
+            chunks.append(await reader.readexactly(size))
+            await reader.readexactly(2)
+
+
+class OracleHcmAdapter:
+    """Oracle HCM Cloud REST: /workers, with the ADF batch endpoint for bulk"""
+
+    system = "Oracle HCM Cloud"
+    api = "/hcmRestApi/resources/11.13.18.05"
+
+    def single(self, payload):
+        return "POST", f"{self.api}/workers", self.to_worker(payload), "application/json"
+
+    def bulk(self, payloads):
+        parts = [
+            {"id": f"part{i}", "path": "/workers", "operation": "create", "payload": self.to_worker(p)}
+            for i, p in enumerate(payloads)
+        ]
+        return "POST", self.api, {"parts": parts}, "application/vnd.oracle.adf.batch+json"
+
+    def to_worker(self, payload):
+        worker = {
+            "names": [{"DisplayName": payload.get("displayName")}],
+            "emails": [{"EmailAddress": payload.get("workEmail"), "EmailType": "W1"}],
+            "workRelationships": [{
+                "StartDate": payload.get("hireDate"),
+                "assignments": [{
+                    "DepartmentName": payload.get("departmentName"),
+                    "JobName": payload.get("jobTitle"),
+                    "ManagerName": payload.get("managerName"),
+                    "Salary": payload.get("annualSalary"),
+                }],
+            }],
+        }
+        if payload.get("personNumber"):
+            worker["PersonNumber"] = payload["personNumber"]
+        return worker
+
+    def single_id(self, body):
+        return body.get("PersonNumber")
+
+    def bulk_results(self, body):
+        return [_item_result(part.get("payload", {}).get("PersonNumber"), part) for part in body.get("parts", [])]
+
+
+class SuccessFactorsAdapter:
+    """SAP SuccessFactors OData v2: PerPerson, with /upsert for bulk"""
+
+    system = "SAP SuccessFactors"
+
+    def single(self, payload):
+        return "POST", "/odata/v2/PerPerson", self.to_entity(payload), "application/json"
+
+    def bulk(self, payloads):
+        return "POST", "/odata/v2/upsert", [self.to_entity(p) for p in payloads], "application/json"
+
+    def to_entity(self, payload):
+        return {
+            "__metadata": {"uri": "PerPerson"},
+            "personIdExternal": payload.get("personNumber") or "",
+            "displayName": payload.get("displayName"),
+            "email": payload.get("workEmail"),
+            "department": payload.get("departmentName"),
+            "jobTitle": payload.get("jobTitle"),
+            "startDate": payload.get("hireDate"),
+            "manager": payload.get("managerName"),
+            "annualSalary": payload.get("annualSalary"),
+        }
+
+    def single_id(self, body):
+        return body.get("d", {}).get("personIdExternal")
+
+    def bulk_results(self, body):
+        results = []
+        for item in body.get("d", []):
+            key = item.get("key") or ""
+            employee_id = key.split("'")[1] if "'" in key else None
+            results.append(_item_result(employee_id, item, ok=item.get("status") == "OK"))
+        return results
+
+
+class WorkdayAdapter:
+    """Workday staffing REST: one worker per request, no bulk endpoint"""
+
+    system = "Workday HCM"
+
+    def __init__(self, tenant="aria"):
+        self.tenant = tenant
+
+    def single(self, payload):
+        body = {
+            "descriptor": payload.get("displayName"),
+            "primaryWorkEmail": payload.get("workEmail"),
+            "supervisoryOrganization": {"descriptor": payload.get("departmentName")},
+            "businessTitle": payload.get("jobTitle"),
+            "hireDate": payload.get("hireDate"),
+            "manager": {"descriptor": payload.get("managerName")},
+            "employeeID": payload.get("personNumber"),
+        }
+        return "POST", f"/ccx/api/staffing/v6/{self.tenant}/workers", body, "application/json"
+
+    bulk = None
+
+    def single_id(self, body):
+        return body.get("employeeID") or body.get("id")
+
+
+def _item_result(employee_id, item, ok=None):
+    if ok is None:
+        ok = employee_id is not None
+    return {
+        "employee_id": employee_id,
+        "status": "SUCCESS" if ok else "FAILED",
+        "error": None if ok else (item.get("message") or json.dumps(item)[:200]),
+    }
+
+
+ADAPTERS = {
+    "oracle": OracleHcmAdapter,
+    "successfactors": SuccessFactorsAdapter,
+    "workday": WorkdayAdapter,
+}
+
+# Display names used by aria.erp
+SYSTEM_KEYS = {adapter.system: key for key, adapter in ADAPTERS.items()}
+
+
+class ErpClient:
+    """Concurrent employee submission to one ERP system.
+
+    max_connections bounds both open sockets and in-flight requests;
+    batch_size is the number of records per bulk request where the
+    system supports it.
+    """
+
+    def __init__(self, base_url, system="oracle", max_connections=10, batch_size=50,
+                 retries=3, backoff=0.2, max_backoff=5.0, timeout=30.0, token=None):
+        key = SYSTEM_KEYS.get(system, system)
+        if key not in ADAPTERS:
+            raise ValueError(f"Unknown ERP system {system!r}, expected one of: {', '.join(ADAPTERS)}")
+        self.adapter = ADAPTERS[key]()
+        self.base_url = base_url
+        self.max_connections = max_connections
+        self.batch_size = max(1, batch_size)
+        self.retries = retries
+        self.backoff = backoff
+        self.max_backoff = max_backoff
+        self.timeout = timeout
+        self.headers = {"Authorization": f"Bearer {token}"} if token else {}
+        self._pool = None
+        self.stats = {"requests": 0, "retries": 0, "records": 0, "failed": 0}
+
+    @classmethod
+    def from_env(cls, system=None, **options):
+        """Client for $ARIA_ERP_URL, or None when no ERP endpoint is configured"""
+        base_url = os.environ.get(ERP_URL_ENV)
+        if not base_url:
+            return None
+        system = system or os.environ.get(ERP_SYSTEM_ENV, "oracle")
+        return cls(base_url, system, token=os.environ.get(ERP_TOKEN_ENV), **options)
+
+    @property
+    def system(self):
+        return self.adapter.system
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, *exc_info):
+        await self.close()
+
+    async def close(self):
+        if self._pool is not None:
+            await self._pool.close()
+            self._pool = None
+
+    async def create_employee(self, payload):
+        """Create one employee; returns {"employee_id", "status", "error"}"""
+        method, path, body, content_type = self.adapter.single(payload)
+        try:
+            response = await self._send(method, path, body, content_type)
+            data = self._json(response)
+        except ErpError as e:
+            self.stats["failed"] += 1
+            return {"employee_id": None, "status": "FAILED", "error": str(e)}
+        self.stats["records"] += 1
+        return {"employee_id": self.adapter.single_id(data), "status": "SUCCESS", "error": None}
+
+    async def submit_many(self, payloads):
+        """Create many employees concurrently; results come back in input order"""
+        payloads = list(payloads)
+        if self.adapter.bulk is None or self.batch_size == 1:
+            return list(await asyncio.gather(*(self.create_employee(p) for p in payloads)))
+
+        batches = [payloads[i:i + self.batch_size] for i in range(0, len(payloads), self.batch_size)]
+        results = await asyncio.gather(*(self._submit_batch(batch) for batch in batches))
+        return [item for batch in results for item in batch]
+
+    async def _submit_batch(self, batch):
+        method, path, body, content_type = self.adapter.bulk(batch)
+        try:
+            response = await self._send(method, path, body, content_type)
+            data = self._json(response)
+        except ErpError as e:
+            self.stats["failed"] += len(batch)
+            return [{"employee_id": None, "status": "FAILED", "error": str(e)} for _ in batch]
+
+        results = self.adapter.bulk_results(data)
+        if len(results) != len(batch):
+            # Results cannot be matched to records; fail this batch, not the whole submission
+            error = f"{self.system} bulk response has {len(results)} results for {len(batch)} records"
+            self.stats["failed"] += len(batch)
+            return [{"employee_id": None, "status": "FAILED", "error": error} for _ in batch]
+        for result in results:
+            self.stats["records" if result["status"] == "SUCCESS" else "failed"] += 1
+        return results
+
+    async def _send(self, method, path, body, content_type):
+        if self._pool is None:
+            self._pool = HttpConnectionPool(
+                self.base_url, self.max_connections, self.timeout, self.headers
+            )
+        data = json.dumps(body).encode("utf-8")
+        headers = {"Content-Type": content_type, "X-Request-ID": uuid.uuid4().hex}
+
+        for attempt in range(self.retries + 1):
+            self.stats["requests"] += 1
+            retry_after = None
+            try:
+                response = await self._pool.request(method, path, data, headers)
+            except ResponseLost as e:
+                # The ERP may have applied it; retrying a create could duplicate records
+                raise ErpError(f"{self.system} outcome unknown: {e}") from e
+            except TRANSIENT_ERRORS as e:
+                if attempt == self.retries:
+                    raise ErpError(f"{self.system} unreachable: {e!r}") from e
+            else:
+                if 200 <= response.status < 300:
+                    return response
+                if response.status not in RETRY_STATUSES or attempt == self.retries:
+                    raise ErpError(
+                        f"{self.system} returned HTTP {response.status}", response.status, response.body
+                    )
+                retry_after = response.headers.get("retry-after")
+
+            self.stats["retries"] += 1
+            await asyncio.sleep(self._delay(attempt, retry_after))
+
+    def _json(self, response):
+        try:
+            data = response.json()
+        except ValueError as e:
+            raise ErpError(f"{self.system} returned invalid JSON", response.status, response.body) from e
+        if data is None:
+            return {}
+        if not isinstance(data, dict):
+            raise ErpError(
+                f"{self.system} returned {type(data).__name__} instead of a JSON object",
+                response.status, response.body
+            )
+        return data
+
+    def _delay(self, attempt, retry_after=None):
+        if retry_after:
+            try:
+                return min(float(retry_after), self.max_backoff)
+            except ValueError:
+                pass
+        # Exponential backoff with full jitter
+        return random.uniform(0, min(self.max_backoff, self.backoff * (2 ** attempt)))
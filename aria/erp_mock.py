@@ -0,0 +1,223 @@
+"""Local stand-in for Oracle HCM, SuccessFactors and Workday REST APIs.
+
+Serves the endpoints used by aria.erp_client with configurable latency and
+failure injection, so integration runs and benchmarks need no live ERP:
+
+    python -m aria.erp_mock --port 8765 --latency-ms 40 --jitter-ms 10
+
+Endpoints (all POST, JSON bodies):
+
+    /hcmRestApi/resources/11.13.18.05/workers        Oracle HCM single create
+    /hcmRestApi/resources/11.13.18.05                Oracle HCM batch (parts)
+    /odata/v2/PerPerson                              SuccessFactors single create
+    /odata/v2/upsert                                 SuccessFactors bulk upsert
+    /ccx/api/staffing/v6/<tenant>/workers            Workday single create
+"""
+import argparse
+import asyncio
+import itertools
+import json
+import random
+import re
+import sys
+
+ORACLE_API = "/hcmRestApi/resources/11.13.18.05"
+WORKDAY_WORKERS = re.compile(r"^/ccx/api/staffing/v6/[^/]+/workers$")
+
+REASONS = {200: "OK", 201: "Created", 400: "Bad Request", 404: "Not Found",
+           405: "Method Not Allowed", 429: "Too Many Requests", 503: "Service Unavailable"}
+
+
+class MockErpServer:
+    """asyncio HTTP/1.1 server emulating the three ERP APIs.
+
+    latency_ms/jitter_ms delay every response; item_latency_ms is added per
+    record in a bulk request.  failure_rate answers that share of requests
+    with 503 (or 429 with throttle=True) to exercise client retries.
+    """
+
+    def __init__(self, host="127.0.0.1", port=0, latency_ms=0.0, jitter_ms=0.0,
+                 item_latency_ms=0.0, failure_rate=0.0, throttle=False, seed=None):
+        self.host = host
+        self.port = port
+        self.latency_ms = latency_ms
+        self.jitter_ms = jitter_ms
+        self.item_latency_ms = item_latency_ms
+        self.failure_rate = failure_rate
+        self.throttle = throttle
+        self.random = random.Random(seed)
+        self._ids = itertools.count(100001)
+        self._server = None
+        self.stats = {"connections": 0, "requests": 0, "records": 0, "failures": 0}
+
+    @property
+    def url(self):
+        return f"http://{self.host}:{self.port}"
+
+    async def start(self):
+        self._server = await asyncio.start_server(self._handle, self.host, self.port)
+        self.port = self._server.sockets[0].getsockname()[1]
+        return self
+
+    async def stop(self):
+        if self._server is not None:
+            self._server.close()
+            await self._server.wait_closed()
+            self._server = None
+
+    async def __aenter__(self):
+        return await self.start()
+
+    async def __aexit__(self, *exc_info):
+        await self.stop()
+
+    async def serve_forever(self):
+        await self.start()
+        async with self._server:
+            await self._server.serve_forever()
+
+    async def _handle(self, reader, writer):
+        self.stats["connections"] += 1
+        try:
+            while True:
+                request_line = await reader.readline()
+                if not request_line.strip():
+                    break
+                method, path, version = request_line.decode("latin-1").split()
+                headers = {}
+                while True:
+                    line = await reader.readline()
+                    if line in (b"\r\n", b"\n", b""):
+                        break
+                    name, _, value = line.decode("latin-1").partition(":")
+                    headers[name.strip().lower()] = value.strip()
+                body = await reader.readexactly(int(headers.get("content-length", 0)))
+
+                status, payload, records = self._route(method, path.split("?", 1)[0], body)
+                delay = self.latency_ms + self.random.uniform(-self.jitter_ms, self.jitter_ms)
+                delay += self.item_latency_ms * records
+                if delay > 0:
+                    await asyncio.sleep(delay / 1000)
+
+                keep_alive = headers.get("connection", "").lower() != "close" and version == "HTTP/1.1"
+                data = json.dumps(payload).encode("utf-8")
+                extra = "Retry-After: 0\r\n" if status == 429 else ""
+                writer.write(
+                    f"HTTP/1.1 {status} {REASONS.get(status, 'OK')}\r\n"
+                    f"Content-Type: application/json\r\n"
+                    f"Content-Length: {len(data)}\r\n"
+                    f"{extra}"
+                    f"Connection: {'keep-alive' if keep_alive else 'close'}\r\n\r\n".encode("latin-1")
+                    + data
+                )
+                await writer.drain()
+                if not keep_alive:
+                    break
+        except (ConnectionError, asyncio.IncompleteReadError, ValueError):
+            pass
+        finally:
+            writer.close()
+
+    def _route(self, method, path, body):
+        """Return (status, response body, records in request)"""
+        self.stats["requests"] += 1
+        if method != "POST":
+            return 405, {"error": "method not allowed"}, 0
+        if self.failure_rate and self.random.random() < self.failure_rate:
+            self.stats["failures"] += 1
+            if self.throttle:
+                return 429, {"error": "rate limit exceeded"}, 0
+            return 503, {"error": "service unavailable"}, 0
+        try:
+            request = json.loads(body or b"null")
+        except ValueError:
+            return 400, {"error": "invalid JSON"}, 0
+        error = _shape_error(path, request)
+        if error:
+            return 400, {"error": error}, 0
+
+        if path == f"{ORACLE_API}/workers":
+            return 201, self._oracle_worker(request), 1
+        if path == ORACLE_API:
+            parts = [
+                {"id": part.get("id"), "path": part.get("path"), "operation": part.get("operation"),
+                 "payload": self._oracle_worker(part.get("payload") or {})}
+                for part in request.get("parts", [])
+            ]
+            return 200, {"parts": parts}, len(parts)
+        if path == "/odata/v2/PerPerson":
+            return 201, {"d": self._sf_person(request)}, 1
+        if path == "/odata/v2/upsert":
+            results = [
+                {"key": f"PerPerson/personIdExternal='{self._sf_person(entity)['personIdExternal']}'",
+                 "status": "OK", "editStatus": "INSERTED", "message": None, "httpCode": 201}
+                for entity in request
+            ]
+            return 200, {"d": results}, len(results)
+        if WORKDAY_WORKERS.match(path):
+            self.stats["records"] += 1
+            worker_id = request.get("employeeID") or f"WD{next(self._ids)}"
+            return 201, {"id": worker_id, "employeeID": worker_id, "descriptor": request.get("descriptor")}, 1
+        return 404, {"error": f"no route for {path}"}, 0
+
+    def _oracle_worker(self, worker):
+        self.stats["records"] += 1
+        worker = dict(worker)
+        worker.setdefault("PersonNumber", f"OR{next(self._ids)}")
+        return worker
+
+    def _sf_person(self, entity):
+        self.stats["records"] += 1
+        entity = dict(entity)
+        if not entity.get("personIdExternal"):
+            entity["personIdExternal"] = f"SF{next(self._ids)}"
+        return entity
+
+
+def _shape_error(path, request):
+    """Why a request body cannot be routed, or None"""
+    if path == "/odata/v2/upsert":
+        if not isinstance(request, list) or not all(isinstance(entity, dict) for entity in request):
+            return "request body must be a JSON array of objects"
+        return None
+    if not isinstance(request, dict):
+        return "request body must be a JSON object"
+    if path == ORACLE_API:
+        parts = request.get("parts", [])
+        if not isinstance(parts, list) or not all(
+            isinstance(part, dict) and isinstance(part.get("payload") or {}, dict) for part in parts
+        ):
+            return "parts must be a list of objects"
+    return None
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(
+        prog="python -m aria.erp_mock",
+        description="Run a local Oracle HCM / SuccessFactors / Workday stand-in server"
+    )
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=8765)
+    parser.add_argument("--latency-ms", type=float, default=0.0, help="Base response latency")
+    parser.add_argument("--jitter-ms", type=float, default=0.0, help="Random +/- latency")
+    parser.add_argument("--item-latency-ms", type=float, default=0.0,
+                        help="Extra latency per record in bulk requests")
+    parser.add_argument("--failure-rate", type=float, default=0.0,
+                        help="Share of requests answered with 503 (or 429 with --throttle)")
+    parser.add_argument("--throttle", action="store_true", help="Fail with 429 instead of 503")
+    args = parser.parse_args(argv)
+
+    server = MockErpServer(
+        args.host, args.port, args.latency_ms, args.jitter_ms,
+        args.item_latency_ms, args.failure_rate, args.throttle
+    )
+    print(f"Mock ERP listening on http://{args.host}:{args.port}", file=sys.stderr)
+    try:
+        asyncio.run(server.serve_forever())
+    except KeyboardInterrupt:
+        pass
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
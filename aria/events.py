@@ -0,0 +1,50 @@
+"""Narration hooks shared by the pipeline stages.
+
+Every stage takes a ``notify(message, message_type="info")`` callable.  The
+Streamlit app passes its ``agent_message`` so the chat keeps narrating; the
+headless pipeline passes ``silent`` and keeps only the structured results.
+"""
+
+
+def silent(message, message_type="info"):
+    """Notifier that drops every message"""
+
+
+class Transcript:
+    """Notifier that keeps (message, message_type) pairs to replay later.
+
+    Lets a stage run where the chat is out of reach, e.g. in a sandbox
+    child, and still narrate once its results are back.
+    """
+
+    __slots__ = ("messages",)
+
+    def __init__(self):
+        self.messages = []
+
+    def __call__(self, message, message_type="info"):
+        self.messages.append((message, message_type))
+
+
+class StepEvent:
+    """Progress of a multi-step operation, emitted as each step starts and completes"""
+
+    __slots__ = ("index", "total", "label", "state")
+
+    STARTED = "started"
+    COMPLETED = "completed"
+
+    def __init__(self, index, total, label, state):
+        self.index = index
+        self.total = total
+        self.label = label
+        self.state = state
+
+    @property
+    def fraction_done(self):
+        """Share of steps finished once this event has been handled"""
+        done = self.index + 1 if self.state == self.COMPLETED else self.index
+        return done / self.total if self.total else 1.0
+
+    def __repr__(self):
+        return f"StepEvent({self.index + 1}/{self.total} {self.label!r} {self.state})"
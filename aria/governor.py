@@ -0,0 +1,387 @@
+"""Per-document resource budgets for untrusted uploads.
+
+A DocumentBudget caps the bytes, pages, extracted characters, wall-clock
+time and memory one document may use.  Limits are enforced at two levels:
+
+* cooperatively, between pages: govern() wraps the page stream and stops
+  reading once a budget is spent, so the fields found so far are kept and
+  the record is marked "partial";
+* by isolation: run_isolated() parses the document in a forked Sandbox
+  child with its address space capped, and kills it if it overruns the
+  time budget inside a single page (a pathological PDF can spend minutes
+  in one PyMuPDF call).  The record is then "aborted", as it is when the
+  child crashes (record["crashed"] holds its exit code).
+
+Budgets come from the environment (0 disables a limit):
+
+    ARIA_MAX_DOCUMENT_MB=50 ARIA_MAX_PAGES=1000 ARIA_MAX_CHARS=10000000
+    ARIA_MAX_SECONDS=60 ARIA_MAX_MEMORY_MB=1024
+"""
+import multiprocessing
+import multiprocessing.util
+import os
+import signal
+import threading
+import time
+
+from aria.metrics import current_rss
+
+try:
+    import resource
+except ImportError:  # Windows
+    resource = None
+
+PARTIAL = "partial"
+ABORTED = "aborted"
+
+# Environment variable, DocumentBudget attribute, default, unit multiplier
+BUDGET_ENV = [
+    ("ARIA_MAX_DOCUMENT_MB", "max_bytes", 50, 2**20),
+    ("ARIA_MAX_PAGES", "max_pages", 1000, 1),
+    ("ARIA_MAX_CHARS", "max_chars", 10_000_000, 1),
+    ("ARIA_MAX_SECONDS", "max_seconds", 60, 1),
+    ("ARIA_MAX_MEMORY_MB", "max_memory_bytes", 1024, 2**20),
+]
+# An isolated parse is killed this long after its time budget, giving the
+# cooperative check the chance to stop it with a partial result first
+KILL_GRACE_S = 5.0
+# Sandbox children are replaced after this many documents to bound leaks
+MAX_CALLS_PER_CHILD = 500
+_BYTES_LIMITS = ("bytes", "memory")
+
+
+class BudgetExceeded(Exception):
+    """A document used more of a resource than its budget allows"""
+
+    def __init__(self, limit, used, allowed):
+        self.limit = limit
+        self.used = used
+        self.allowed = allowed
+        if used is None and allowed is None:
+            message = f"{limit} budget exceeded"
+        elif used is None:
+            message = f"{limit} budget of {_amount(limit, allowed)} exceeded"
+        else:
+            message = f"{limit} budget exceeded: {_amount(limit, used)} over a limit of {_amount(limit, allowed)}"
+        super().__init__(message)
+
+    def as_dict(self):
+        return {"exceeded": self.limit, "used": self.used, "limit": self.allowed, "message": str(self)}
+
+    @classmethod
+    def from_dict(cls, data):
+        """Inverse of as_dict, e.g. for a record's "budget" entry"""
+        return cls(data["exceeded"], data["used"], data["limit"])
+
+
+def _amount(limit, value):
+    if value is None:
+        return "unlimited"
+    if limit in _BYTES_LIMITS:
+        return f"{value / 2**20:.1f} MB" if value >= 2**20 else f"{value:,} bytes"
+    if limit == "seconds":
+        return f"{value:.1f}s"
+    return f"{value:,}"
+
+
+class DocumentBudget:
+    """Resource limits for one document; None means unlimited"""
+
+    __slots__ = ("max_bytes", "max_pages", "max_chars", "max_seconds", "max_memory_bytes")
+
+    def __init__(self, max_bytes=None, max_pages=None, max_chars=None, max_seconds=None, max_memory_bytes=None):
+        self.max_bytes = max_bytes
+        self.max_pages = max_pages
+        self.max_chars = max_chars
+        self.max_seconds = max_seconds
+        self.max_memory_bytes = max_memory_bytes
+
+    @classmethod
+    def from_env(cls):
+        limits = {}
+        for env, attribute, default, unit in BUDGET_ENV:
+            value = float(os.environ.get(env, default))
+            limits[attribute] = int(value * unit) if value > 0 else None
+        return cls(**limits)
+
+    @classmethod
+    def unlimited(cls):
+        return cls()
+
+    def as_dict(self):
+        return {attribute: getattr(self, attribute) for attribute in self.__slots__}
+
+    def check_size(self, size):
+        """Raise BudgetExceeded before a too-large document is opened"""
+        if self.max_bytes is not None and size > self.max_bytes:
+            raise BudgetExceeded("bytes", size, self.max_bytes)
+
+    def govern(self, chunks):
+        """GovernedChunks over a page stream"""
+        return GovernedChunks(chunks, self)
+
+    def __repr__(self):
+        return f"DocumentBudget({', '.join(f'{k}={v}' for k, v in self.as_dict().items() if v is not None)})"
+
+
+class GovernedChunks:
+    """Pass pages through until a budget is spent, then stop reading.
+
+    exceeded holds the BudgetExceeded that stopped the stream, if any.
+    Time and memory are checked after every page; memory is the growth of
+    this process's resident set since the first page was requested.
+    """
+
+    def __init__(self, chunks, budget):
+        self.budget = budget
+        self.pages = 0
+        self.chars = 0
+        self.exceeded = None
+        self._chunks = chunks
+
+    def __iter__(self):
+        budget = self.budget
+        iterator = iter(self._chunks)
+        started = time.monotonic()
+        rss_start = current_rss() if budget.max_memory_bytes is not None else None
+        try:
+            for chunk in iterator:
+                self.pages += 1
+                if budget.max_pages is not None and self.pages > budget.max_pages:
+                    # The page past the limit is dropped
+                    self.pages -= 1
+                    self.exceeded = BudgetExceeded("pages", self.pages + 1, budget.max_pages)
+                    return
+                self.chars += _chunk_chars(chunk)
+                yield chunk
+                if budget.max_chars is not None and self.chars > budget.max_chars:
+                    self.exceeded = BudgetExceeded("chars", self.chars, budget.max_chars)
+                    return
+                elapsed = time.monotonic() - started
+                if budget.max_seconds is not None and elapsed > budget.max_seconds:
+                    self.exceeded = BudgetExceeded("seconds", round(elapsed, 3), budget.max_seconds)
+                    return
+                if rss_start is not None:
+                    grown = current_rss() - rss_start
+                    if grown > budget.max_memory_bytes:
+                        self.exceeded = BudgetExceeded("memory", grown, budget.max_memory_bytes)
+                        return
+        finally:
+            close = getattr(iterator, "close", None)
+            if close is not None:
+                close()
+
+
+def _chunk_chars(chunk):
+    if isinstance(chunk, str):
+        return len(chunk)
+    # Layout pages are lists of PyMuPDF word tuples (x0, y0, x1, y1, word, ...)
+    return sum(len(word[4]) for word in chunk)
+
+
+def aborted_record(name, exceeded):
+    """Pipeline record for a document that was stopped before yielding any fields"""
+    return {
+        "file": name,
+        "status": ABORTED,
+        "error": str(exceeded),
+        "budget": exceeded.as_dict(),
+        "timings": {"total_s": 0.0},
+        "metrics": {},
+    }
+
+
+def crashed_record(name, exitcode):
+    """Pipeline record for a document whose parser process died"""
+    if exitcode is not None and exitcode < 0:
+        try:
+            cause = f"was killed by {signal.Signals(-exitcode).name}"
+        except ValueError:
+            cause = f"was killed by signal {-exitcode}"
+    else:
+        cause = f"exited with code {exitcode}"
+    return {
+        "file": name,
+        "status": ABORTED,
+        "error": f"parser process {cause}",
+        "crashed": {"exit_code": exitcode},
+        "timings": {"total_s": 0.0},
+        "metrics": {},
+    }
+
+
+def _sandbox_context():
+    methods = multiprocessing.get_all_start_methods()
+    if "fork" not in methods:  # Windows
+        return None
+    if threading.active_count() > 1 and "forkserver" in methods:
+        # Forking a multi-threaded process (e.g. the Streamlit server) copies
+        # locks other threads may hold; children come from a clean server instead
+        context = multiprocessing.get_context("forkserver")
+        # The default preload imports __main__ into the server, i.e. reruns a script
+        context.set_forkserver_preload([__name__])
+        return context
+    return multiprocessing.get_context("fork")
+
+
+def _address_space_limit(extra_bytes):
+    """RLIMIT_AS value allowing extra_bytes beyond what this process has mapped"""
+    try:
+        with open("/proc/self/statm", "rb") as statm:
+            mapped = int(statm.read().split()[0]) * os.sysconf("SC_PAGE_SIZE")
+    except (OSError, ValueError, IndexError):
+        return None
+    return mapped + extra_bytes
+
+
+def _sandbox_child(connection, parent_connection, memory_budget):
+    # Closing the inherited parent end lets recv() see EOF when the parent closes it
+    parent_connection.close()
+    # A parent running an asyncio loop has SIGTERM routed to a no-op handler
+    # and a wakeup fd; the child must die on terminate() and leave Ctrl-C to
+    # the parent, which closes the connection
+    signal.set_wakeup_fd(-1)
+    signal.signal(signal.SIGTERM, signal.SIG_DFL)
+    signal.signal(signal.SIGINT, signal.SIG_IGN)
+    memory_limit = None if memory_budget is None else _address_space_limit(memory_budget)
+    if memory_limit is not None and resource is not None:
+        resource.setrlimit(resource.RLIMIT_AS, (memory_limit, memory_limit))
+    while True:
+        try:
+            function, args = connection.recv()
+        except EOFError:
+            return
+        try:
+            result = function(*args)
+        except MemoryError:
+            result = MemoryError()
+        except BaseException as e:
+            result = RuntimeError(f"{type(e).__name__}: {e}")
+        try:
+            connection.send(result)
+        except MemoryError:
+            result = MemoryError()
+            connection.send(result)
+        if isinstance(result, MemoryError):
+            # The heap may be too fragmented to trust; the parent starts a new child
+            return
+
+
+class Sandbox:
+    """A child process that runs calls one at a time and can be killed.
+
+    The child is reused from call to call, so parsers it imports and
+    scanners it compiles are kept, and is replaced after it is killed,
+    dies or has served max_calls calls.  It is forked from this process,
+    or started by a forkserver when this process runs other threads.  Its
+    address space is capped at the memory budget beyond what it had mapped
+    when it started.  Not thread-safe: use one per thread (run_isolated
+    hands each concurrent caller its own).
+    """
+
+    def __init__(self, max_calls=MAX_CALLS_PER_CHILD):
+        self.max_calls = max_calls
+        self.started = 0
+        self._context = _sandbox_context()
+        self._child = None
+        self._connection = None
+        self._memory_budget = None
+        self._calls = 0
+
+    def run(self, function, args, budget, name):
+        """function(*args) in the child, or an aborted record for name.
+
+        The child is killed KILL_GRACE_S after budget.max_seconds.  Runs
+        in-process where fork is unavailable.  function must be importable
+        by name when the child comes from a forkserver.
+        """
+        if self._context is None:
+            return function(*args)
+        if self._child is not None and self._memory_budget != budget.max_memory_bytes:
+            self.close()
+        if self._child is None:
+            self._start(budget.max_memory_bytes)
+
+        timeout = None if budget.max_seconds is None else budget.max_seconds + KILL_GRACE_S
+        started = time.monotonic()
+        try:
+            self._connection.send((function, args))
+            if not self._connection.poll(timeout):
+                self._kill()
+                elapsed = round(time.monotonic() - started, 3)
+                return aborted_record(name, BudgetExceeded("seconds", elapsed, budget.max_seconds))
+            result = self._connection.recv()
+        except (EOFError, OSError):
+            # Crashed, exited, or killed from outside (e.g. by the OOM killer)
+            return crashed_record(name, self._kill())
+
+        self._calls += 1
+        if isinstance(result, MemoryError):
+            self._kill()
+            return aborted_record(name, BudgetExceeded("memory", None, budget.max_memory_bytes))
+        if self._calls >= self.max_calls:
+            self.close()
+        if isinstance(result, Exception):
+            return {"file": name, "status": "error", "error": str(result), "timings": {"total_s": 0.0}, "metrics": {}}
+        return result
+
+    def _start(self, memory_budget):
+        self._connection, child_connection = self._context.Pipe()
+        self._child = self._context.Process(
+            target=_sandbox_child, args=(child_connection, self._connection, memory_budget), daemon=True
+        )
+        self._child.start()
+        child_connection.close()
+        self._memory_budget = memory_budget
+        self._calls = 0
+        self.started += 1
+
+    def _kill(self):
+        child = self._child
+        child.kill()
+        child.join()
+        self._connection.close()
+        self._child = self._connection = None
+        return child.exitcode
+
+    def close(self):
+        """Let the child finish and exit"""
+        if self._child is None:
+            return
+        self._connection.close()
+        self._child.join(KILL_GRACE_S)
+        if self._child.exitcode is None:
+            self._child.kill()
+            self._child.join()
+        self._child = self._connection = None
+
+
+_idle_sandboxes = []
+_sandboxes_pid = None
+_sandboxes_lock = threading.Lock()
+
+
+def run_isolated(function, args, budget, name):
+    """Sandbox.run on an idle sandbox of this process.
+
+    Sandboxes are kept for reuse, as many as there have been concurrent
+    callers (one per thread in a threaded server such as Streamlit), and
+    closed when this process exits, including a ProcessPoolExecutor
+    worker, which would otherwise wait on its child.
+    """
+    global _sandboxes_pid
+    with _sandboxes_lock:
+        if _sandboxes_pid != os.getpid():
+            # A forked process must not share its parent's children
+            _idle_sandboxes.clear()
+            _sandboxes_pid = os.getpid()
+        sandbox = _idle_sandboxes.pop() if _idle_sandboxes else None
+    if sandbox is None:
+        sandbox = Sandbox()
+        # Runs before multiprocessing terminates and joins this process's children
+        multiprocessing.util.Finalize(None, sandbox.close, exitpriority=10)
+    try:
+        return sandbox.run(function, args, budget, name)
+    finally:
+        with _sandboxes_lock:
+            _idle_sandboxes.append(sandbox)
@@ -0,0 +1,109 @@
+"""Text extraction for uploaded PDF and Word documents.
+
+Documents are parsed without copying their bytes: files on disk are
+opened by path so PyMuPDF and zipfile read them on demand, and in-memory
+uploads are parsed from the buffer they already live in.  PyMuPDF is
+imported with the first PDF rather than at startup.
+"""
+import os
+
+from aria.docx_text import DocxStats, iter_docx_chunks
+from aria.events import silent
+
+
+def is_pdf(filename):
+    return filename.lower().endswith(".pdf")
+
+
+def document_buffer(file):
+    """The bytes of an in-memory upload, shared rather than copied.
+
+    io.BytesIO (Streamlit's UploadedFile is one) returns the bytes object
+    it was created from; read() after a seek and getbuffer() would both
+    make a private copy of the document.
+    """
+    getvalue = getattr(file, "getvalue", None)
+    if getvalue is not None:
+        return getvalue()
+    return file.read()
+
+
+def preload_parser(filename):
+    """Import the parser for filename now, e.g. once before forking children that parse it"""
+    if is_pdf(filename):
+        import fitz  # noqa: F401
+
+
+def _open_pdf(source):
+    import fitz  # PyMuPDF; slower to import than the rest of aria together
+
+    if isinstance(source, (str, os.PathLike)):
+        return fitz.open(source)
+    return fitz.open(stream=document_buffer(source), filetype="pdf")
+
+
+def iter_pdf_pages(source, notify=silent, layout=False):
+    """Yield the text of each PDF page as it is parsed.
+
+    Pages are only loaded when the consumer asks for them; closing the
+    generator early closes the document without touching the rest.  With
+    layout=True each page is yielded as its word boxes
+    (``page.get_text("words")``) for aria.layout instead.  source is a
+    path or a binary file-like object.
+    """
+    doc = _open_pdf(source)
+    try:
+        pages = len(doc)
+        notify(f"📊 Document analysis: {pages} pages detected. Processing each page...", "analysis")
+
+        words = 0
+        for i in range(pages):
+            if layout:
+                page_content = doc.load_page(i).get_text("words")
+                words += len(page_content)
+            else:
+                page_content = doc.load_page(i).get_text()
+                words += len(page_content.split())
+            if i == 0:  # Analyze first page structure
+                notify(f"🧠 Page 1 analysis: Found {words} words, detecting form structure...", "thinking")
+            yield page_content
+
+        notify(f"✅ PDF processing complete. Extracted {words} total words.", "info")
+    finally:
+        doc.close()
+
+
+def iter_docx_text(source, notify=silent):
+    """Yield the text of a Word document in chunks of whole lines.
+
+    Paragraphs and table rows are streamed in document order by
+    aria.docx_text, so consumers can stop early as with PDF pages.
+    """
+    stats = DocxStats()
+    yield from iter_docx_chunks(source, stats)
+
+    notify(f"📊 Document structure: {stats.paragraphs} paragraphs and {stats.tables} tables identified.", "analysis")
+    notify("✅ Word document processing complete. Content successfully extracted.", "info")
+
+
+def iter_document_text(source, filename, notify=silent, layout=False):
+    """Stream the text of a PDF or DOCX path or file-like object chunk by chunk.
+
+    layout=True streams PDF pages as word boxes; Word documents have no
+    page layout and are always streamed as text.
+    """
+    if is_pdf(filename):
+        notify("🔍 Detected PDF format. Using advanced OCR analysis...", "analysis")
+        return iter_pdf_pages(source, notify, layout)
+
+    notify("📝 Detected Word document. Parsing document structure...", "analysis")
+    return iter_docx_text(source, notify)
+
+
+def extract_text(source, filename, notify=silent):
+    """Extract the raw text of a PDF or DOCX path or file-like object.
+
+    Parsing errors are raised to the caller, which decides whether to show
+    them in the chat or record them in a batch report.
+    """
+    return "".join(iter_document_text(source, filename, notify))
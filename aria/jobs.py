@@ -0,0 +1,193 @@
+"""Background processing of uploaded documents.
+
+``JobQueue`` runs aria.pipeline.process_document for many uploads at once
+in a process pool that lives outside Streamlit's rerun cycle.  Uploads are
+spooled to a temporary directory so workers open them by path; job state
+is kept here and read by each rerun, so a session only needs to remember
+its job ids.  Each document is parsed in a child of its worker that is
+killed when it overruns its budget (see aria.governor), so a hostile
+upload ends as an "aborted" job instead of occupying a worker.  With a
+journal (aria.journal), uploads validated before, e.g. ahead of a server
+restart, finish at once with their journaled record.
+"""
+import copy
+import itertools
+import multiprocessing
+import os
+import shutil
+import tempfile
+import threading
+import time
+from concurrent.futures import ProcessPoolExecutor
+
+from aria.journal import VALIDATED, content_hash
+from aria.pipeline import process_isolated
+
+JOB_WORKERS_ENV = "ARIA_JOB_WORKERS"
+MAX_DEFAULT_WORKERS = 4
+
+QUEUED = "queued"
+RUNNING = "running"
+FINISHED = ("ok", "invalid", "partial", "aborted", "error")
+
+
+class Job:
+    """One uploaded document and, once finished, its pipeline record"""
+
+    __slots__ = ("id", "filename", "size", "layout", "status", "record",
+                 "submitted_at", "finished_at", "future", "path", "key")
+
+    def __init__(self, job_id, filename, size, layout, path, key=None):
+        self.id = job_id
+        self.filename = filename
+        self.size = size
+        self.layout = layout
+        self.status = QUEUED
+        self.record = None
+        self.submitted_at = time.time()
+        self.finished_at = None
+        self.future = None
+        self.path = path
+        self.key = key
+
+    @property
+    def finished(self):
+        return self.status in FINISHED
+
+    def as_dict(self):
+        return {
+            "id": self.id,
+            "filename": self.filename,
+            "size": self.size,
+            "status": self.status,
+            "record": self.record,
+            "submitted_at": self.submitted_at,
+            "finished_at": self.finished_at,
+        }
+
+
+def _run_job(task):
+    """Pool entry point"""
+    path, layout = task
+    return process_isolated(path, layout=layout)
+
+
+def default_workers():
+    configured = os.environ.get(JOB_WORKERS_ENV)
+    if configured:
+        return max(1, int(configured))
+    return max(1, min(MAX_DEFAULT_WORKERS, os.cpu_count() or 1))
+
+
+class JobQueue:
+    """Process pool for uploaded documents, shared by every session.
+
+    on_finish(job) is called from a pool thread for every finished job,
+    e.g. to record its metrics.  With a journal, each finished record is
+    journaled as validated once on_finish has run, and a document the
+    journal has validated before is not processed again.
+    """
+
+    def __init__(self, workers=None, on_finish=None, journal=None):
+        self.workers = workers or default_workers()
+        self.on_finish = on_finish
+        self.journal = journal
+        self._lock = threading.Lock()
+        self._ids = itertools.count(1)
+        self._jobs = {}
+        self._pool = None
+        self._spool_dir = None
+
+    def submit(self, filename, data, layout=False):
+        """Queue a document given its name and bytes; returns the job id"""
+        key = content_hash(data) if self.journal is not None else None
+        state = self.journal.get(key) if key is not None else None
+        if state is not None and state.reached(VALIDATED):
+            record = copy.deepcopy(state.record)
+            record["file"] = filename
+            with self._lock:
+                job_id = next(self._ids)
+                job = self._jobs[job_id] = Job(job_id, filename, len(data), layout, None, key)
+                job.record = record
+                job.status = record["status"]
+                job.finished_at = time.time()
+            return job_id
+
+        with self._lock:
+            if self._pool is None:
+                # Workers are started fresh rather than forked from the
+                # multi-threaded Streamlit server
+                self._pool = ProcessPoolExecutor(
+                    max_workers=self.workers, mp_context=multiprocessing.get_context("spawn")
+                )
+                self._spool_dir = tempfile.mkdtemp(prefix="aria-jobs-")
+            job_id = next(self._ids)
+            path = os.path.join(self._spool_dir, f"{job_id}-{os.path.basename(filename)}")
+            with open(path, "wb") as spooled:
+                spooled.write(data)
+            job = self._jobs[job_id] = Job(job_id, filename, len(data), layout, path, key)
+            job.future = self._pool.submit(_run_job, (path, layout))
+        job.future.add_done_callback(lambda future: self._finish(job, future))
+        return job_id
+
+    def _finish(self, job, future):
+        if future.cancelled():
+            record = {"file": job.filename, "status": "error", "error": "Cancelled"}
+        elif future.exception() is not None:
+            record = {"file": job.filename, "status": "error", "error": str(future.exception())}
+        else:
+            record = future.result()
+            record["file"] = job.filename
+        with self._lock:
+            job.record = record
+            job.status = record["status"]
+            job.finished_at = time.time()
+            job.future = None
+        try:
+            os.remove(job.path)
+        except OSError:
+            pass
+        if self.on_finish is not None:
+            self.on_finish(job)
+        if self.journal is not None and record["status"] != "error":
+            self.journal.record(job.key, VALIDATED, job.filename, record)
+            # Uploads arrive at human pace; write now rather than wait for a full batch
+            self.journal.flush(fsync=False)
+
+    def jobs(self, job_ids):
+        """Snapshots (Job.as_dict()) of the given jobs, in the given order"""
+        snapshots = []
+        with self._lock:
+            for job_id in job_ids:
+                job = self._jobs.get(job_id)
+                if job is None:
+                    continue
+                if job.status == QUEUED and job.future is not None and job.future.running():
+                    job.status = RUNNING
+                snapshots.append(job.as_dict())
+        return snapshots
+
+    def forget(self, job_ids):
+        """Drop finished jobs; running ones are kept until they finish"""
+        with self._lock:
+            for job_id in job_ids:
+                job = self._jobs.get(job_id)
+                if job is not None and job.finished:
+                    del self._jobs[job_id]
+
+    def cancel(self, job_ids):
+        """Cancel jobs that have not started yet"""
+        with self._lock:
+            futures = [self._jobs[job_id].future for job_id in job_ids if job_id in self._jobs]
+        for future in futures:
+            if future is not None:
+                future.cancel()
+
+    def shutdown(self):
+        with self._lock:
+            pool, self._pool = self._pool, None
+            spool_dir, self._spool_dir = self._spool_dir, None
+        if pool is not None:
+            pool.shutdown(wait=True, cancel_futures=True)
+        if spool_dir is not None:
+            shutil.rmtree(spool_dir, ignore_errors=True)
@@ -0,0 +1,256 @@
+"""Append-only journal of per-document progress, for resumable batch runs.
+
+Every line is one JSON entry saying that a document, identified by the
+SHA-256 of its content, reached a stage:
+
+    extracted    fields were read from the document (the pipeline record)
+    validated    the record was checked (validation, org directory, duplicates)
+    stored       the record was added to the local employee store
+    integrated   the employee was created in the ERP (the app; record["erp"]
+                 holds the ERP's answer) and stored
+
+An entry may carry a "record" patch that is merged into the document's
+record, so replaying the journal rebuilds each document's latest record
+and a resumed run skips every stage already done.  Entries are buffered
+and written in batches of ``batch`` lines, and the file is fsync'd at most
+every ``fsync_s`` seconds (0 syncs every write, a negative value only on
+close); a crash loses at most the unsynced tail, whose documents are
+simply redone.  A line torn by a crash is dropped when the journal is
+reopened.
+
+    python -m aria.journal run.journal
+"""
+import argparse
+import hashlib
+import json
+import os
+import sys
+import threading
+import time
+
+JOURNAL_ENV = "ARIA_JOURNAL"
+JOURNAL_BATCH_ENV = "ARIA_JOURNAL_BATCH"
+JOURNAL_FSYNC_ENV = "ARIA_JOURNAL_FSYNC_S"
+
+EXTRACTED = "extracted"
+VALIDATED = "validated"
+STORED = "stored"
+INTEGRATED = "integrated"
+STAGES = (EXTRACTED, VALIDATED, STORED, INTEGRATED)
+_STAGE_ORDER = {stage: i for i, stage in enumerate(STAGES)}
+
+DEFAULT_BATCH = 256
+DEFAULT_FSYNC_S = 1.0
+HASH_CHUNK = 1 << 20
+
+
+def content_hash(source):
+    """SHA-256 hex digest of a document given as bytes or a path"""
+    if isinstance(source, (bytes, bytearray, memoryview)):
+        return hashlib.sha256(source).hexdigest()
+    digest = hashlib.sha256()
+    with open(source, "rb") as handle:
+        for chunk in iter(lambda: handle.read(HASH_CHUNK), b""):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+
+class DocumentState:
+    """The furthest stage a document reached and its record so far"""
+
+    __slots__ = ("key", "file", "stage", "record", "updated")
+
+    def __init__(self, key, file=None):
+        self.key = key
+        self.file = file
+        self.stage = None
+        self.record = {}
+        self.updated = None
+
+    def reached(self, stage):
+        return self.stage is not None and _STAGE_ORDER[self.stage] >= _STAGE_ORDER[stage]
+
+
+class Journal:
+    """Append-only JSON Lines journal, replayed into per-document state on open.
+
+    before_write, if set, is called before buffered entries are written,
+    e.g. to commit the employee store so that it is never behind the
+    "integrated" entries.  read_only=True only replays the journal, leaving
+    the file untouched for a run that may still be appending to it.
+    Thread-safe.
+    """
+
+    def __init__(self, path, batch=DEFAULT_BATCH, fsync_s=DEFAULT_FSYNC_S, read_only=False):
+        self.path = path
+        self.batch = max(1, batch)
+        self.fsync_s = None if fsync_s is None or fsync_s < 0 else fsync_s
+        self.read_only = read_only
+        self.before_write = None
+        self.documents = {}
+        self.stats = {"replayed": 0, "dropped": 0, "entries": 0, "writes": 0, "fsyncs": 0}
+        self._lock = threading.Lock()
+        self._buffer = []
+        self._file = None
+        self._last_sync = time.monotonic()
+        if read_only:
+            self._replay()
+            return
+        os.makedirs(os.path.dirname(os.path.abspath(path)), exist_ok=True)
+        self._replay()
+        self._file = open(path, "ab")
+
+    @classmethod
+    def from_env(cls):
+        """Journal at $ARIA_JOURNAL, or None when it is not set"""
+        path = os.environ.get(JOURNAL_ENV)
+        if not path:
+            return None
+        return cls(
+            path,
+            batch=int(os.environ.get(JOURNAL_BATCH_ENV, DEFAULT_BATCH)),
+            fsync_s=float(os.environ.get(JOURNAL_FSYNC_ENV, DEFAULT_FSYNC_S)),
+        )
+
+    def __len__(self):
+        return len(self.documents)
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
+
+    def _replay(self):
+        try:
+            handle = open(self.path, "rb" if self.read_only else "rb+")
+        except FileNotFoundError:
+            return
+        with handle:
+            good_end = 0
+            for line in handle:
+                if not line.endswith(b"\n"):
+                    # Torn by a crash mid-write; appending after it would corrupt the next entry too
+                    break
+                try:
+                    entry = json.loads(line)
+                except ValueError:
+                    self.stats["dropped"] += 1
+                else:
+                    self._apply(entry)
+                    self.stats["replayed"] += 1
+                good_end += len(line)
+            handle.seek(0, os.SEEK_END)
+            if handle.tell() != good_end:
+                self.stats["dropped"] += 1
+                if not self.read_only:
+                    handle.truncate(good_end)
+
+    def _apply(self, entry):
+        key = entry["key"]
+        state = self.documents.get(key)
+        if state is None:
+            state = self.documents[key] = DocumentState(key, entry.get("file"))
+        if not state.reached(entry["stage"]):
+            state.stage = entry["stage"]
+        if entry.get("record"):
+            state.record.update(entry["record"])
+        state.updated = entry.get("at")
+        return state
+
+    def get(self, key):
+        """DocumentState for a content hash, or None"""
+        return self.documents.get(key)
+
+    def reached(self, key, stage):
+        state = self.documents.get(key)
+        return state is not None and state.reached(stage)
+
+    def record(self, key, stage, file=None, record=None):
+        """Note that a document reached stage; record is merged into its record"""
+        if self.read_only:
+            raise ValueError(f"{self.path} was opened read-only")
+        if stage not in _STAGE_ORDER:
+            raise ValueError(f"Unknown journal stage {stage!r}, expected one of: {', '.join(STAGES)}")
+        entry = {"key": key, "stage": stage, "file": file, "at": round(time.time(), 3)}
+        if record:
+            entry["record"] = record
+        line = (json.dumps(entry, ensure_ascii=False, separators=(",", ":")) + "\n").encode("utf-8")
+        with self._lock:
+            state = self._apply(entry)
+            self._buffer.append(line)
+            self.stats["entries"] += 1
+            sync_due = self.fsync_s is not None and time.monotonic() - self._last_sync >= self.fsync_s
+            if len(self._buffer) >= self.batch:
+                self._write(sync_due)
+            elif sync_due and self.fsync_s > 0:
+                # A slow trickle of entries still reaches the disk every fsync_s
+                self._write(True)
+        return state
+
+    def flush(self, fsync=True):
+        """Write buffered entries now, fsync'ing them unless fsync=False"""
+        with self._lock:
+            self._write(fsync)
+
+    def _write(self, fsync):
+        if self._buffer:
+            if self.before_write is not None:
+                self.before_write()
+            self._file.write(b"".join(self._buffer))
+            self._file.flush()
+            self._buffer.clear()
+            self.stats["writes"] += 1
+        if fsync:
+            os.fsync(self._file.fileno())
+            self._last_sync = time.monotonic()
+            self.stats["fsyncs"] += 1
+
+    def close(self):
+        with self._lock:
+            if self._file is None:
+                return
+            self._write(True)
+            self._file.close()
+            self._file = None
+
+    def summary(self):
+        """Documents per furthest stage"""
+        counts = dict.fromkeys(STAGES, 0)
+        for state in self.documents.values():
+            counts[state.stage] += 1
+        return counts
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(
+        prog="python -m aria.journal",
+        description="Summarize a batch run journal: documents per stage and per status."
+    )
+    parser.add_argument("path", help="journal written by python -m aria.pipeline --journal")
+    parser.add_argument("--list", action="store_true", help="print one line per document")
+    args = parser.parse_args(argv)
+
+    if not os.path.exists(args.path):
+        parser.error(f"no journal at {args.path}")
+    with Journal(args.path, read_only=True) as journal:
+        statuses = {}
+        for state in journal.documents.values():
+            status = state.record.get("status", "-")
+            statuses[status] = statuses.get(status, 0) + 1
+            if args.list:
+                print(f"{state.key[:12]}  {state.stage:<11}{status:<9}{state.file}")
+        print(
+            f"{len(journal)} documents from {journal.stats['replayed']} entries"
+            f" ({journal.stats['dropped']} dropped)",
+            file=sys.stderr
+        )
+        print("  stages: " + ", ".join(f"{count} {stage}" for stage, count in journal.summary().items()),
+              file=sys.stderr)
+        print("  status: " + ", ".join(f"{count} {status}" for status, count in sorted(statuses.items())),
+              file=sys.stderr)
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
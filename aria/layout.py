@@ -0,0 +1,246 @@
+"""Layout-aware field extraction for PDF forms.
+
+Instead of flattening a page with ``page.get_text()`` and guessing label /
+value pairs with regexes, this works on PyMuPDF word boxes
+(``page.get_text("words")``).  Words are grouped into lines, lines that
+start with a known field label become keys, and the value is taken from
+the text adjacent to the label:
+
+* the rest of the same line (``Name: Jane Doe``)
+* the nearest span to the right on the same row (two-column tables)
+* the line directly below the label (stacked form fields)
+
+Only lines that look like form entries count: the label must open the line
+and be followed by a delimiter or stand alone as a cell.  Prose such as
+"your manager will contact you" is never indexed.  Field lookup is then a
+dictionary hit per label synonym; fields the index cannot answer (a bare
+email address, a "$" amount) fall back to the regex extractor over the
+page text.
+"""
+from aria.extraction import DEFAULT_EXTRACTOR, NOT_FOUND, StreamResult
+
+LAYOUT_VERSION = 1
+
+# Label synonyms per field, mirroring the label alternatives of FIELD_PATTERNS
+FIELD_LABELS = {
+    "Name": ["Name", "Full Name", "Employee Name"],
+    "Email": ["Email", "Email Address", "E-mail"],
+    "Department": ["Department", "Dept"],
+    "Role": ["Role", "Position", "Job Title", "Title"],
+    "Start Date": ["Start Date", "Start", "Begin Date", "Commencement Date"],
+    "Salary": ["Salary", "Annual Salary", "Compensation"],
+    "Manager": ["Manager", "Supervisor", "Reports To"],
+    "Employee ID": ["Employee ID", "EMP ID", "ID", "Employee Number"],
+}
+
+# Confidence by how the value was located
+SAME_LINE_CONFIDENCE = 1.0
+ADJACENT_CONFIDENCE = 0.95
+BELOW_CONFIDENCE = 0.9
+
+DELIMITERS = (":", "-", "–")
+MAX_LABEL_WORDS = 3
+
+
+def normalize_label(text):
+    return " ".join(text.lower().rstrip(":-– ").split())
+
+
+class _Line:
+    """Words of one text line with their combined bounding box"""
+
+    __slots__ = ("x0", "y0", "x1", "y1", "words", "order")
+
+    def __init__(self, words, order):
+        self.words = words
+        self.x0 = min(w[0] for w in words)
+        self.y0 = min(w[1] for w in words)
+        self.x1 = max(w[2] for w in words)
+        self.y1 = max(w[3] for w in words)
+        self.order = order
+
+    @property
+    def text(self):
+        return " ".join(w[4] for w in self.words)
+
+
+def group_lines(words):
+    """Group PyMuPDF word tuples into _Lines in reading order"""
+    grouped = {}
+    for word in words:
+        # (x0, y0, x1, y1, text, block_no, line_no, word_no)
+        grouped.setdefault((word[5], word[6]), []).append(word)
+    lines = [sorted(line_words, key=lambda w: w[7]) for _, line_words in sorted(grouped.items())]
+    return [_Line(line_words, order) for order, line_words in enumerate(lines)]
+
+
+def page_text(lines):
+    """Plain text of a page in block order, like page.get_text()"""
+    return "".join(line.text + "\n" for line in lines)
+
+
+class LayoutIndex:
+    """normalized label -> [(value, confidence, (page, line order))] in document order"""
+
+    def __init__(self, label_fields=None):
+        self.label_fields = label_fields or {
+            normalize_label(label): field_name
+            for field_name, labels in FIELD_LABELS.items()
+            for label in labels
+        }
+        self.entries = {}
+        self.pages = 0
+
+    def add_page(self, lines):
+        """Index the label/value pairs of one page's lines"""
+        page = self.pages
+        self.pages += 1
+        labelled = {}
+        for line in lines:
+            split = self._split_label(line)
+            if split is not None:
+                labelled[line.order] = split
+
+        for line in lines:
+            split = labelled.get(line.order)
+            if split is None:
+                continue
+            label, value_words, delimited = split
+            if value_words:
+                if not delimited:
+                    continue  # "Start your first day..." is prose, not a form entry
+                value = " ".join(w[4] for w in value_words)
+                confidence = SAME_LINE_CONFIDENCE
+            else:
+                # A bare label cell: the value sits beside or below it
+                neighbour, confidence = self._adjacent(line, lines, labelled)
+                if neighbour is None:
+                    continue
+                value = neighbour.text
+            value = value.strip()
+            if value:
+                self.entries.setdefault(label, []).append((value, confidence, (page, line.order)))
+
+    def lookup(self, field_name, accept=None):
+        """Earliest indexed value for any of the field's labels, or None"""
+        best = None
+        for label in FIELD_LABELS[field_name]:
+            for value, confidence, position in self.entries.get(normalize_label(label), ()):
+                if accept is not None and not accept(value):
+                    continue
+                if best is None or position < best[2]:
+                    best = (value, confidence, position)
+                break
+        return best
+
+    def _split_label(self, line):
+        """(label, value words, delimited) when the line opens with a field label"""
+        words = line.words
+        for count in range(min(MAX_LABEL_WORDS, len(words)), 0, -1):
+            label = normalize_label(" ".join(w[4] for w in words[:count]))
+            if label not in self.label_fields:
+                continue
+            rest = words[count:]
+            delimited = words[count - 1][4].endswith(DELIMITERS)
+            while rest and rest[0][4] in DELIMITERS:
+                rest = rest[1:]
+                delimited = True
+            return label, rest, delimited
+        return None
+
+    @staticmethod
+    def _adjacent(label_line, lines, labelled):
+        height = label_line.y1 - label_line.y0 or 1.0
+        middle = (label_line.y0 + label_line.y1) / 2
+        right = None
+        below = None
+        for line in lines:
+            if line is label_line:
+                continue
+            split = labelled.get(line.order)
+            if split is not None and split[2]:
+                continue  # "Label:" opens a form entry of its own
+            if line.y0 <= middle <= line.y1 and line.x0 >= label_line.x1:
+                # A value cell may read like a label ("Manager" as a role)
+                if right is None or line.x0 < right.x0:
+                    right = line
+            elif ((split is None or split[1]) and 0 <= line.y0 - label_line.y1 <= 1.5 * height
+                    and line.x0 < label_line.x1 and line.x1 > label_line.x0):
+                if below is None or line.y0 < below.y0:
+                    below = line
+        if right is not None:
+            return right, ADJACENT_CONFIDENCE
+        if below is not None:
+            return below, BELOW_CONFIDENCE
+        return None, 0.0
+
+
+def _is_email(value):
+    return "@" in value
+
+
+# Values a label hit must satisfy to be accepted for a field
+VALUE_CHECKS = {"Email": _is_email}
+
+
+class LayoutExtractor:
+    """Field extraction from PDF word boxes with regex fallback.
+
+    ``extract_stream`` takes per-page word lists (``page.get_text("words")``)
+    and returns the same StreamResult as FieldExtractor, so it can stand in
+    for it in analyze_stream.
+    """
+
+    def __init__(self, fallback=DEFAULT_EXTRACTOR):
+        self.fallback = fallback
+        self.version = f"layout{LAYOUT_VERSION}-{fallback.version}"
+
+    @property
+    def field_names(self):
+        return self.fallback.field_names
+
+    def extract(self, pages, stats=None):
+        return self.extract_stream(pages, stats=stats).result
+
+    def extract_stream(self, pages, stats=None):
+        """Index pages as they arrive; stop once every field has a label hit"""
+        index = LayoutIndex()
+        texts = []
+        hits = {}
+        exhausted = True
+        iterator = iter(pages)
+        try:
+            for words in iterator:
+                lines = group_lines(words)
+                texts.append(page_text(lines))
+                index.add_page(lines)
+                hits = {
+                    name: hit for name in self.field_names
+                    for hit in [index.lookup(name, VALUE_CHECKS.get(name))] if hit is not None
+                }
+                if len(hits) == len(self.field_names):
+                    exhausted = False
+                    break
+        finally:
+            close = getattr(iterator, "close", None)
+            if close is not None:
+                close()
+
+        text = "".join(texts)
+        fields = {}
+        confidence_scores = {}
+        missing = [name for name in self.field_names if name not in hits]
+        if missing:
+            fallback_fields, fallback_scores = self.fallback.extract(text, stats=stats)
+        for name in self.field_names:
+            if name in hits:
+                value, confidence, _ = hits[name]
+                fields[name] = value
+                confidence_scores[name] = confidence
+            else:
+                fields[name] = fallback_fields.get(name, NOT_FOUND)
+                confidence_scores[name] = fallback_scores.get(name, 0)
+        return StreamResult(fields, confidence_scores, text, len(texts), exhausted)
+
+
+DEFAULT_LAYOUT_EXTRACTOR = LayoutExtractor()
@@ -0,0 +1,395 @@
+"""Per-stage latency instrumentation for the ARIA pipeline.
+
+Stages (extract, analyze, validate, erp, ...) report wall time, CPU time,
+pages and bytes into a MetricsStore.  The store keeps running totals plus a
+bounded window of recent samples for percentiles, and can be exported as
+JSON or Prometheus text exposition format.  ``MemoryWatch`` records the
+peak resident memory of the process while a document is parsed, for
+container sizing.  ``profiled`` wraps a block in cProfile and dumps the
+stats for offline inspection.
+"""
+import cProfile
+import json
+import os
+import sys
+import tempfile
+import threading
+import time
+from collections import deque
+
+try:
+    import resource
+except ImportError:  # Windows
+    resource = None
+
+RECENT_SAMPLES = 512
+METRICS_EXPORT_ENV = "ARIA_METRICS_EXPORT"
+MEMORY_SAMPLE_INTERVAL = 0.005
+_PAGE_SIZE = os.sysconf("SC_PAGE_SIZE") if hasattr(os, "sysconf") else 4096
+
+
+class Stopwatch:
+    """Accumulates wall and CPU time over one or more `with` intervals.
+
+    CPU time is the calling thread's, so concurrent Streamlit sessions do
+    not bleed into each other's numbers.
+    """
+
+    __slots__ = ("wall_s", "cpu_s", "_wall_start", "_cpu_start")
+
+    def __init__(self):
+        self.wall_s = 0.0
+        self.cpu_s = 0.0
+        self._wall_start = None
+        self._cpu_start = None
+
+    def __enter__(self):
+        self._wall_start = time.perf_counter()
+        self._cpu_start = time.thread_time()
+        return self
+
+    def __exit__(self, *exc_info):
+        self.wall_s += time.perf_counter() - self._wall_start
+        self.cpu_s += time.thread_time() - self._cpu_start
+        return False
+
+    def as_dict(self, **extra):
+        sample = {"wall_s": round(self.wall_s, 6), "cpu_s": round(self.cpu_s, 6)}
+        sample.update(extra)
+        return sample
+
+
+def current_rss():
+    """Resident set size of this process in bytes, or None if unknown"""
+    try:
+        with open("/proc/self/statm", "rb") as statm:
+            return int(statm.read().split()[1]) * _PAGE_SIZE
+    except (OSError, ValueError, IndexError):
+        return max_rss()
+
+
+def max_rss():
+    """High-water mark of this process's resident set in bytes, or None"""
+    if resource is None:
+        return None
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    # Kilobytes on Linux, bytes on macOS
+    return peak if sys.platform == "darwin" else peak * 1024
+
+
+class MemoryWatch:
+    """Peak resident memory of the process while a `with` block runs.
+
+    A daemon thread samples the RSS every MEMORY_SAMPLE_INTERVAL seconds.
+    If the process sets a new lifetime high-water mark during the block,
+    ru_maxrss gives the exact peak and catches spikes between samples.
+    The numbers are per process: in the pipeline that is one document per
+    worker, in Streamlit concurrent sessions share it.
+    """
+
+    __slots__ = ("start_bytes", "peak_bytes", "_max_rss_start", "_stop", "_thread")
+
+    def __init__(self):
+        self.start_bytes = None
+        self.peak_bytes = None
+        self._max_rss_start = None
+        self._stop = None
+        self._thread = None
+
+    def __enter__(self):
+        self._max_rss_start = max_rss()
+        self.start_bytes = self.peak_bytes = current_rss()
+        if self.start_bytes is not None:
+            self._stop = threading.Event()
+            self._thread = threading.Thread(target=self._sample, name="aria-memory-watch", daemon=True)
+            self._thread.start()
+        return self
+
+    def __exit__(self, *exc_info):
+        if self._thread is not None:
+            self._stop.set()
+            self._thread.join()
+            self._thread = None
+            self._observe(current_rss())
+        peak = max_rss()
+        if peak is not None and self._max_rss_start is not None and peak > self._max_rss_start:
+            self._observe(peak)
+        return False
+
+    def _sample(self):
+        while not self._stop.wait(MEMORY_SAMPLE_INTERVAL):
+            self._observe(current_rss())
+
+    def _observe(self, rss):
+        if rss is not None and (self.peak_bytes is None or rss > self.peak_bytes):
+            self.peak_bytes = rss
+
+    def as_dict(self):
+        if self.peak_bytes is None:
+            return {}
+        return {
+            "rss_peak_bytes": self.peak_bytes,
+            "rss_growth_bytes": self.peak_bytes - (self.start_bytes or self.peak_bytes),
+        }
+
+
+def pattern_metrics(extractor, stats):
+    """Turn FieldExtractor pattern stats into {field: {pattern index: {...}}}"""
+    result = {}
+    for slot, (attempts, matches, seconds) in stats.items():
+        field_name, index = extractor.slot_info(slot)
+        result.setdefault(field_name, {})[str(index)] = {
+            "attempts": attempts,
+            "matches": matches,
+            "seconds": round(seconds, 6),
+        }
+    return result
+
+
+def _percentile(ordered, q):
+    if not ordered:
+        return 0.0
+    index = min(len(ordered) - 1, max(0, int(round(q * (len(ordered) - 1)))))
+    return ordered[index]
+
+
+class _StageTotals:
+    __slots__ = ("count", "wall_s", "cpu_s", "pages", "bytes", "max_wall_s", "recent")
+
+    def __init__(self):
+        self.count = 0
+        self.wall_s = 0.0
+        self.cpu_s = 0.0
+        self.pages = 0
+        self.bytes = 0
+        self.max_wall_s = 0.0
+        self.recent = deque(maxlen=RECENT_SAMPLES)
+
+
+class MetricsStore:
+    """Thread-safe store of stage and field-pattern measurements"""
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._stages = {}
+        self._patterns = {}
+        self._memory = deque(maxlen=RECENT_SAMPLES)
+        self.max_rss_peak = 0
+        self.documents = 0
+        self.last_document = None
+
+    def record(self, stage, wall_s, cpu_s=0.0, pages=0, bytes_processed=0):
+        """Add one measurement for a pipeline stage"""
+        with self._lock:
+            totals = self._stages.get(stage)
+            if totals is None:
+                totals = self._stages[stage] = _StageTotals()
+            totals.count += 1
+            totals.wall_s += wall_s
+            totals.cpu_s += cpu_s
+            totals.pages += pages
+            totals.bytes += bytes_processed
+            totals.max_wall_s = max(totals.max_wall_s, wall_s)
+            totals.recent.append(wall_s)
+
+    def record_patterns(self, patterns):
+        """Merge pattern_metrics() output into the running totals"""
+        with self._lock:
+            for field_name, per_pattern in patterns.items():
+                field_totals = self._patterns.setdefault(field_name, {})
+                for index, sample in per_pattern.items():
+                    totals = field_totals.setdefault(index, {"attempts": 0, "matches": 0, "seconds": 0.0})
+                    totals["attempts"] += sample["attempts"]
+                    totals["matches"] += sample["matches"]
+                    totals["seconds"] += sample["seconds"]
+
+    def record_memory(self, sample):
+        """Add one document's MemoryWatch.as_dict() sample"""
+        if not sample:
+            return
+        with self._lock:
+            self._memory.append((sample["rss_peak_bytes"], sample["rss_growth_bytes"]))
+            self.max_rss_peak = max(self.max_rss_peak, sample["rss_peak_bytes"])
+
+    def record_document(self, metrics):
+        """Record a per-document metrics dict as produced by the pipeline.
+
+        metrics maps stage -> {"wall_s", "cpu_s", "pages", "bytes"} and may
+        carry a "patterns" entry from pattern_metrics() and a "memory"
+        entry from MemoryWatch.
+        """
+        for stage, sample in metrics.items():
+            if stage == "patterns":
+                self.record_patterns(sample)
+                continue
+            if stage == "memory":
+                self.record_memory(sample)
+                continue
+            self.record(
+                stage,
+                sample.get("wall_s", 0.0),
+                sample.get("cpu_s", 0.0),
+                sample.get("pages", 0),
+                sample.get("bytes", 0),
+            )
+        with self._lock:
+            self.documents += 1
+            self.last_document = metrics
+
+    def snapshot(self):
+        """Plain-dict view of everything recorded so far"""
+        with self._lock:
+            stages = {}
+            for stage, totals in self._stages.items():
+                ordered = sorted(totals.recent)
+                stages[stage] = {
+                    "count": totals.count,
+                    "wall_s_total": round(totals.wall_s, 6),
+                    "wall_s_mean": round(totals.wall_s / totals.count, 6) if totals.count else 0.0,
+                    "wall_s_p50": round(_percentile(ordered, 0.50), 6),
+                    "wall_s_p95": round(_percentile(ordered, 0.95), 6),
+                    "wall_s_max": round(totals.max_wall_s, 6),
+                    "cpu_s_total": round(totals.cpu_s, 6),
+                    "pages_total": totals.pages,
+                    "bytes_total": totals.bytes,
+                }
+            patterns = {
+                field_name: {index: dict(sample) for index, sample in per_pattern.items()}
+                for field_name, per_pattern in self._patterns.items()
+            }
+            memory = {}
+            if self._memory:
+                peaks = sorted(peak for peak, _ in self._memory)
+                growth = sorted(grown for _, grown in self._memory)
+                memory = {
+                    "samples": len(self._memory),
+                    "rss_peak_bytes_p50": _percentile(peaks, 0.50),
+                    "rss_peak_bytes_p95": _percentile(peaks, 0.95),
+                    "rss_peak_bytes_max": self.max_rss_peak,
+                    "rss_growth_bytes_p50": _percentile(growth, 0.50),
+                    "rss_growth_bytes_p95": _percentile(growth, 0.95),
+                    "rss_growth_bytes_max": growth[-1],
+                }
+            return {
+                "generated_at": time.time(),
+                "documents": self.documents,
+                "stages": stages,
+                "patterns": patterns,
+                "memory": memory,
+            }
+
+    def to_json(self):
+        return json.dumps(self.snapshot(), indent=2, ensure_ascii=False)
+
+    def to_prometheus(self):
+        """Prometheus text exposition of the current snapshot"""
+        snap = self.snapshot()
+        lines = [
+            "# HELP aria_documents_total Documents processed.",
+            "# TYPE aria_documents_total counter",
+            f"aria_documents_total {snap['documents']}",
+        ]
+        stage_series = [
+            ("aria_stage_runs_total", "counter", "Stage executions.", "count"),
+            ("aria_stage_wall_seconds_total", "counter", "Wall-clock seconds spent per stage.", "wall_s_total"),
+            ("aria_stage_cpu_seconds_total", "counter", "CPU seconds spent per stage.", "cpu_s_total"),
+            ("aria_stage_pages_total", "counter", "Pages processed per stage.", "pages_total"),
+            ("aria_stage_bytes_total", "counter", "Bytes processed per stage.", "bytes_total"),
+        ]
+        for name, kind, help_text, key in stage_series:
+            lines.append(f"# HELP {name} {help_text}")
+            lines.append(f"# TYPE {name} {kind}")
+            for stage, values in sorted(snap["stages"].items()):
+                lines.append(f'{name}{{stage="{_label(stage)}"}} {values[key]}')
+
+        # Quantiles cover the recent window (the maximum all runs); _sum and _count all runs
+        lines.append("# HELP aria_stage_wall_seconds Wall-clock latency per stage.")
+        lines.append("# TYPE aria_stage_wall_seconds summary")
+        for stage, values in sorted(snap["stages"].items()):
+            label = _label(stage)
+            for quantile, key in (("0.5", "wall_s_p50"), ("0.95", "wall_s_p95"), ("1", "wall_s_max")):
+                lines.append(f'aria_stage_wall_seconds{{stage="{label}",quantile="{quantile}"}} {values[key]}')
+            lines.append(f'aria_stage_wall_seconds_sum{{stage="{label}"}} {values["wall_s_total"]}')
+            lines.append(f'aria_stage_wall_seconds_count{{stage="{label}"}} {values["count"]}')
+
+        memory = snap["memory"]
+        if memory:
+            for name, help_text, prefix in (
+                ("aria_document_rss_peak_bytes", "Process resident memory at its peak while parsing a document.",
+                 "rss_peak_bytes"),
+                ("aria_document_rss_growth_bytes", "Resident memory growth while parsing a document.",
+                 "rss_growth_bytes"),
+            ):
+                lines.append(f"# HELP {name} {help_text}")
+                lines.append(f"# TYPE {name} gauge")
+                for quantile, suffix in (("0.5", "p50"), ("0.95", "p95"), ("1", "max")):
+                    lines.append(f'{name}{{quantile="{quantile}"}} {memory[f"{prefix}_{suffix}"]}')
+
+        pattern_series = [
+            ("aria_pattern_attempts_total", "Pattern match attempts at scanner hits.", "attempts"),
+            ("aria_pattern_matches_total", "Successful pattern matches.", "matches"),
+            ("aria_pattern_seconds_total", "Seconds spent matching each field pattern.", "seconds"),
+        ]
+        for name, help_text, key in pattern_series:
+            lines.append(f"# HELP {name} {help_text}")
+            lines.append(f"# TYPE {name} counter")
+            for field_name, per_pattern in sorted(snap["patterns"].items()):
+                for index, sample in sorted(per_pattern.items()):
+                    lines.append(
+                        f'{name}{{field="{_label(field_name)}",pattern="{index}"}} {round(sample[key], 6)}'
+                    )
+        return "\n".join(lines) + "\n"
+
+    def write(self, path):
+        """Export to path: Prometheus text for .prom/.txt, JSON otherwise.
+
+        The file is written under a unique temporary name and renamed into
+        place, so concurrent writers (e.g. Streamlit sessions) never see or
+        leave a half-written export.
+        """
+        if path.lower().endswith((".prom", ".txt")):
+            content = self.to_prometheus()
+        else:
+            content = self.to_json()
+        directory = os.path.dirname(os.path.abspath(path))
+        os.makedirs(directory, exist_ok=True)
+        with tempfile.NamedTemporaryFile(
+            "w", encoding="utf-8", dir=directory, prefix=f".{os.path.basename(path)}.", suffix=".tmp", delete=False
+        ) as export:
+            export.write(content)
+        try:
+            os.replace(export.name, path)
+        except OSError:
+            os.unlink(export.name)
+            raise
+        return path
+
+
+def _label(value):
+    return str(value).replace("\\", "\\\\").replace('"', '\\"').replace("\n", "\\n")
+
+
+class profiled:
+    """Context manager that runs the block under cProfile and dumps the stats.
+
+    Open the dump with ``python -m pstats <path>`` or snakeviz.  With
+    path=None profiling is skipped entirely.
+    """
+
+    def __init__(self, path):
+        self.path = path
+        self.profiler = None
+
+    def __enter__(self):
+        if self.path:
+            self.profiler = cProfile.Profile()
+            self.profiler.enable()
+        return self
+
+    def __exit__(self, *exc_info):
+        if self.profiler is not None:
+            self.profiler.disable()
+            directory = os.path.dirname(os.path.abspath(self.path))
+            os.makedirs(directory, exist_ok=True)
+            self.profiler.dump_stats(self.path)
+        return False
@@ -0,0 +1,578 @@
+"""Headless ARIA pipeline: extraction and validation without Streamlit.
+
+Usage:
+
+    python -m aria.pipeline inbox/ "offers/*.pdf" -o results.jsonl -j 8
+
+Every input document produces one JSON Lines record with the extracted
+fields, confidence scores, validation outcome and per-stage timings.
+With ``--workers`` above one, documents are parsed in a process pool and
+records are still written in input order.  Each document is held to the
+budgets of aria.governor; ``--isolate`` also parses it in a child process
+that is killed when it overruns them.  With ``--journal`` progress is
+recorded per document (aria.journal) and rerunning the same command after
+an interruption resumes where it stopped.
+"""
+import argparse
+import contextlib
+import copy
+import glob
+import io
+import json
+import os
+import sys
+import time
+from concurrent.futures import ProcessPoolExecutor
+
+from aria.dates import detect_format
+from aria.directory import ORG_DIRECTORY_ENV, OrgDirectory
+from aria.employees import BULK_COMMIT_EVERY, EMPLOYEE_DB_ENV, EmployeeStore
+from aria.events import Transcript, silent
+from aria.extraction import DEFAULT_EXTRACTOR, NOT_FOUND
+from aria.governor import ABORTED, PARTIAL, BudgetExceeded, DocumentBudget, aborted_record, run_isolated
+from aria.ingest import is_pdf, iter_document_text, preload_parser
+from aria.journal import (EXTRACTED, JOURNAL_BATCH_ENV, JOURNAL_ENV, JOURNAL_FSYNC_ENV, STORED, VALIDATED,
+                          DEFAULT_BATCH, DEFAULT_FSYNC_S, Journal, content_hash)
+from aria.layout import DEFAULT_LAYOUT_EXTRACTOR
+from aria.metrics import MemoryWatch, MetricsStore, Stopwatch, pattern_metrics, profiled
+from aria.validation import add_directory_issues, add_duplicate_issues, validate_fields
+
+SUPPORTED_EXTENSIONS = (".pdf", ".docx")
+# Record keys set by validation, journaled with the "validated" stage
+VALIDATED_KEYS = ("status", "validation", "org")
+
+
+def _narrate_structure(text, notify):
+    # AI analyzes document structure first
+    lines = text.split('\n')
+    non_empty_lines = [line.strip() for line in lines if line.strip()]
+
+    notify(f"📊 Document structure analysis: {len(non_empty_lines)} content lines identified.", "analysis")
+
+    # Check for form-like structure
+    colon_count = sum(1 for line in non_empty_lines if ':' in line)
+    notify(f"🔍 Detected structured format: {colon_count} field-value pairs found.", "thinking")
+
+
+def _narrate_fields(fields, confidence_scores, notify):
+    for field_name, value in fields.items():
+        best_confidence = confidence_scores[field_name]
+        if value != NOT_FOUND:
+            conf_color = "high" if best_confidence > 0.8 else "medium" if best_confidence > 0.6 else "low"
+            notify(f"✅ {field_name}: <span class='confidence-{conf_color}'>Found with {best_confidence:.1%} confidence</span>", "analysis")
+        else:
+            notify(f"⚠️ {field_name}: Not detected in document", "thinking")
+
+    # AI reasoning about data quality
+    found_fields = sum(1 for v in fields.values() if "Not Found" not in v)
+    total_fields = len(fields)
+
+    notify(f"🧠 Extraction complete: {found_fields}/{total_fields} fields successfully identified.", "info")
+
+    if found_fields >= 5:
+        notify("✅ High-quality data extraction achieved. Proceeding to validation phase.", "info")
+    elif found_fields >= 3:
+        notify("⚠️ Moderate data extraction. Some manual verification may be needed.", "info")
+    else:
+        notify("❌ Low extraction success. Document may need reformatting.", "info")
+
+
+def analyze_text(text, notify=silent, extractor=DEFAULT_EXTRACTOR):
+    """Extract HR fields from document text, narrating the reasoning"""
+    _narrate_structure(text, notify)
+
+    notify("🔍 Applying neural pattern recognition to extract fields...", "analysis")
+
+    fields, confidence_scores = extractor.extract(text)
+
+    _narrate_fields(fields, confidence_scores, notify)
+    return fields, confidence_scores
+
+
+def analyze_stream(chunks, notify=silent, extractor=DEFAULT_EXTRACTOR, stats=None):
+    """Streaming analyze_text: match fields while pages are still being parsed.
+
+    Stops pulling pages once no later text can change the result and
+    returns the extractor's StreamResult.  stats collects per-pattern
+    timings (see FieldExtractor.scan).
+    """
+    notify("🔍 Applying neural pattern recognition page by page...", "analysis")
+
+    result = extractor.extract_stream(chunks, stats=stats)
+    if not result.exhausted:
+        notify(f"⚡ All fields settled after {result.chunks_read} page(s). Skipping the remaining pages.", "analysis")
+
+    _narrate_structure(result.text, notify)
+    _narrate_fields(result.fields, result.confidence_scores, notify)
+    return result
+
+
+def timed_chunks(chunks, stopwatch):
+    """Pass chunks through, adding the time spent producing them to stopwatch"""
+    iterator = iter(chunks)
+    try:
+        while True:
+            with stopwatch:
+                chunk = next(iterator, _END)
+            if chunk is _END:
+                return
+            yield chunk
+    finally:
+        close = getattr(iterator, "close", None)
+        if close is not None:
+            close()
+
+
+_END = object()
+
+
+def find_documents(inputs, recursive=False):
+    """Expand directories and glob patterns into a sorted list of documents"""
+    paths = []
+    for item in inputs:
+        if os.path.isdir(item):
+            pattern = os.path.join(item, "**", "*") if recursive else os.path.join(item, "*")
+            candidates = glob.glob(pattern, recursive=recursive)
+        else:
+            candidates = glob.glob(item, recursive=recursive) or [item]
+        paths.extend(
+            path for path in sorted(candidates)
+            if path.lower().endswith(SUPPORTED_EXTENSIONS) and os.path.isfile(path)
+        )
+    # Keep the first occurrence when inputs overlap
+    return list(dict.fromkeys(paths))
+
+
+def process_document(path, profile_path=None, layout=False, budget=None):
+    """Run extraction and validation for one file and return its record.
+
+    The record carries per-stage wall/CPU time, pages and bytes under
+    "metrics", with the peak resident memory while the document was parsed
+    under metrics["memory"].  With profile_path set, the document is
+    processed under cProfile and the stats are dumped there.  layout=True
+    reads PDF fields from word positions (aria.layout) instead of the
+    flattened text.
+
+    budget (default: DocumentBudget.from_env()) limits the document's
+    size, pages, characters, time and memory.  A document that runs out
+    of budget while being read is validated on the pages read so far and
+    marked "partial"; one that cannot be read at all is "aborted".  The
+    exceeded limit is recorded under record["budget"].
+    """
+    return _process(path, path, profile_path, layout, budget)
+
+
+def process_upload(data, filename, layout=False, budget=None):
+    """process_document for a document received as bytes (e.g. over HTTP)"""
+    return _process(io.BytesIO(data), filename, None, layout, budget)
+
+
+def process_isolated(path, profile_path=None, layout=False, budget=None):
+    """process_document in a child process that is killed if it overruns its budget"""
+    budget = budget or DocumentBudget.from_env()
+    preload_parser(path)
+    return run_isolated(process_document, (path, profile_path, layout, budget), budget, path)
+
+
+def upload_isolated(data, filename, layout=False, budget=None):
+    """process_upload in a child process that is killed if it overruns its budget"""
+    budget = budget or DocumentBudget.from_env()
+    try:
+        # Refuse before forking a copy of the request
+        budget.check_size(len(data))
+    except BudgetExceeded as e:
+        return aborted_record(filename, e)
+    preload_parser(filename)
+    return run_isolated(process_upload, (data, filename, layout, budget), budget, filename)
+
+
+def analyze_document(path, filename=None, layout=False, budget=None, profile_path=None):
+    """Read the fields of a document for the chat, without validating them.
+
+    filename (default: the path's) picks the parser, e.g. for an upload
+    spooled to a temporary file.  Returns a record like process_document's
+    with the StreamResult under "result" and the narration, as (message,
+    message_type) pairs, under "narration" for the caller to replay.
+    """
+    filename = filename or path
+    budget = budget or DocumentBudget.from_env()
+    transcript = Transcript()
+    record = {"file": filename, "status": "ok", "narration": transcript.messages, "timings": {}}
+    metrics = record["metrics"] = {}
+    pattern_stats = {}
+    started = time.perf_counter()
+    try:
+        with profiled(profile_path):
+            result, chunks = _read_fields(
+                path, filename, os.path.getsize(path), layout, budget, metrics, pattern_stats, transcript
+            )
+    except (BudgetExceeded, MemoryError) as e:
+        _mark_aborted(record, e, budget)
+    except Exception as e:
+        record["status"] = "error"
+        record["error"] = str(e)
+    else:
+        record["result"] = result
+        record["pages_read"] = result.chunks_read
+        if chunks.exceeded is not None:
+            record["status"] = PARTIAL
+            record["budget"] = chunks.exceeded.as_dict()
+    if pattern_stats:
+        metrics["patterns"] = pattern_metrics(DEFAULT_EXTRACTOR, pattern_stats)
+    record["timings"]["total_s"] = round(time.perf_counter() - started, 6)
+    return record
+
+
+def analyze_isolated(path, filename=None, layout=False, budget=None, profile_path=None):
+    """analyze_document in a child process that is killed if it overruns its budget.
+
+    The child opens the document by path, so it is never piped to it.
+    """
+    filename = filename or path
+    budget = budget or DocumentBudget.from_env()
+    preload_parser(filename)
+    return run_isolated(analyze_document, (path, filename, layout, budget, profile_path), budget, filename)
+
+
+def _read_fields(source, filename, size, layout, budget, metrics, pattern_stats, notify=silent):
+    """Stream one document through the extractor within budget.
+
+    Returns (StreamResult, GovernedChunks) and fills metrics with the
+    extract, analyze and memory samples.
+    """
+    budget.check_size(size)
+    extract_watch = Stopwatch()
+    analyze_watch = Stopwatch()
+    memory_watch = MemoryWatch()
+    # Parsing and matching are interleaved: pages are pulled only
+    # until every field is settled
+    filename = os.path.basename(filename)
+    layout = layout and is_pdf(filename)
+    extractor = DEFAULT_LAYOUT_EXTRACTOR if layout else DEFAULT_EXTRACTOR
+    with memory_watch, analyze_watch:
+        chunks = budget.govern(
+            timed_chunks(iter_document_text(source, filename, notify=notify, layout=layout), extract_watch)
+        )
+        result = analyze_stream(chunks, notify=notify, extractor=extractor, stats=pattern_stats)
+    metrics["memory"] = memory_watch.as_dict()
+    metrics["extract"] = extract_watch.as_dict(pages=result.chunks_read, bytes=size)
+    # Page parsing happens inside the analysis loop; report it separately
+    analyze_watch.wall_s -= extract_watch.wall_s
+    analyze_watch.cpu_s -= extract_watch.cpu_s
+    metrics["analyze"] = analyze_watch.as_dict(pages=result.chunks_read, bytes=len(result.text))
+    return result, chunks
+
+
+def _mark_aborted(record, error, budget):
+    exceeded = error if isinstance(error, BudgetExceeded) else BudgetExceeded("memory", None, budget.max_memory_bytes)
+    record["status"] = ABORTED
+    record["error"] = str(exceeded)
+    record["budget"] = exceeded.as_dict()
+
+
+def _process(source, name, profile_path, layout, budget=None):
+    budget = budget or DocumentBudget.from_env()
+    record = {"file": name, "status": "ok", "timings": {}}
+    timings = record["timings"]
+    metrics = record["metrics"] = {}
+    validate_watch = Stopwatch()
+    pattern_stats = {}
+    started = time.perf_counter()
+
+    try:
+        with profiled(profile_path):
+            size = os.path.getsize(source) if isinstance(source, str) else len(source.getvalue())
+            # Files are opened by path so the parsers read them on demand
+            # instead of holding a second copy in memory; uploads are
+            # parsed from the buffer they arrived in
+            result, chunks = _read_fields(source, name, size, layout, budget, metrics, pattern_stats)
+            fields, confidence_scores = result.result
+            record["pages_read"] = result.chunks_read
+
+            with validate_watch:
+                validation = _validation(fields, confidence_scores)
+            metrics["validate"] = validate_watch.as_dict()
+    except (BudgetExceeded, MemoryError) as e:
+        _mark_aborted(record, e, budget)
+    except Exception as e:
+        record["status"] = "error"
+        record["error"] = str(e)
+    else:
+        record["fields"] = fields
+        record["confidence"] = confidence_scores
+        record["validation"] = validation
+        if validation["errors"]:
+            record["status"] = "invalid"
+        if chunks.exceeded is not None:
+            # Fields past the cut-off were never seen, so "partial" wins over "invalid"
+            record["status"] = PARTIAL
+            record["budget"] = chunks.exceeded.as_dict()
+
+    if pattern_stats:
+        metrics["patterns"] = pattern_metrics(DEFAULT_EXTRACTOR, pattern_stats)
+    for stage in ("extract", "analyze", "validate"):
+        if stage in metrics:
+            timings[f"{stage}_s"] = metrics[stage]["wall_s"]
+    timings["total_s"] = round(time.perf_counter() - started, 6)
+    return record
+
+
+def _validation(fields, confidence_scores):
+    """record["validation"] for a document's fields"""
+    validation_results, errors, warnings, suggestions = validate_fields(fields, confidence_scores)
+    return {
+        "results": validation_results,
+        "errors": errors,
+        "warnings": warnings,
+        "suggestions": suggestions,
+        "start_date_format": detect_format(fields.get("Start Date")),
+    }
+
+
+def flag_duplicates(record, store):
+    """Check a record against the employee store and add any duplicates to its validation"""
+    matches = store.find_duplicates(record["fields"])
+    validation = record["validation"]
+    add_duplicate_issues(
+        matches, validation["results"], validation["errors"], validation["warnings"], validation["suggestions"]
+    )
+    if validation["errors"]:
+        record["status"] = "invalid"
+    return matches
+
+
+def resolve_org(record, directory):
+    """Look the record's Department and Manager up in the org directory.
+
+    Resolved directory entries are stored under record["org"] and
+    misspelled or unknown values are added to its validation.
+    """
+    resolutions = directory.resolve(record["fields"])
+    validation = record["validation"]
+    add_directory_issues(
+        resolutions, validation["results"], validation["errors"], validation["warnings"], validation["suggestions"]
+    )
+    record["org"] = {resolution.field: resolution.as_dict() for resolution in resolutions}
+    return resolutions
+
+
+def _process_in_worker(task):
+    """Pool entry point: tag the record with the worker that produced it"""
+    path, profile_path, layout, budget, isolate = task
+    process = process_isolated if isolate else process_document
+    record = process(path, profile_path, layout, budget)
+    record["worker"] = os.getpid()
+    return record
+
+
+def iter_records(paths, workers=1, chunksize=4, profile_path=None, layout=False, budget=None, isolate=False):
+    """Yield one record per path, in input order.
+
+    workers > 1 parses documents in a process pool; PyMuPDF and the DOCX
+    XML parser hold the GIL while parsing, so threads would not help.  Paths are sent
+    to the workers in chunks of chunksize to keep IPC overhead low.
+    profile_path, if given, receives a cProfile dump of the first document.
+    isolate=True parses every document in its own killable child process
+    (see process_isolated).
+    """
+    budget = budget or DocumentBudget.from_env()
+    tasks = (
+        (path, profile_path if i == 0 else None, layout, budget, isolate) for i, path in enumerate(paths)
+    )
+    if workers <= 1:
+        for task in tasks:
+            yield _process_in_worker(task)
+        return
+
+    with ProcessPoolExecutor(max_workers=workers) as pool:
+        yield from pool.map(_process_in_worker, tasks, chunksize=max(1, chunksize))
+
+
+def run_batch(paths, output, workers=1, chunksize=4, metrics=None, profile_path=None, layout=False, store=None,
+              directory=None, budget=None, isolate=False, journal=None):
+    """Process paths, writing one JSON line per document to output.
+
+    Stage measurements are added to the metrics store when one is given.
+    With an org directory, Department and Manager are resolved against
+    it.  With an employee store, every record is checked for duplicates
+    (also against earlier documents of the same batch) and valid records
+    are bulk-inserted.  budget and isolate are passed to iter_records.
+
+    With a journal (aria.journal.Journal), each document's stages are
+    recorded under the hash of its content, and stages the journal
+    already holds are skipped: documents are not parsed, checked or
+    stored twice, and their records are written from the journal.  The
+    store is then committed whenever the journal writes, so neither gets
+    ahead of the other.  Documents that failed with an error are retried.
+
+    Returns a summary dict with counts per status, the elapsed time and
+    per-worker throughput.
+    """
+    summary = {"documents": 0, "ok": 0, "invalid": 0, "partial": 0, "aborted": 0, "error": 0, "duplicates": 0,
+               "resumed": 0}
+    per_worker = {}
+    started = time.perf_counter()
+    if journal is not None:
+        keys = [content_hash(path) for path in paths]
+        states = [journal.get(key) for key in keys]
+    else:
+        keys = states = [None] * len(paths)
+    records = iter_records(
+        [path for path, state in zip(paths, states) if state is None], workers=workers, chunksize=chunksize,
+        profile_path=profile_path, layout=layout, budget=budget, isolate=isolate
+    )
+    commit_every = BULK_COMMIT_EVERY if journal is None else None
+    with store.bulk(commit_every) if store is not None else contextlib.nullcontext():
+        if journal is not None and store is not None:
+            journal.before_write = store.commit
+        try:
+            for path, key, state in zip(paths, keys, states):
+                if state is None:
+                    record = next(records)
+                    document_metrics = record["metrics"]
+                    if metrics is not None:
+                        metrics.record_document(document_metrics)
+                        metrics.record("document", record["timings"]["total_s"])
+                    # Pattern-level detail goes to the metrics export, not every record
+                    document_metrics.pop("patterns", None)
+                    stats = per_worker.setdefault(record["worker"], {"documents": 0, "busy_s": 0.0})
+                    stats["documents"] += 1
+                    stats["busy_s"] += record["timings"]["total_s"]
+                    if journal is not None and record["status"] != "error":
+                        journal.record(key, EXTRACTED, path, record)
+                else:
+                    record = copy.deepcopy(state.record)
+                    record["file"] = path
+                    summary["resumed"] += 1
+                    if "fields" in record and ("status" not in record or "validation" not in record):
+                        # Extracted by the app, which journals only the fields
+                        record["validation"] = _validation(record["fields"], record.get("confidence", {}))
+                        record["status"] = "invalid" if record["validation"]["errors"] else "ok"
+
+                if "fields" in record and (state is None or not state.reached(VALIDATED)):
+                    if directory is not None:
+                        resolve_org(record, directory)
+                    if store is not None and flag_duplicates(record, store):
+                        summary["duplicates"] += 1
+                    if journal is not None:
+                        journal.record(key, VALIDATED, path, {k: record[k] for k in VALIDATED_KEYS if k in record})
+                if store is not None and record["status"] == "ok" and (state is None or not state.reached(STORED)):
+                    store.add(record["fields"], source=record["file"])
+                    if journal is not None:
+                        journal.record(key, STORED, path)
+
+                output.write(json.dumps(record, ensure_ascii=False) + "\n")
+                summary["documents"] += 1
+                summary[record["status"]] += 1
+        finally:
+            if journal is not None:
+                # Also on an interruption: what was done so far is kept by both
+                journal.flush()
+                journal.before_write = None
+    elapsed = time.perf_counter() - started
+
+    for stats in per_worker.values():
+        stats["busy_s"] = round(stats["busy_s"], 3)
+        stats["docs_per_s"] = round(stats["documents"] / stats["busy_s"], 1) if stats["busy_s"] else None
+    summary["elapsed_s"] = round(elapsed, 3)
+    summary["docs_per_s"] = round(summary["documents"] / elapsed, 1) if elapsed else None
+    summary["workers"] = per_worker
+    return summary
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(
+        prog="python -m aria.pipeline",
+        description="Extract and validate new hire documents without the Streamlit UI."
+    )
+    parser.add_argument("inputs", nargs="+", help="PDF/DOCX files, directories or glob patterns")
+    parser.add_argument("-o", "--output", default="-", help="JSON Lines output file (default: stdout)")
+    parser.add_argument("-r", "--recursive", action="store_true", help="descend into subdirectories")
+    parser.add_argument("-j", "--workers", type=int, default=1,
+                        help="parallel worker processes (0 = one per CPU core, default: 1)")
+    parser.add_argument("--chunksize", type=int, default=4,
+                        help="documents handed to a worker per task (default: 4)")
+    parser.add_argument("--metrics-out", metavar="PATH",
+                        help="write stage metrics here (.prom/.txt for Prometheus text, JSON otherwise)")
+    parser.add_argument("--profile-dump", metavar="PATH",
+                        help="cProfile the first document and dump the stats to PATH")
+    parser.add_argument("--layout", action="store_true",
+                        help="read PDF fields from word positions instead of the flattened text")
+    parser.add_argument("--employee-db", metavar="PATH", default=os.environ.get(EMPLOYEE_DB_ENV),
+                        help="flag duplicates against this SQLite employee store and add valid records "
+                             f"to it (default: ${EMPLOYEE_DB_ENV})")
+    parser.add_argument("--org-directory", metavar="PATH", default=os.environ.get(ORG_DIRECTORY_ENV),
+                        help="resolve Department and Manager against this JSON/CSV org directory export "
+                             f"(default: ${ORG_DIRECTORY_ENV})")
+    parser.add_argument("--isolate", action="store_true",
+                        help="parse every document in a child process that is killed when it overruns "
+                             "its time or memory budget (budgets: ARIA_MAX_* variables, see aria.governor)")
+    parser.add_argument("--journal", metavar="PATH", default=os.environ.get(JOURNAL_ENV),
+                        help="record each document's progress here and skip work it already holds, so an "
+                             f"interrupted run can be resumed by running it again (default: ${JOURNAL_ENV})")
+    parser.add_argument("--journal-batch", type=int, metavar="N",
+                        default=int(os.environ.get(JOURNAL_BATCH_ENV, DEFAULT_BATCH)),
+                        help=f"journal entries buffered per write (default: ${JOURNAL_BATCH_ENV} or {DEFAULT_BATCH})")
+    parser.add_argument("--journal-fsync-s", type=float, metavar="SECONDS",
+                        default=float(os.environ.get(JOURNAL_FSYNC_ENV, DEFAULT_FSYNC_S)),
+                        help="fsync the journal at most this often; 0 = every write, negative = only at the end "
+                             f"(default: ${JOURNAL_FSYNC_ENV} or {DEFAULT_FSYNC_S})")
+    args = parser.parse_args(argv)
+
+    workers = args.workers if args.workers > 0 else (os.cpu_count() or 1)
+
+    paths = find_documents(args.inputs, recursive=args.recursive)
+    if not paths:
+        parser.error("no PDF or DOCX documents found")
+
+    metrics = MetricsStore() if args.metrics_out else None
+    directory = OrgDirectory.load(args.org_directory) if args.org_directory else None
+    store = EmployeeStore(args.employee_db) if args.employee_db else None
+    journal = Journal(args.journal, args.journal_batch, args.journal_fsync_s) if args.journal else None
+    options = {
+        "workers": workers,
+        "chunksize": args.chunksize,
+        "metrics": metrics,
+        "profile_path": args.profile_dump,
+        "layout": args.layout,
+        "store": store,
+        "directory": directory,
+        "isolate": args.isolate,
+        "journal": journal,
+    }
+    try:
+        if args.output == "-":
+            summary = run_batch(paths, sys.stdout, **options)
+        else:
+            with open(args.output, "w", encoding="utf-8") as output:
+                summary = run_batch(paths, output, **options)
+    finally:
+        if journal is not None:
+            journal.close()
+        if store is not None:
+            store.close()
+    if metrics is not None:
+        metrics.write(args.metrics_out)
+
+    print(
+        f"Processed {summary['documents']} documents in {summary['elapsed_s']}s "
+        f"({summary['docs_per_s']} docs/s): "
+        f"{summary['ok']} ok, {summary['invalid']} invalid, {summary['partial']} partial, "
+        f"{summary['aborted']} aborted, {summary['error']} errors",
+        file=sys.stderr
+    )
+    if journal is not None:
+        print(f"  {summary['resumed']} resumed from {args.journal}", file=sys.stderr)
+    if store is not None:
+        print(f"  {summary['duplicates']} possible duplicates of stored employees", file=sys.stderr)
+    for pid, stats in sorted(summary["workers"].items()):
+        print(
+            f"  worker {pid}: {stats['documents']} documents, "
+            f"{stats['busy_s']}s busy, {stats['docs_per_s']} docs/s",
+            file=sys.stderr
+        )
+    return 1 if summary["error"] or summary["aborted"] else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
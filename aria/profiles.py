@@ -0,0 +1,59 @@
+"""Execution profiles: how much artificial pacing the agent narration gets.
+
+The ``fast`` profile is meant for production and adds no delay at all.  The
+``demo`` profile keeps the paced, step-by-step narration used for live
+walkthroughs.  The default comes from the ARIA_PROFILE environment variable.
+"""
+import os
+import time
+
+DEFAULT_PROFILE_ENV = "ARIA_PROFILE"
+
+
+class ExecutionProfile:
+    """Pacing settings for one way of running the agent"""
+
+    __slots__ = ("name", "label", "stage_delay", "step_pacing")
+
+    def __init__(self, name, label, stage_delay=0.0, step_pacing=0.0):
+        self.name = name
+        self.label = label
+        # Pause before each pipeline stage, in seconds
+        self.stage_delay = stage_delay
+        # Multiplier applied to each ERP step's narration duration
+        self.step_pacing = step_pacing
+
+    @property
+    def paced(self):
+        return self.stage_delay > 0 or self.step_pacing > 0
+
+    def pause_stage(self):
+        """Narration pause between pipeline stages"""
+        if self.stage_delay > 0:
+            time.sleep(self.stage_delay)
+
+    def pace_step(self, duration):
+        """Narration pause after an integration step has completed"""
+        if self.step_pacing > 0 and duration > 0:
+            time.sleep(duration * self.step_pacing)
+
+    def __repr__(self):
+        return f"ExecutionProfile({self.name!r})"
+
+
+PROFILES = {
+    "fast": ExecutionProfile("fast", "⚡ Fast (production)"),
+    "demo": ExecutionProfile("demo", "🎬 Demo (paced narration)", stage_delay=1.0, step_pacing=1.0),
+}
+
+
+def get_profile(name=None):
+    """Look up a profile by name, falling back to $ARIA_PROFILE and then fast"""
+    if name is None:
+        name = os.environ.get(DEFAULT_PROFILE_ENV, "fast")
+    try:
+        return PROFILES[name.strip().lower()]
+    except KeyError:
+        raise ValueError(
+            f"Unknown execution profile {name!r}, expected one of: {', '.join(PROFILES)}"
+        ) from None
@@ -0,0 +1,354 @@
+"""HTTP extraction service for integrations (ATS webhooks, intake mailbox).
+
+Accepts PDF and DOCX uploads and answers with the pipeline record for the
+document, with the extracted fields, confidence scores and validation
+results, as JSON:
+
+    python -m aria.service --port 8080 --workers 4 --queue 16
+
+    curl --data-binary @offer.pdf -H "Content-Type: application/pdf" http://127.0.0.1:8080/extract
+    curl -F file=@offer.docx http://127.0.0.1:8080/extract
+
+Endpoints:
+
+    POST /extract    raw document body (name from ?filename=, X-Filename or
+                     the Content-Type) or a multipart/form-data file upload;
+                     ?layout=1 reads PDF fields from word positions
+    GET  /healthz    worker pool and queue state
+    GET  /metrics    stage latencies in Prometheus text format
+
+Documents are parsed in a pool of --workers processes.  Up to --queue
+more requests wait for a free worker; past that the service answers 429
+with Retry-After instead of queueing without bound, so callers back off
+and latency stays predictable under bursts.  Connections are HTTP/1.1
+keep-alive.
+
+Every document is parsed in a child of its worker that is killed when it
+overruns the budgets of aria.governor (ARIA_MAX_* variables), so one
+hostile upload cannot hold a worker.  Documents cut short are answered
+200 with status "partial"; documents that could not be read within budget
+get 422 with status "aborted" and the exceeded limit under "budget".
+"""
+import argparse
+import asyncio
+import email.parser
+import email.policy
+import functools
+import json
+import os
+import signal
+import sys
+import time
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+from urllib.parse import parse_qs
+
+from aria.directory import ORG_DIRECTORY_ENV, OrgDirectory
+from aria.employees import EMPLOYEE_DB_ENV, EmployeeStore
+from aria.jobs import default_workers
+from aria.metrics import MetricsStore
+from aria.governor import ABORTED
+from aria.pipeline import SUPPORTED_EXTENSIONS, flag_duplicates, process_upload, resolve_org, upload_isolated
+
+DEFAULT_QUEUE = 16
+DEFAULT_MAX_UPLOAD_MB = 25
+KEEP_ALIVE_S = 15
+RETRY_AFTER_S = 1
+DRAIN_CHUNK = 65536
+
+DOCX_TYPE = "application/vnd.openxmlformats-officedocument.wordprocessingml.document"
+CONTENT_TYPE_EXTENSIONS = {"application/pdf": ".pdf", DOCX_TYPE: ".docx"}
+TRUE_VALUES = ("1", "true", "yes", "on")
+
+REASONS = {200: "OK", 400: "Bad Request", 404: "Not Found", 405: "Method Not Allowed",
+           411: "Length Required", 413: "Payload Too Large", 422: "Unprocessable Entity",
+           429: "Too Many Requests", 503: "Service Unavailable"}
+
+
+def _run(task):
+    """Pool entry point"""
+    data, filename, layout, isolate = task
+    record = (upload_isolated if isolate else process_upload)(data, filename, layout)
+    record["worker"] = os.getpid()
+    return record
+
+
+def parse_upload(headers, query, body):
+    """(document bytes, filename) of an /extract request; raises ValueError"""
+    content_type = headers.get("content-type", "")
+    media_type = content_type.split(";", 1)[0].strip().lower()
+    if media_type == "multipart/form-data":
+        message = email.parser.BytesParser(policy=email.policy.HTTP).parsebytes(
+            b"Content-Type: " + content_type.encode("latin-1") + b"\r\n\r\n" + body
+        )
+        for part in message.iter_parts():
+            if part.get_filename():
+                data, filename = part.get_payload(decode=True), part.get_filename()
+                break
+        else:
+            raise ValueError("multipart upload has no file part")
+    else:
+        data = body
+        filename = query.get("filename", [None])[0] or headers.get("x-filename")
+        if not filename:
+            if media_type not in CONTENT_TYPE_EXTENSIONS:
+                raise ValueError("name the document with ?filename= or send a PDF/DOCX Content-Type")
+            filename = "upload" + CONTENT_TYPE_EXTENSIONS[media_type]
+    filename = os.path.basename(filename)
+    if not filename.lower().endswith(SUPPORTED_EXTENSIONS):
+        raise ValueError(f"unsupported document type: {filename}")
+    if not data:
+        raise ValueError("empty document")
+    return data, filename
+
+
+class ExtractionService:
+    """asyncio HTTP/1.1 front end to a bounded pool of pipeline workers.
+
+    With store (an aria.employees.EmployeeStore), records are checked for
+    duplicates; the service never adds to the store.  With directory (an
+    aria.directory.OrgDirectory), Department and Manager are resolved.
+    isolate=False parses documents in the pool workers themselves, saving
+    a fork per request but leaving runaway parses unkillable.
+    """
+
+    def __init__(self, host="127.0.0.1", port=8080, workers=None, queue_limit=DEFAULT_QUEUE,
+                 max_upload_bytes=DEFAULT_MAX_UPLOAD_MB * 2**20, layout=False, store=None,
+                 keep_alive_s=KEEP_ALIVE_S, directory=None, isolate=True):
+        self.host = host
+        self.port = port
+        self.workers = workers or default_workers()
+        self.queue_limit = queue_limit
+        self.max_upload_bytes = max_upload_bytes
+        self.layout = layout
+        self.store = store
+        self.directory = directory
+        self.isolate = isolate
+        self.keep_alive_s = keep_alive_s
+        self.metrics = MetricsStore()
+        self.stats = {"connections": 0, "requests": 0, "rejected": 0, "errors": 0, "aborted": 0}
+        self._pending = 0  # admitted /extract requests: parsing or waiting for a worker
+        self._pool = None
+        self._server = None
+
+    @property
+    def url(self):
+        return f"http://{self.host}:{self.port}"
+
+    async def start(self):
+        self._pool = ProcessPoolExecutor(max_workers=self.workers)
+        self._server = await asyncio.start_server(self._handle, self.host, self.port)
+        self.port = self._server.sockets[0].getsockname()[1]
+        return self
+
+    async def stop(self):
+        if self._server is not None:
+            self._server.close()
+            await self._server.wait_closed()
+            self._server = None
+        if self._pool is not None:
+            # Waiting lets each worker exit and close its sandbox child
+            pool, self._pool = self._pool, None
+            await asyncio.get_running_loop().run_in_executor(
+                None, functools.partial(pool.shutdown, wait=True, cancel_futures=True)
+            )
+
+    async def __aenter__(self):
+        return await self.start()
+
+    async def __aexit__(self, *exc_info):
+        await self.stop()
+
+    async def serve_forever(self):
+        """Serve until SIGINT or SIGTERM, then shut the worker pool down"""
+        await self.start()
+        stopping = asyncio.Event()
+        loop = asyncio.get_running_loop()
+        for signum in (signal.SIGINT, signal.SIGTERM):
+            try:
+                loop.add_signal_handler(signum, stopping.set)
+            except NotImplementedError:  # Windows
+                pass
+        try:
+            await stopping.wait()
+        finally:
+            await self.stop()
+
+    async def _handle(self, reader, writer):
+        self.stats["connections"] += 1
+        try:
+            while True:
+                try:
+                    request_line = await asyncio.wait_for(reader.readline(), self.keep_alive_s)
+                except asyncio.TimeoutError:
+                    break
+                if not request_line.strip():
+                    break
+                method, target, version = request_line.decode("latin-1").split()
+                headers = {}
+                while True:
+                    line = await reader.readline()
+                    if line in (b"\r\n", b"\n", b""):
+                        break
+                    name, _, value = line.decode("latin-1").partition(":")
+                    headers[name.strip().lower()] = value.strip()
+
+                keep_alive = headers.get("connection", "").lower() != "close" and version == "HTTP/1.1"
+                status, payload, keep_alive = await self._respond(method, target, headers, reader, keep_alive)
+                self.stats["requests"] += 1
+
+                if isinstance(payload, str):
+                    content_type, data = "text/plain; version=0.0.4", payload.encode("utf-8")
+                else:
+                    content_type, data = "application/json", json.dumps(payload, ensure_ascii=False).encode("utf-8")
+                extra = f"Retry-After: {RETRY_AFTER_S}\r\n" if status == 429 else ""
+                if keep_alive:
+                    extra += f"Keep-Alive: timeout={self.keep_alive_s:g}\r\n"
+                writer.write(
+                    f"HTTP/1.1 {status} {REASONS.get(status, 'OK')}\r\n"
+                    f"Content-Type: {content_type}\r\n"
+                    f"Content-Length: {len(data)}\r\n"
+                    f"{extra}"
+                    f"Connection: {'keep-alive' if keep_alive else 'close'}\r\n\r\n".encode("latin-1")
+                    + data
+                )
+                await writer.drain()
+                if not keep_alive:
+                    break
+        except (ConnectionError, asyncio.IncompleteReadError, ValueError):
+            pass
+        finally:
+            writer.close()
+
+    async def _respond(self, method, target, headers, reader, keep_alive):
+        """Return (status, JSON body or Prometheus text, keep_alive)"""
+        path, _, query = target.partition("?")
+        if "chunked" in headers.get("transfer-encoding", "").lower():
+            return 411, {"error": "send the document with a Content-Length"}, False
+        length = int(headers.get("content-length", 0))
+        if length > self.max_upload_bytes:
+            # Not worth reading just to keep the connection
+            return 413, {"error": f"document larger than {self.max_upload_bytes} bytes"}, False
+
+        if path != "/extract" or method != "POST" or self._pending >= self.workers + self.queue_limit:
+            await self._drain(reader, length)
+            if path == "/extract" and method == "POST":
+                self.stats["rejected"] += 1
+                return 429, {"error": "extraction queue is full, retry later"}, keep_alive
+            if path == "/healthz" and method == "GET":
+                return 200, self.health(), keep_alive
+            if path == "/metrics" and method == "GET":
+                return 200, self.metrics.to_prometheus(), keep_alive
+            if path in ("/extract", "/healthz", "/metrics"):
+                return 405, {"error": "method not allowed"}, keep_alive
+            return 404, {"error": f"no route for {path}"}, keep_alive
+
+        self._pending += 1
+        started = time.perf_counter()
+        try:
+            body = await reader.readexactly(length)
+            query = parse_qs(query)
+            try:
+                data, filename = parse_upload(headers, query, body)
+            except ValueError as e:
+                return 400, {"error": str(e)}, keep_alive
+            layout = query.get("layout", [None])[0]
+            layout = self.layout if layout is None else layout.lower() in TRUE_VALUES
+            pool = self._pool
+            try:
+                record = await asyncio.get_running_loop().run_in_executor(
+                    pool, _run, (data, filename, layout, self.isolate)
+                )
+            except BrokenProcessPool:
+                # A worker died (e.g. killed for memory); the first request
+                # to notice starts a fresh pool
+                if self._pool is pool:
+                    # Release the broken pool's management thread and pipes
+                    pool.shutdown(wait=False, cancel_futures=True)
+                    self._pool = ProcessPoolExecutor(max_workers=self.workers)
+                self.stats["errors"] += 1
+                return 503, {"error": "worker pool restarted, retry the request"}, keep_alive
+        finally:
+            self._pending -= 1
+
+        # Admitted requests only: upload, queue wait and parsing
+        elapsed = time.perf_counter() - started
+        self.metrics.record("request", elapsed)
+        self.metrics.record("queue_wait", max(0.0, elapsed - record["timings"]["total_s"]))
+        if self.directory is not None and "fields" in record:
+            resolve_org(record, self.directory)
+        if self.store is not None and "fields" in record:
+            flag_duplicates(record, self.store)
+        document_metrics = record["metrics"]
+        self.metrics.record_document(document_metrics)
+        self.metrics.record("document", record["timings"]["total_s"])
+        document_metrics.pop("patterns", None)
+        if record["status"] == "error":
+            self.stats["errors"] += 1
+            return 422, record, keep_alive
+        if record["status"] == ABORTED:
+            self.stats["aborted"] += 1
+            return 422, record, keep_alive
+        return 200, record, keep_alive
+
+    @staticmethod
+    async def _drain(reader, length):
+        """Skip a request body without holding it in memory"""
+        while length > 0:
+            chunk = await reader.readexactly(min(length, DRAIN_CHUNK))
+            length -= len(chunk)
+
+    def health(self):
+        return {
+            "status": "ok",
+            "workers": self.workers,
+            "busy": min(self._pending, self.workers),
+            "queued": max(0, self._pending - self.workers),
+            "queue_limit": self.queue_limit,
+            **self.stats,
+        }
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(
+        prog="python -m aria.service",
+        description="Serve document extraction and validation over HTTP."
+    )
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=8080)
+    parser.add_argument("--workers", type=int, default=None,
+                        help="parser processes (default: $ARIA_JOB_WORKERS or up to 4)")
+    parser.add_argument("--queue", type=int, default=DEFAULT_QUEUE,
+                        help=f"requests allowed to wait for a worker before answering 429 (default: {DEFAULT_QUEUE})")
+    parser.add_argument("--max-upload-mb", type=float, default=DEFAULT_MAX_UPLOAD_MB)
+    parser.add_argument("--layout", action="store_true",
+                        help="read PDF fields from word positions unless a request sets ?layout=0")
+    parser.add_argument("--employee-db", metavar="PATH", default=os.environ.get(EMPLOYEE_DB_ENV),
+                        help=f"flag duplicates against this SQLite employee store (default: ${EMPLOYEE_DB_ENV})")
+    parser.add_argument("--org-directory", metavar="PATH", default=os.environ.get(ORG_DIRECTORY_ENV),
+                        help=f"resolve Department and Manager against this org directory (default: ${ORG_DIRECTORY_ENV})")
+    parser.add_argument("--no-isolate", dest="isolate", action="store_false",
+                        help="parse in the pool workers instead of a killable child per document")
+    args = parser.parse_args(argv)
+
+    directory = OrgDirectory.load(args.org_directory) if args.org_directory else None
+    store = EmployeeStore(args.employee_db) if args.employee_db else None
+    service = ExtractionService(
+        args.host, args.port, args.workers, args.queue,
+        int(args.max_upload_mb * 2**20), args.layout, store, directory=directory,
+        isolate=args.isolate
+    )
+    print(f"ARIA extraction service on http://{args.host}:{args.port} "
+          f"({service.workers} workers, queue {args.queue})", file=sys.stderr)
+    try:
+        asyncio.run(service.serve_forever())
+    except KeyboardInterrupt:
+        pass
+    finally:
+        if store is not None:
+            store.close()
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
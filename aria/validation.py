@@ -0,0 +1,94 @@
+"""Validation rules for extracted new hire records"""
+import html
+
+from aria.directory import MATCH_AMBIGUOUS, MATCH_EXACT, MATCH_FUZZY
+from aria.events import silent
+from aria.rules import current_rules
+
+# Directory entries named in an ambiguous-match suggestion
+MAX_LISTED = 3
+
+
+def add_duplicate_issues(matches, validation_results, errors, warnings, suggestions):
+    """Report EmployeeStore.find_duplicates() matches in a validation outcome"""
+    if not matches:
+        return
+    strong = [match for match in matches if match.strong]
+    for match in strong:
+        errors.append(f"Duplicate employee: {' and '.join(match.reasons)} already on file for {match.label}")
+    for match in matches:
+        if not match.strong:
+            warnings.append(f"Possible duplicate: same name and start date as {match.label}")
+    suggestions.append("Review the existing employee record before onboarding again")
+    validation_results["Duplicate"] = "❌ On file" if strong else "⚠️ Possible match"
+
+
+def add_directory_issues(resolutions, validation_results, errors, warnings, suggestions):
+    """Report OrgDirectory.resolve() results in a validation outcome"""
+    for resolution in resolutions:
+        field, value = resolution.field, resolution.value
+        if resolution.match == MATCH_EXACT:
+            continue
+        if resolution.match == MATCH_FUZZY:
+            warnings.append(f"{field} '{value}' is not in the org directory")
+            suggestions.append(f"Did you mean {resolution.entry.label} for {field}?")
+            validation_results[field] = "⚠️ Not in directory"
+        elif resolution.match == MATCH_AMBIGUOUS:
+            listed = ", ".join(entry.label for entry in resolution.candidates[:MAX_LISTED])
+            warnings.append(f"{field} '{value}' matches {len(resolution.candidates)} org directory entries")
+            suggestions.append(f"Confirm the {field}: {listed}")
+            validation_results[field] = "⚠️ Ambiguous"
+        else:
+            warnings.append(f"{field} '{value}' is not in the org directory")
+            suggestions.append(f"Check the {field} against the org directory")
+            validation_results[field] = "⚠️ Not in directory"
+
+
+def validate_fields(fields, confidence_scores, notify=silent, today=None, store=None, directory=None, rules=None):
+    """Validate one extracted record.
+
+    Field checks come from rules (an aria.rules.RuleSet), by default the
+    rules file named by $ARIA_RULES or the built-in rules.
+
+    With store (an aria.employees.EmployeeStore), records matching an
+    employee already on file are flagged as duplicates.  With directory
+    (an aria.directory.OrgDirectory), Department and Manager are looked
+    up and misspelled or unknown values get a suggestion.
+
+    Returns (validation_results, errors, warnings, suggestions).
+    """
+    notify("🔍 Validating required fields and data integrity...", "analysis")
+
+    validation_results, errors, warnings, suggestions = (rules or current_rules()).evaluate(fields, notify, today)
+
+    if directory is not None:
+        notify("🏢 Resolving department and manager against the org directory...", "thinking")
+        resolutions = directory.resolve(fields)
+        add_directory_issues(resolutions, validation_results, errors, warnings, suggestions)
+        for resolution in resolutions:
+            if resolution.match == MATCH_EXACT:
+                notify(f"✅ {resolution.field} resolved to {resolution.entry.label}", "analysis")
+            else:
+                # The chat renders narration as HTML; the value comes from the document
+                notify(f"⚠️ {resolution.field} '{html.escape(resolution.value)}' not matched exactly in the org directory", "analysis")
+
+    if store is not None:
+        notify("🗂️ Checking employee records for duplicates...", "thinking")
+        matches = store.find_duplicates(fields)
+        add_duplicate_issues(matches, validation_results, errors, warnings, suggestions)
+        if matches:
+            notify(f"⚠️ Duplicate check: {len(matches)} matching employee record(s) found", "analysis")
+        else:
+            notify("✅ Duplicate check passed: no matching employee on file", "analysis")
+
+    # AI reasoning summary
+    total_issues = len(errors) + len(warnings)
+    if total_issues == 0:
+        notify("🎉 Validation complete: All data passes AI quality checks!", "info")
+    else:
+        notify(f"📊 Validation summary: {len(errors)} errors, {len(warnings)} warnings identified", "info")
+
+    if suggestions:
+        notify(f"💡 AI generated {len(suggestions)} optimization suggestions", "info")
+
+    return validation_results, errors, warnings, suggestions
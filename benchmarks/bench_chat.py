@@ -0,0 +1,102 @@
+"""Benchmark: chat panel render cost per Streamlit rerun.
+
+Compares the original display_chat (a list of dicts, one st.markdown call
+per message plus the container open/close calls) with ChatLog.render (one
+cached HTML block).  Reports build time per rerun, markdown elements sent
+and payload bytes, both for reruns that follow new messages and for reruns
+where nothing changed (e.g. a button click).
+
+    python benchmarks/bench_chat.py --documents 200
+"""
+import argparse
+import datetime
+import os
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from aria.chat import ChatLog  # noqa: E402
+
+DOCUMENT_MESSAGES = [
+    ("📄 Document received. Analyzing file structure...", "thinking"),
+    ("🔍 Detected PDF format. Using advanced OCR analysis...", "analysis"),
+    ("📊 Document analysis: 3 pages detected. Processing each page...", "analysis"),
+    ("🧠 Page 1 analysis: Found 412 words, detecting form structure...", "thinking"),
+    ("✅ PDF processing complete. Extracted 1204 total words.", "info"),
+] + [(f"🎯 Found Field {i}: 'Value {i}' (confidence: 90%)", "analysis") for i in range(30)] + [
+    ("✅ Data validation complete. All checks passed!", "info"),
+]
+RERUNS_PER_DOCUMENT = 4  # upload, validate, integrate, reset
+
+
+def legacy_render(messages):
+    """The original display_chat body; returns the markdown bodies it sends"""
+    bodies = ['<div class="chat-container">']
+    for msg in messages[-10:]:
+        if msg["type"] == "thinking":
+            bodies.append(f'<div class="agent-thinking">{msg["icon"]} **[{msg["timestamp"]}]** {msg["message"]}</div>')
+        elif msg["type"] == "analysis":
+            bodies.append(f'<div class="agent-analysis">{msg["icon"]} **[{msg["timestamp"]}]** {msg["message"]}</div>')
+        else:
+            bodies.append(f'<div class="agent-message">{msg["icon"]} **[{msg["timestamp"]}]** {msg["message"]}</div>')
+    bodies.append('</div>')
+    return bodies
+
+
+def legacy_append(messages, message, message_type):
+    icon = {"thinking": "🤔", "analysis": "🔍"}.get(message_type, "🤖")
+    messages.append({
+        "message": message,
+        "type": message_type,
+        "timestamp": datetime.datetime.now().strftime("%H:%M:%S"),
+        "icon": icon,
+    })
+
+
+def run(documents):
+    legacy = []
+    log = ChatLog()
+    totals = {
+        "legacy": {"changed": [0.0, 0, 0, 0], "unchanged": [0.0, 0, 0, 0]},
+        "cached": {"changed": [0.0, 0, 0, 0], "unchanged": [0.0, 0, 0, 0]},
+    }
+
+    def measure(kind, case, render):
+        start = time.perf_counter()
+        bodies = render()
+        elapsed = time.perf_counter() - start
+        sample = totals[kind][case]
+        sample[0] += elapsed
+        sample[1] += 1
+        sample[2] += len(bodies)
+        sample[3] += sum(len(body.encode("utf-8")) for body in bodies)
+
+    for _ in range(documents):
+        for message, message_type in DOCUMENT_MESSAGES:
+            legacy_append(legacy, message, message_type)
+            log.append(message, message_type)
+        for rerun in range(RERUNS_PER_DOCUMENT):
+            case = "changed" if rerun == 0 else "unchanged"
+            measure("legacy", case, lambda: legacy_render(legacy))
+            measure("cached", case, lambda: [log.render(10)[0]])
+    return totals, len(legacy), len(log)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--documents", type=int, default=200)
+    args = parser.parse_args()
+
+    totals, legacy_len, log_len = run(args.documents)
+    print(f"{args.documents} documents, {len(DOCUMENT_MESSAGES)} messages each, "
+          f"{RERUNS_PER_DOCUMENT} reruns per document")
+    print(f"messages held in session: legacy list {legacy_len:,}, ChatLog {log_len:,}")
+    print(f"{'renderer':<10}{'rerun':<12}{'us/rerun':>10}{'elements':>10}{'bytes/rerun':>13}")
+    for kind, cases in totals.items():
+        for case, (seconds, runs, elements, payload) in cases.items():
+            print(f"{kind:<10}{case:<12}{seconds / runs * 1e6:>10.1f}{elements / runs:>10.0f}{payload / runs:>13,.0f}")
+
+
+if __name__ == "__main__":
+    main()
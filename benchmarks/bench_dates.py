@@ -0,0 +1,68 @@
+"""Benchmark: strptime format loop vs shape-dispatched, memoized parse_date.
+
+Two workloads: a cohort where many records share a few dozen start dates,
+and all-distinct dates (the memo cannot help; only shape dispatch does).
+Both paths are checked to return the same dates.
+
+    python benchmarks/bench_dates.py --records 100000
+"""
+import argparse
+import datetime
+import os
+import random
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from aria.dates import DATE_FORMATS, _parse_cached, parse_date  # noqa: E402
+
+STYLES = ["%Y-%m-%d", "%m/%d/%Y", "%d/%m/%Y", "%B %d, %Y", "%m-%d-%Y"]
+
+
+def legacy_parse(date_str):
+    """The original validate_fields loop"""
+    for fmt in DATE_FORMATS:
+        try:
+            return datetime.datetime.strptime(date_str, fmt).date()
+        except ValueError:
+            continue
+    return None
+
+
+def make_dates(rng, count, distinct):
+    base = datetime.date(2026, 1, 1)
+    pool = []
+    for i in range(distinct):
+        day = base + datetime.timedelta(days=i)
+        pool.append(day.strftime(STYLES[i % len(STYLES)]) if i % 50 else "TBD")
+    if distinct >= count:
+        return pool[:count]
+    return [rng.choice(pool) for _ in range(count)]
+
+
+def timed(parse, dates):
+    start = time.perf_counter()
+    results = [parse(value) for value in dates]
+    return time.perf_counter() - start, results
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--records", type=int, default=100000)
+    args = parser.parse_args()
+
+    rng = random.Random(4)
+    print(f"{'workload':<16}{'legacy s':>10}{'parse_date s':>14}{'speedup':>10}")
+    for name, distinct in (("cohort (40)", 40), ("all distinct", args.records)):
+        dates = make_dates(rng, args.records, distinct)
+        legacy_s, expected = timed(legacy_parse, dates)
+        _parse_cached.cache_clear()
+        new_s, parsed = timed(lambda value: parse_date(value, False), dates)
+        if [value.date if value else None for value in parsed] != expected:
+            sys.exit(f"parse_date disagrees with the format loop on {name}")
+        print(f"{name:<16}{legacy_s:>10.3f}{new_s:>14.3f}{legacy_s / new_s:>9.1f}x")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,141 @@
+"""Benchmark: org-directory lookups of Department and Manager values.
+
+Builds a synthetic directory of employees and departments, then times
+OrgDirectory.lookup() for exact names, "J. Smith" initials, typos
+(dropped, doubled, swapped and replaced letters) and names that are not
+in the directory, next to a linear difflib scan over every name.  Reports
+the microseconds per lookup and how many typos resolve to the right
+entry.
+
+    python benchmarks/bench_directory.py --sizes 1000 10000 50000
+"""
+import argparse
+import difflib
+import os
+import random
+import statistics
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from aria.directory import DEPARTMENT, MATCH_EXACT, MATCH_FUZZY, PERSON, OrgDirectory  # noqa: E402
+from aria.employees import normalize_name  # noqa: E402
+
+FIRST = ["James", "Mary", "John", "Patricia", "Robert", "Jennifer", "Michael", "Linda", "David", "Elizabeth",
+         "William", "Barbara", "Richard", "Susan", "Joseph", "Jessica", "Thomas", "Sarah", "Omar", "Priya",
+         "Lucas", "Mei", "Aisha", "Diego", "Ken", "Ines", "Kwame", "Olga", "Ivan", "Wei", "Fatima", "Hiro",
+         "Anna", "Peter", "Maria", "Carlos", "Sofia", "Ahmed", "Chloe", "Raj", "Yuki", "Nadia", "Tom", "Lena"]
+SYLLABLES = ["ba", "ko", "ri", "son", "man", "ler", "ta", "ne", "vi", "dor", "chen", "wa", "li", "sky",
+             "ov", "ez", "berg", "ton", "ham", "ra", "mi", "zu", "ga", "del", "ro", "sa", "ki", "nu"]
+DEPARTMENTS = ["Engineering", "Finance", "Human Resources", "Sales", "Marketing", "Operations", "Legal",
+               "Customer Success", "Data Science", "Facilities", "Procurement", "Security", "Design",
+               "Product Management", "Internal Audit", "Tax", "Treasury", "Quality Assurance", "Support",
+               "Research", "Business Development", "Communications", "IT Operations", "Compliance"]
+
+
+def surname(rng):
+    return "".join(rng.choice(SYLLABLES) for _ in range(rng.randint(2, 4))).title()
+
+
+def build_employees(rng, size):
+    return [
+        {"id": f"E{i:06d}", "name": f"{rng.choice(FIRST)} {surname(rng)}", "department": rng.choice(DEPARTMENTS)}
+        for i in range(size)
+    ]
+
+
+def typo(rng, value):
+    """One dropped, doubled, swapped or replaced letter, away from the first letter"""
+    letters = list(value)
+    i = rng.randrange(1, len(letters) - 1)
+    kind = rng.randrange(4)
+    if kind == 0:
+        del letters[i]
+    elif kind == 1:
+        letters.insert(i, letters[i])
+    elif kind == 2:
+        letters[i], letters[i + 1] = letters[i + 1], letters[i]
+    else:
+        letters[i] = rng.choice("aeiourstln")
+    return "".join(letters)
+
+
+def linear_lookup(names, value):
+    """Baseline: best difflib ratio over every name"""
+    key = normalize_name(value)
+    matcher = difflib.SequenceMatcher(autojunk=False)
+    matcher.set_seq2(key)
+    best, best_ratio = None, 0.0
+    for name, entry_id in names:
+        matcher.set_seq1(name)
+        if matcher.real_quick_ratio() > best_ratio and matcher.quick_ratio() > best_ratio:
+            ratio = matcher.ratio()
+            if ratio > best_ratio:
+                best, best_ratio = entry_id, ratio
+    return best
+
+
+def timed(function, values):
+    times = []
+    results = []
+    for value in values:
+        start = time.perf_counter()
+        results.append(function(value))
+        times.append(time.perf_counter() - start)
+    return results, statistics.median(times) * 1e6, max(times) * 1e6
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--sizes", type=int, nargs="+", default=[1000, 10000, 50000])
+    parser.add_argument("--lookups", type=int, default=2000)
+    parser.add_argument("--linear-lookups", type=int, default=50, help="lookups for the linear scan baseline")
+    args = parser.parse_args()
+
+    print(f"{'employees':>10}{'build s':>9}  {'lookup':<12}{'median us':>10}{'max us':>9}{'resolved':>10}"
+          f"{'linear us':>11}")
+    for size in args.sizes:
+        rng = random.Random(size)
+        employees = build_employees(rng, size)
+        start = time.perf_counter()
+        directory = OrgDirectory(employees=employees)
+        build_s = time.perf_counter() - start
+        names = [(normalize_name(employee["name"]), employee["id"]) for employee in employees]
+
+        sample = [rng.choice(employees) for _ in range(args.lookups)]
+        cases = {
+            "exact": [(employee["name"], employee["id"]) for employee in sample],
+            "initial": [(f"{employee['name'][0]}. {employee['name'].split()[-1]}", employee["id"])
+                        for employee in sample],
+            "typo": [(typo(rng, employee["name"]), employee["id"]) for employee in sample],
+            "unknown": [(f"Zyx {surname(rng)}q", None) for _ in sample],
+            "department": [(typo(rng, department), department)
+                           for department in (rng.choice(DEPARTMENTS) for _ in sample)],
+        }
+        for case, queries in cases.items():
+            kind = DEPARTMENT if case == "department" else PERSON
+            resolutions, median_us, max_us = timed(lambda value: directory.lookup(value, kind), [q for q, _ in queries])
+            if case == "unknown":
+                resolved = sum(1 for resolution in resolutions if not resolution.resolved) / len(queries)
+            elif case == "initial":
+                # Initials are often shared; count exact hits and ambiguous lists that hold the person
+                resolved = sum(
+                    1 for resolution, (_, expected) in zip(resolutions, queries)
+                    if expected in [entry.id for entry in ([resolution.entry] if resolution.entry else resolution.candidates)]
+                ) / len(queries)
+            else:
+                resolved = sum(
+                    1 for resolution, (_, expected) in zip(resolutions, queries)
+                    if resolution.match in (MATCH_EXACT, MATCH_FUZZY) and resolution.entry.id == expected
+                ) / len(queries)
+            linear = ""
+            if case == "typo":
+                linear_queries = [q for q, _ in queries[:args.linear_lookups]]
+                _, linear_us, _ = timed(lambda value: linear_lookup(names, value), linear_queries)
+                linear = f"{linear_us:>11.0f}"
+            print(f"{size:>10,}{build_s:>9.2f}  {case:<12}{median_us:>10.1f}{max_us:>9.0f}{resolved:>10.1%}{linear}")
+
+
+if __name__ == "__main__":
+    main()
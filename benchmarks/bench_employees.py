@@ -0,0 +1,88 @@
+"""Benchmark: employee store bulk insert and duplicate lookups as it grows.
+
+Bulk-loads synthetic employees into a fresh SQLite store in steps, and at
+each size times find_duplicates() for a mix of exact email hits,
+Employee ID hits, name + start date hits and new hires.  Lookup time
+should stay flat as the store grows (three index probes per record).
+
+    python benchmarks/bench_employees.py --sizes 10000 100000 300000
+"""
+import argparse
+import datetime
+import os
+import random
+import sys
+import tempfile
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from aria.employees import EmployeeStore  # noqa: E402
+
+FIRST = ["Jane", "Omar", "Priya", "Lucas", "Mei", "Tom", "Aisha", "Diego", "Sara", "Ken"]
+LAST = ["Doe", "Haddad", "Raman", "Silva", "Chen", "Baker", "Bello", "Ortiz", "Novak", "Ito"]
+
+
+def employee(i):
+    rng = random.Random(i)
+    start = datetime.date(2018, 1, 1) + datetime.timedelta(days=rng.randint(0, 3000))
+    first, last = rng.choice(FIRST), rng.choice(LAST)
+    return {
+        "Name": f"{first} {last} {i}",
+        "Email": f"{first.lower()}.{last.lower()}.{i}@example.com",
+        "Department": "Engineering",
+        "Role": "Engineer",
+        "Start Date": start.isoformat(),
+        "Employee ID": f"EMP{i:07d}",
+    }
+
+
+def probes(rng, size, count):
+    """Records to look up: re-sent documents in various shapes, and new hires"""
+    records = []
+    for n in range(count):
+        existing = employee(rng.randrange(size))
+        kind = n % 4
+        if kind == 0:  # Same email, different case and ID missing
+            records.append({"Name": existing["Name"], "Email": existing["Email"].upper()})
+        elif kind == 1:
+            records.append({"Employee ID": existing["Employee ID"].lower(), "Name": "Someone Else"})
+        elif kind == 2:
+            start = datetime.date.fromisoformat(existing["Start Date"])
+            records.append({"Name": existing["Name"].upper(), "Start Date": start.strftime("%B %d, %Y")})
+        else:
+            records.append(employee(size + 10_000_000 + n))
+    return records
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--sizes", type=int, nargs="+", default=[10000, 100000, 300000])
+    parser.add_argument("--lookups", type=int, default=20000)
+    args = parser.parse_args()
+
+    rng = random.Random(5)
+    with tempfile.TemporaryDirectory() as workdir:
+        store = EmployeeStore(os.path.join(workdir, "employees.db"))
+        loaded = 0
+        print(f"{'employees':>10}{'insert rec/s':>14}{'lookup us':>11}{'hit rate':>10}")
+        for size in sorted(args.sizes):
+            start = time.perf_counter()
+            store.add_many(employee(i) for i in range(loaded, size))
+            insert_s = time.perf_counter() - start
+            inserted = size - loaded
+            loaded = size
+
+            records = probes(rng, size, args.lookups)
+            start = time.perf_counter()
+            hits = sum(1 for record in records if store.find_duplicates(record))
+            lookup_s = time.perf_counter() - start
+            print(
+                f"{size:>10,}{inserted / insert_s:>14,.0f}"
+                f"{lookup_s / len(records) * 1e6:>11.1f}{hits / len(records):>10.0%}"
+            )
+        store.close()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,93 @@
+"""Benchmark: ERP records/s through ErpClient against the local mock server.
+
+Starts aria.erp_mock in-process and submits synthetic employee payloads to
+each ERP flavour, one-at-a-time versus pooled and (where supported) bulk.
+Run from the repository root:
+
+    python benchmarks/bench_erp.py --records 2000 --latency-ms 20
+"""
+import argparse
+import asyncio
+import os
+import random
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from aria.erp import map_to_erp_schema  # noqa: E402
+from aria.erp_client import ADAPTERS, ErpClient  # noqa: E402
+from aria.erp_mock import MockErpServer  # noqa: E402
+
+FIRST = ["Ana", "Ben", "Chen", "Dana", "Eli", "Fatima", "Goran", "Hana", "Ivan", "Jade"]
+LAST = ["Smith", "Garcia", "Nguyen", "Okafor", "Kowalski", "Patel", "Silva", "Muller"]
+DEPARTMENTS = ["Engineering", "Finance", "Sales", "Marketing", "Operations", "Legal"]
+ROLES = ["Software Engineer", "Analyst", "Account Executive", "Designer", "Manager"]
+
+
+def make_payloads(count, seed=7):
+    rng = random.Random(seed)
+    payloads = []
+    for i in range(count):
+        name = f"{rng.choice(FIRST)} {rng.choice(LAST)}"
+        fields = {
+            "Name": name,
+            "Email": f"{name.lower().replace(' ', '.')}{i}@company.com",
+            "Department": rng.choice(DEPARTMENTS),
+            "Role": rng.choice(ROLES),
+            "Start Date": f"2026-{rng.randint(1, 12):02d}-{rng.randint(1, 28):02d}",
+            "Salary": f"${rng.randint(40, 250)},000",
+            "Manager": f"{rng.choice(FIRST)} {rng.choice(LAST)}",
+        }
+        payloads.append(map_to_erp_schema(fields))
+    return payloads
+
+
+async def run_case(server, system, payloads, connections, batch_size):
+    client = ErpClient(server.url, system, max_connections=connections, batch_size=batch_size)
+    async with client:
+        start = time.perf_counter()
+        results = await client.submit_many(payloads)
+        elapsed = time.perf_counter() - start
+    ok = sum(result["status"] == "SUCCESS" for result in results)
+    return ok, elapsed, client.stats
+
+
+async def main_async(args):
+    payloads = make_payloads(args.records)
+    server = MockErpServer(
+        latency_ms=args.latency_ms, jitter_ms=args.jitter_ms,
+        item_latency_ms=args.item_latency_ms, failure_rate=args.failure_rate, seed=1
+    )
+    async with server:
+        print(f"{len(payloads)} records, mock latency {args.latency_ms}ms "
+              f"+/-{args.jitter_ms}ms, {args.item_latency_ms}ms/bulk item, "
+              f"failure rate {args.failure_rate:.0%}")
+        print(f"{'system':<16}{'mode':<22}{'records/s':>12}{'ok':>8}{'requests':>10}{'retries':>9}")
+        for system in args.systems:
+            cases = [("sequential", 1, 1), (f"pooled x{args.connections}", args.connections, 1)]
+            if ADAPTERS[system].bulk is not None:
+                cases.append((f"bulk {args.batch_size} x{args.connections}", args.connections, args.batch_size))
+            for mode, connections, batch_size in cases:
+                # Sequential runs are slow at realistic latencies; sample them
+                sample = payloads[:max(1, len(payloads) // 10)] if connections == 1 else payloads
+                ok, elapsed, stats = await run_case(server, system, sample, connections, batch_size)
+                print(f"{system:<16}{mode:<22}{len(sample) / elapsed:>12,.0f}{ok:>8}"
+                      f"{stats['requests']:>10}{stats['retries']:>9}")
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--records", type=int, default=2000)
+    parser.add_argument("--connections", type=int, default=32)
+    parser.add_argument("--batch-size", type=int, default=100)
+    parser.add_argument("--latency-ms", type=float, default=20.0)
+    parser.add_argument("--jitter-ms", type=float, default=5.0)
+    parser.add_argument("--item-latency-ms", type=float, default=0.2)
+    parser.add_argument("--failure-rate", type=float, default=0.02)
+    parser.add_argument("--systems", nargs="+", default=list(ADAPTERS), choices=list(ADAPTERS))
+    asyncio.run(main_async(parser.parse_args()))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,101 @@
+"""Benchmark: cost and effect of per-document budgets (aria.governor).
+
+Times a synthetic corpus (see benchmarks/corpus.py) through
+process_document without budgets, with the default budgets and isolated
+in a Sandbox child, to show what the page-by-page checks and the
+isolation cost per document.  Then feeds pathological documents (a PDF
+with thousands of pages and no fields, a DOCX with tens of megabytes of
+text, and a parser stuck in a single call) through the isolated pipeline
+under small budgets and reports how long each took to be cut off.
+
+    python benchmarks/bench_governor.py --docs 60 --pages 2000 --seconds 2
+"""
+import argparse
+import os
+import sys
+import tempfile
+import time
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+
+import corpus  # noqa: E402
+from aria.governor import DocumentBudget, Sandbox  # noqa: E402
+from aria.pipeline import process_document, process_isolated  # noqa: E402
+
+FILLER = ("This page intentionally repeats boilerplate terms and conditions that carry no "
+          "new hire details whatsoever, to keep the extractor reading. ") * 6
+
+
+def stuck_parser(seconds):
+    """Stands in for a parser call that never returns"""
+    time.sleep(seconds)
+
+
+def throughput(process, paths, budget):
+    start = time.perf_counter()
+    statuses = [process(path, budget=budget)["status"] for path in paths]
+    return len(paths) / (time.perf_counter() - start), statuses
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--docs", type=int, default=60)
+    parser.add_argument("--pages", type=int, default=2000, help="pages of the oversized PDF")
+    parser.add_argument("--docx-mb", type=int, default=40, help="text in the oversized DOCX")
+    parser.add_argument("--seconds", type=float, default=2.0, help="time budget for the pathological documents")
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as workdir:
+        corpus_dir = os.path.join(workdir, "corpus")
+        manifest = corpus.generate(corpus_dir, docs=args.docs)
+        paths = [os.path.join(corpus_dir, document["file"]) for document in manifest["documents"]]
+
+        # Warm the parsers and scanners once so no mode pays for them
+        for path in paths:
+            process_document(path, budget=DocumentBudget.unlimited())
+        print(f"{len(paths)} corpus documents")
+        print(f"{'mode':<22}{'docs/s':>9}{'ms/doc':>9}{'overhead':>10}")
+        baseline = None
+        for label, process, budget in [
+            ("no budget", process_document, DocumentBudget.unlimited()),
+            ("default budget", process_document, DocumentBudget.from_env()),
+            ("isolated", process_isolated, DocumentBudget.from_env()),
+        ]:
+            rate, statuses = throughput(process, paths, budget)
+            baseline = baseline or rate
+            if set(statuses) - {"ok", "invalid"}:
+                sys.exit(f"{label}: unexpected statuses {sorted(set(statuses))}")
+            print(f"{label:<22}{rate:>9.1f}{1000 / rate:>9.2f}{1000 / rate - 1000 / baseline:>+9.2f}ms")
+
+        long_pdf = os.path.join(workdir, "long.pdf")
+        corpus.write_pdf(long_pdf, [[("para", FILLER)]] * args.pages)
+        huge_docx = os.path.join(workdir, "huge.docx")
+        paragraphs = args.docx_mb * 2**20 // len(FILLER)
+        corpus.write_docx(huge_docx, [[("para", FILLER)] * 2000] * max(1, paragraphs // 2000))
+
+        budget = DocumentBudget(max_pages=1000, max_chars=5_000_000, max_seconds=args.seconds,
+                                max_memory_bytes=512 * 2**20)
+        print(f"\npathological documents, {budget}")
+        print(f"{'document':<22}{'MB':>7}{'status':>10}{'limit':>9}{'pages':>8}{'parse s':>9}{'seconds':>9}")
+        for label, path in [("long PDF", long_pdf), ("huge DOCX", huge_docx)]:
+            start = time.perf_counter()
+            record = process_isolated(path, budget=budget)
+            elapsed = time.perf_counter() - start
+            print(f"{label:<22}{os.path.getsize(path) / 2**20:>7.1f}{record['status']:>10}"
+                  f"{record.get('budget', {}).get('exceeded', '-'):>9}{record.get('pages_read', 0):>8}"
+                  f"{record['timings']['total_s']:>9.2f}{elapsed:>9.2f}")
+
+        sandbox = Sandbox()
+        start = time.perf_counter()
+        record = sandbox.run(stuck_parser, (3600,), budget, "stuck")
+        elapsed = time.perf_counter() - start
+        print(f"{'stuck parser':<22}{'':>7}{record['status']:>10}{record['budget']['exceeded']:>9}{'':>17}{elapsed:>9.2f}")
+        start = time.perf_counter()
+        sandbox.run(stuck_parser, (0,), budget, "next")
+        print(f"first call after the kill (new child): {(time.perf_counter() - start) * 1000:.1f} ms")
+        sandbox.close()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,93 @@
+"""Benchmark: peak resident memory of the ingestion paths.
+
+Builds a large PDF with PyMuPDF (N pages of form text) and parses it
+once per mode, each in a fresh interpreter so the RSS numbers do not
+leak between runs:
+
+* disk-read: the old pipeline path, ``fitz.open(stream=f.read())``
+* disk-path: ``iter_document_text(path, ...)``, MuPDF reads the file
+* upload-read: the old upload path, ``file.read()`` on a BytesIO
+* upload-shared: ``iter_document_text(bytes_io, ...)`` via getvalue()
+
+    python benchmarks/bench_ingest_memory.py --pages 2000
+"""
+import argparse
+import io
+import json
+import os
+import subprocess
+import sys
+import tempfile
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+
+MODES = ["disk-read", "disk-path", "upload-read", "upload-shared"]
+
+
+def build_pdf(path, pages):
+    import fitz
+
+    doc = fitz.open()
+    for i in range(pages):
+        page = doc.new_page()
+        page.insert_text((72, 72), f"Full Name: Employee {i}\nEmail: e{i}@example.com\n" + "lorem ipsum " * 200)
+    doc.save(path)
+    doc.close()
+
+
+def run_mode(mode, path):
+    """Parse path in this process and print the MemoryWatch sample as JSON"""
+    import fitz
+
+    from aria.ingest import iter_document_text
+    from aria.metrics import MemoryWatch
+
+    upload = None
+    if mode.startswith("upload"):
+        with open(path, "rb") as source:
+            upload = io.BytesIO(source.read())
+    with MemoryWatch() as watch:
+        if mode == "disk-read":
+            with open(path, "rb") as source:
+                doc = fitz.open(stream=source.read(), filetype="pdf")
+            chars = sum(len(page.get_text()) for page in doc)
+            doc.close()
+        elif mode == "upload-read":
+            doc = fitz.open(stream=upload.read(), filetype="pdf")
+            chars = sum(len(page.get_text()) for page in doc)
+            doc.close()
+        else:
+            source = path if mode == "disk-path" else upload
+            chars = sum(len(text) for text in iter_document_text(source, "bench.pdf"))
+    print(json.dumps(dict(watch.as_dict(), chars=chars)))
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--pages", type=int, default=2000)
+    parser.add_argument("--mode", choices=MODES, help=argparse.SUPPRESS)
+    parser.add_argument("--path", help=argparse.SUPPRESS)
+    args = parser.parse_args()
+
+    if args.mode:
+        run_mode(args.mode, args.path)
+        return
+
+    with tempfile.TemporaryDirectory() as workdir:
+        path = os.path.join(workdir, "bench.pdf")
+        build_pdf(path, args.pages)
+        size = os.path.getsize(path)
+        print(f"{args.pages} pages, {size / 2**20:.1f} MB")
+        print(f"{'mode':<16}{'peak RSS MB':>12}{'growth MB':>12}")
+        for mode in MODES:
+            output = subprocess.run(
+                [sys.executable, __file__, "--mode", mode, "--path", path],
+                check=True, capture_output=True, text=True, cwd=ROOT,
+            ).stdout
+            sample = json.loads(output)
+            print(f"{mode:<16}{sample['rss_peak_bytes'] / 2**20:>12.1f}{sample['rss_growth_bytes'] / 2**20:>12.1f}")
+
+
+if __name__ == "__main__":
+    main()
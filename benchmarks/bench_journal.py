@@ -0,0 +1,89 @@
+"""Benchmark: batch journal overhead and resume speed (aria.journal).
+
+Appends the three stage entries per document that run_batch writes, using
+a real pipeline record as the payload, under several write/fsync
+cadences and reports entries and documents per second.  Then replays the
+journal the way a resumed run opens it, and times run_batch over a
+synthetic corpus (see benchmarks/corpus.py) without a journal, with one,
+and resumed from it.
+
+    python benchmarks/bench_journal.py --documents 20000 --docs 200
+"""
+import argparse
+import io
+import os
+import sys
+import tempfile
+import time
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+
+import corpus  # noqa: E402
+from aria.journal import EXTRACTED, STORED, VALIDATED, Journal  # noqa: E402
+from aria.pipeline import VALIDATED_KEYS, process_document, run_batch  # noqa: E402
+
+CADENCES = [
+    ("fsync every entry", 1, 0.0),
+    ("batch 256, fsync each", 256, 0.0),
+    ("batch 256, fsync 1s", 256, 1.0),
+    ("batch 256, no fsync", 256, -1),
+]
+
+
+def write_journal(path, documents, record, batch, fsync_s):
+    validated = {key: record[key] for key in VALIDATED_KEYS if key in record}
+    start = time.perf_counter()
+    with Journal(path, batch=batch, fsync_s=fsync_s) as journal:
+        for i in range(documents):
+            key = f"{i:064x}"
+            journal.record(key, EXTRACTED, record["file"], record)
+            journal.record(key, VALIDATED, record["file"], validated)
+            journal.record(key, STORED, record["file"])
+        stats = dict(journal.stats)
+    return time.perf_counter() - start, stats
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--documents", type=int, default=20000, help="documents journaled per cadence")
+    parser.add_argument("--docs", type=int, default=200, help="corpus documents for the run_batch timings")
+    parser.add_argument("--workers", type=int, default=1)
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as workdir:
+        corpus_dir = os.path.join(workdir, "corpus")
+        manifest = corpus.generate(corpus_dir, docs=args.docs)
+        paths = [os.path.join(corpus_dir, document["file"]) for document in manifest["documents"]]
+        record = process_document(paths[0])
+        record["metrics"].pop("patterns", None)
+
+        print(f"{args.documents:,} documents x 3 entries")
+        print(f"{'cadence':<24}{'entries/s':>11}{'docs/min':>12}{'us/doc':>9}{'writes':>8}{'fsyncs':>8}")
+        journal_path = None
+        for label, batch, fsync_s in CADENCES:
+            path = os.path.join(workdir, f"{batch}-{fsync_s}.journal")
+            documents = args.documents if batch > 1 else min(args.documents, 2000)
+            elapsed, stats = write_journal(path, documents, record, batch, fsync_s)
+            print(f"{label:<24}{3 * documents / elapsed:>11,.0f}{60 * documents / elapsed:>12,.0f}"
+                  f"{elapsed / documents * 1e6:>9.1f}{stats['writes']:>8}{stats['fsyncs']:>8}")
+            journal_path = journal_path or (path if batch > 1 else None)
+
+        start = time.perf_counter()
+        journal = Journal(journal_path, read_only=True)
+        replay_s = time.perf_counter() - start
+        print(f"replay: {len(journal):,} documents from {os.path.getsize(journal_path) / 2**20:.1f} MB "
+              f"in {replay_s:.2f}s ({len(journal) / replay_s:,.0f} docs/s)")
+
+        print(f"\nrun_batch over {len(paths)} corpus documents, {args.workers} worker(s)")
+        run_path = os.path.join(workdir, "run.journal")
+        for label in ("no journal", "journal", "resumed"):
+            journal = Journal(run_path) if label != "no journal" else None
+            summary = run_batch(paths, io.StringIO(), workers=args.workers, journal=journal)
+            if journal is not None:
+                journal.close()
+            print(f"{label:<24}{summary['docs_per_s']:>11,.1f} docs/s{summary['resumed']:>8} resumed")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,135 @@
+"""Load test: requests/s and latency of the HTTP extraction service.
+
+Starts ``python -m aria.service`` on a free localhost port (or targets
+--url), then for each concurrency level keeps that many keep-alive
+connections busy posting documents from a synthetic corpus (see
+benchmarks/corpus.py) to /extract.  Reports completed requests per second,
+latency percentiles of completed requests and how many were turned away
+with 429 once the worker queue was full.
+
+    python benchmarks/bench_service.py --requests 400 --concurrency 1 4 16 64 --workers 4 --queue 16
+"""
+import argparse
+import asyncio
+import json
+import os
+import socket
+import subprocess
+import sys
+import tempfile
+import time
+import urllib.request
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+
+import corpus  # noqa: E402
+from aria.erp_client import HttpConnectionPool  # noqa: E402
+
+
+def free_port():
+    with socket.socket() as probe:
+        probe.bind(("127.0.0.1", 0))
+        return probe.getsockname()[1]
+
+
+def wait_until_up(url, timeout=30.0):
+    deadline = time.monotonic() + timeout
+    while True:
+        try:
+            with urllib.request.urlopen(f"{url}/healthz", timeout=1) as response:
+                return json.load(response)
+        except OSError:
+            if time.monotonic() > deadline:
+                raise
+            time.sleep(0.1)
+
+
+def percentile(ordered, q):
+    return ordered[min(len(ordered) - 1, int(round(q * (len(ordered) - 1))))] if ordered else 0.0
+
+
+async def load(url, documents, requests, concurrency):
+    """Send requests documents over concurrency connections; returns (elapsed, latencies, statuses)"""
+    sent = 0
+    latencies = []
+    statuses = {}
+
+    async def connection():
+        nonlocal sent
+        pool = HttpConnectionPool(url, max_connections=1, timeout=120)
+        try:
+            while sent < requests:
+                filename, data = documents[sent % len(documents)]
+                sent += 1
+                start = time.perf_counter()
+                response = await pool.request(
+                    "POST", f"/extract?filename={filename}", data, {"Content-Type": "application/octet-stream"}
+                )
+                elapsed = time.perf_counter() - start
+                statuses[response.status] = statuses.get(response.status, 0) + 1
+                if response.status != 429:
+                    latencies.append(elapsed)
+        finally:
+            await pool.close()
+
+    start = time.perf_counter()
+    await asyncio.gather(*(connection() for _ in range(concurrency)))
+    return time.perf_counter() - start, sorted(latencies), statuses
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--url", help="test a running service instead of starting one")
+    parser.add_argument("--requests", type=int, default=400, help="requests per concurrency level")
+    parser.add_argument("--concurrency", type=int, nargs="+", default=[1, 4, 16, 64])
+    parser.add_argument("--workers", type=int, default=4)
+    parser.add_argument("--queue", type=int, default=16)
+    parser.add_argument("--docs", type=int, default=40, help="distinct corpus documents to cycle through")
+    parser.add_argument("--formats", nargs="+", choices=corpus.FORMATS, default=corpus.FORMATS)
+    parser.add_argument("--max-pages", type=int, default=6)
+    args = parser.parse_args()
+
+    server = None
+    with tempfile.TemporaryDirectory() as workdir:
+        manifest = corpus.generate(workdir, args.docs, seed=11, formats=args.formats, max_pages=args.max_pages)
+        documents = []
+        for document in manifest["documents"]:
+            with open(os.path.join(workdir, document["file"]), "rb") as source:
+                documents.append((document["file"], source.read()))
+
+        url = args.url
+        if url is None:
+            port = free_port()
+            url = f"http://127.0.0.1:{port}"
+            server = subprocess.Popen(
+                [sys.executable, "-m", "aria.service", "--port", str(port),
+                 "--workers", str(args.workers), "--queue", str(args.queue)],
+                cwd=ROOT, stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL,
+            )
+        try:
+            health = wait_until_up(url)
+            print(f"{url}: {health['workers']} workers, queue limit {health['queue_limit']}, "
+                  f"{len(documents)} documents ({sum(len(data) for _, data in documents) / 2**20:.1f} MB)")
+            # Warm the workers (imports, compiled patterns) outside the measurement
+            asyncio.run(load(url, documents, health["workers"] * 2, health["workers"]))
+
+            print(f"{'conns':>6}{'req/s':>9}{'p50 ms':>9}{'p95 ms':>9}{'p99 ms':>9}{'429s':>7}{'errors':>8}")
+            for concurrency in args.concurrency:
+                elapsed, latencies, statuses = asyncio.run(load(url, documents, args.requests, concurrency))
+                completed = len(latencies)
+                rejected = statuses.get(429, 0)
+                errors = sum(count for status, count in statuses.items() if status not in (200, 429))
+                print(
+                    f"{concurrency:>6}{completed / elapsed:>9.1f}"
+                    f"{percentile(latencies, 0.50) * 1000:>9.1f}{percentile(latencies, 0.95) * 1000:>9.1f}"
+                    f"{percentile(latencies, 0.99) * 1000:>9.1f}{rejected:>7}{errors:>8}"
+                )
+        finally:
+            if server is not None:
+                server.terminate()
+                server.wait()
+
+
+if __name__ == "__main__":
+    main()
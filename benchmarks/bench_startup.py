@@ -0,0 +1,123 @@
+"""Benchmark: app cold start and per-rerun script time.
+
+Runs app.py with Streamlit's AppTest in a fresh interpreter per sample.
+The first run of each interpreter is the cold start a newly scaled-up
+container pays: importing aria, building cached resources and the first
+render.  The runs after it are what every widget interaction costs.
+Script times come from the app's own "script_run" metric (exported
+through $ARIA_METRICS_EXPORT), as AppTest itself polls for completion in
+100 ms steps.  Also reports how many markdown elements a run sends and
+whether the document parsers were loaded before any upload.
+
+    python benchmarks/bench_startup.py --samples 5 --reruns 20
+"""
+import argparse
+import ast
+import importlib
+import importlib.util
+import json
+import os
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+APP = os.path.join(ROOT, "app.py")
+PARSERS = ["fitz", "lxml.etree", "docx"]
+
+
+def app_imports():
+    """The aria modules app.py imports at the top level"""
+    with open(APP, encoding="utf-8") as source:
+        tree = ast.parse(source.read())
+    modules = []
+    for node in tree.body:
+        if isinstance(node, ast.ImportFrom) and node.module and node.module.split(".")[0] == "aria":
+            modules.append(node.module)
+        elif isinstance(node, ast.Import):
+            modules.extend(alias.name for alias in node.names if alias.name.split(".")[0] == "aria")
+    return modules
+
+
+def script_run_total(export_path):
+    with open(export_path, encoding="utf-8") as export:
+        return json.load(export)["stages"]["script_run"]["wall_s_total"]
+
+
+def run_sample(reruns):
+    """One interpreter: cold run then warm reruns, printed as JSON"""
+    sys.path.insert(0, ROOT)
+    # The Streamlit server is loaded before the first script run in production too
+    from streamlit.testing.v1 import AppTest
+
+    with tempfile.TemporaryDirectory() as workdir:
+        export_path = os.environ["ARIA_METRICS_EXPORT"] = os.path.join(workdir, "metrics.json")
+
+        start = time.perf_counter()
+        for module in app_imports():
+            importlib.import_module(module)
+        imports_s = time.perf_counter() - start
+
+        app = AppTest.from_file(APP, default_timeout=60).run()
+        if app.exception:
+            sys.exit(f"app.py raised: {app.exception[0].value}")
+        first_run_s = total = script_run_total(export_path)
+        parsers = [module for module in PARSERS if module in sys.modules]
+
+        rerun_s = []
+        for _ in range(reruns):
+            # A fresh session each time: the script's own work is measured,
+            # not widget state round trips
+            AppTest.from_file(APP, default_timeout=60).run()
+            new_total = script_run_total(export_path)
+            rerun_s.append(new_total - total)
+            total = new_total
+
+    print(json.dumps({
+        "imports_s": imports_s,
+        "first_run_s": first_run_s,
+        "rerun_s": rerun_s,
+        "parsers": parsers,
+        "markdown": len(app.markdown),
+    }))
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--samples", type=int, default=5, help="fresh interpreters (cold starts)")
+    parser.add_argument("--reruns", type=int, default=20, help="warm runs per interpreter")
+    parser.add_argument("--sample", action="store_true", help=argparse.SUPPRESS)
+    args = parser.parse_args()
+
+    if args.sample:
+        run_sample(args.reruns)
+        return
+    if importlib.util.find_spec("streamlit") is None:
+        sys.exit("streamlit is required (pip install -r requirements.txt)")
+
+    samples = []
+    for _ in range(args.samples):
+        output = subprocess.run(
+            [sys.executable, __file__, "--sample", "--reruns", str(args.reruns)],
+            check=True, capture_output=True, text=True, cwd=ROOT,
+        ).stdout
+        samples.append(json.loads(output.splitlines()[-1]))
+
+    imports = [sample["imports_s"] * 1000 for sample in samples]
+    first = [sample["first_run_s"] * 1000 for sample in samples]
+    cold = [a + b for a, b in zip(imports, first)]
+    reruns = sorted(run * 1000 for sample in samples for run in sample["rerun_s"])
+    print(f"{'':<22}{'median ms':>10}{'max ms':>10}")
+    print(f"{'aria imports':<22}{statistics.median(imports):>10.1f}{max(imports):>10.1f}")
+    print(f"{'first script run':<22}{statistics.median(first):>10.1f}{max(first):>10.1f}")
+    print(f"{'cold start':<22}{statistics.median(cold):>10.1f}{max(cold):>10.1f}")
+    print(f"{'rerun script time':<22}{statistics.median(reruns):>10.2f}{reruns[-1]:>10.2f}"
+          f"   (p95 {reruns[int(0.95 * (len(reruns) - 1))]:.2f})")
+    print(f"markdown elements per run: {samples[-1]['markdown']}")
+    print(f"parsers loaded before any upload: {', '.join(samples[-1]['parsers']) or 'none'}")
+
+
+if __name__ == "__main__":
+    main()
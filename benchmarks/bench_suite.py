@@ -0,0 +1,351 @@
+"""Benchmark suite: per-stage and end-to-end performance on a synthetic corpus.
+
+Runs every document of a corpus (see benchmarks/corpus.py) through the
+three stages the app runs for an upload, and through the headless
+pipeline end to end:
+
+    extract     aria.ingest.extract_text (ai_extract_text)
+    analyze     aria.pipeline.analyze_text (ai_analyze_and_extract)
+    validate    aria.validation.validate_fields (ai_validate_data)
+    end_to_end  aria.pipeline.process_document (streamed extract + analyze, validate)
+
+For each stage it reports throughput (documents, pages and MB per
+second), latency percentiles and CPU time over --repeat timed passes, and
+in one separate pass the peak RSS growth and peak Python allocations
+(tracemalloc) per document, so the memory probes never skew the timings.
+Extraction accuracy against the corpus ground truth is scored too, as a
+speed-up that loses fields is not one.
+
+Results are written as sorted, indented JSON so two runs diff cleanly,
+and --compare prints the change against an earlier run:
+
+    python benchmarks/bench_suite.py --docs 200 --output before.json
+    python benchmarks/bench_suite.py --docs 200 --output after.json --compare before.json
+    python benchmarks/bench_suite.py --compare before.json after.json
+"""
+import argparse
+import datetime
+import json
+import os
+import platform
+import re
+import subprocess
+import sys
+import tempfile
+import time
+import tracemalloc
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+
+import corpus  # noqa: E402
+from aria.extraction import NOT_FOUND  # noqa: E402
+from aria.ingest import extract_text  # noqa: E402
+from aria.metrics import MemoryWatch, Stopwatch  # noqa: E402
+from aria.pipeline import analyze_text, process_document  # noqa: E402
+from aria.validation import validate_fields  # noqa: E402
+
+RESULTS_FORMAT = 1
+STAGES = ["extract", "analyze", "validate", "end_to_end"]
+PERCENTILES = {"p50": 0.5, "p90": 0.9, "p95": 0.95, "p99": 0.99}
+WARMUP_DOCS = 5
+# Metrics shown by --compare: (stage key path, label, True if higher is
+# better, smallest absolute change that can count as a regression).  RSS
+# moves in whole pages, so small growth changes are noise.
+COMPARED = [
+    (("docs_per_s",), "docs/s", True, 0),
+    (("latency_ms", "p50"), "p50 ms", False, 0),
+    (("latency_ms", "p95"), "p95 ms", False, 0),
+    (("latency_ms", "p99"), "p99 ms", False, 0),
+    (("memory", "rss_growth_bytes", "max"), "RSS growth max", False, 2**20),
+    (("memory", "py_peak_bytes", "p95"), "py peak p95", False, 2**16),
+]
+_NORMALIZE = re.compile(r"[\s$,]")
+
+
+def percentiles(samples):
+    ordered = sorted(samples)
+    if not ordered:
+        return {}
+    summary = {
+        name: ordered[min(len(ordered) - 1, int(round(q * (len(ordered) - 1))))]
+        for name, q in PERCENTILES.items()
+    }
+    summary["max"] = ordered[-1]
+    summary["mean"] = sum(ordered) / len(ordered)
+    return summary
+
+
+class Stages:
+    """The four benchmarked stages for one document"""
+
+    def __init__(self, corpus_dir, document, today, layout):
+        self.path = os.path.join(corpus_dir, document["file"])
+        self.filename = document["file"]
+        self.today = today
+        self.layout = layout
+        self.text = None
+        self.fields = None
+        self.confidence = None
+
+    def extract(self):
+        self.text = extract_text(self.path, self.filename)
+
+    def analyze(self):
+        self.fields, self.confidence = analyze_text(self.text)
+
+    def validate(self):
+        validate_fields(self.fields, self.confidence, today=self.today)
+
+    def end_to_end(self):
+        record = process_document(self.path, layout=self.layout)
+        if record["status"] == "error":
+            raise RuntimeError(record["error"])
+        return record
+
+
+def timing_pass(runs, samples):
+    """Time every stage of every document once, appending (wall, cpu) samples"""
+    for stages in runs:
+        for stage in STAGES:
+            with Stopwatch() as watch:
+                getattr(stages, stage)()
+            samples[stage].append((watch.wall_s, watch.cpu_s))
+
+
+def memory_pass(runs):
+    """Peak RSS growth and peak traced Python allocations per stage and document"""
+    memory = {stage: {"rss_growth_bytes": [], "py_peak_bytes": []} for stage in STAGES}
+    for stages in runs:
+        for stage in STAGES:
+            tracemalloc.start()
+            try:
+                with MemoryWatch() as watch:
+                    getattr(stages, stage)()
+                _, py_peak = tracemalloc.get_traced_memory()
+            finally:
+                tracemalloc.stop()
+            memory[stage]["py_peak_bytes"].append(py_peak)
+            memory[stage]["rss_growth_bytes"].append(watch.as_dict().get("rss_growth_bytes", 0))
+    return memory
+
+
+def normalize(value):
+    return _NORMALIZE.sub("", value).casefold()
+
+
+def score(manifest, runs):
+    """Per-field accuracy of the analyze stage against the corpus ground truth"""
+    fields = {}
+    by_layout = {}
+    perfect = 0
+    for document, stages in zip(manifest["documents"], runs):
+        truth = document["fields"]
+        correct_fields = 0
+        for field, found in stages.fields.items():
+            counts = fields.setdefault(field, {"expected": 0, "correct": 0, "false_positive": 0})
+            expected = truth.get(field)
+            if expected is None:
+                counts["false_positive"] += found != NOT_FOUND
+                correct_fields += found == NOT_FOUND
+                continue
+            counts["expected"] += 1
+            if found != NOT_FOUND and normalize(found) == normalize(expected):
+                counts["correct"] += 1
+                correct_fields += 1
+        layout = by_layout.setdefault(f"{document['format']}/{document['layout']}", {"documents": 0, "perfect": 0})
+        layout["documents"] += 1
+        if correct_fields == len(stages.fields):
+            perfect += 1
+            layout["perfect"] += 1
+    for counts in fields.values():
+        counts["accuracy"] = round(counts["correct"] / counts["expected"], 4) if counts["expected"] else None
+    return {"documents_perfect": perfect, "by_layout": by_layout, "fields": fields}
+
+
+def summarize(samples, memory, documents, repeat):
+    pages = sum(document["pages"] for document in documents) * repeat
+    size = sum(document["bytes"] for document in documents) * repeat
+    stages = {}
+    for stage in STAGES:
+        wall = sum(sample[0] for sample in samples[stage])
+        cpu = sum(sample[1] for sample in samples[stage])
+        latency = percentiles(sample[0] * 1000 for sample in samples[stage])
+        stages[stage] = {
+            "documents": len(samples[stage]),
+            "wall_s": round(wall, 6),
+            "cpu_s": round(cpu, 6),
+            "docs_per_s": round(len(samples[stage]) / wall, 3) if wall else None,
+            "pages_per_s": round(pages / wall, 3) if wall else None,
+            "mb_per_s": round(size / 2**20 / wall, 3) if wall else None,
+            "latency_ms": {name: round(value, 4) for name, value in latency.items()},
+            "memory": {
+                measure: {name: int(value) for name, value in percentiles(values).items()}
+                for measure, values in memory[stage].items()
+            },
+        }
+    return stages
+
+
+def _git(*args):
+    try:
+        return subprocess.run(["git", *args], cwd=ROOT, capture_output=True, text=True, check=True).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return None
+
+
+def environment():
+    versions = {}
+    for module in ("fitz", "lxml", "docx"):
+        try:
+            imported = __import__(module)
+        except ImportError:
+            versions[module] = None
+        else:
+            versions[module] = getattr(imported, "VersionBind", None) or getattr(imported, "__version__", "unknown")
+    status = _git("status", "--porcelain", "--", "aria", "app.py")
+    return {
+        "python": platform.python_version(),
+        "implementation": platform.python_implementation(),
+        "platform": platform.platform(),
+        "cpu_count": os.cpu_count(),
+        "git_commit": _git("rev-parse", "HEAD"),
+        "git_dirty": bool(status) if status is not None else None,
+        "packages": versions,
+    }
+
+
+def run(corpus_dir, repeat, layout):
+    manifest = corpus.load(corpus_dir)
+    documents = manifest["documents"]
+    today = datetime.date.fromisoformat(manifest["reference_date"])
+    runs = [Stages(corpus_dir, document, today, layout) for document in documents]
+
+    # Imports, compiled patterns and date memos are warm before timing
+    timing_pass(runs[:WARMUP_DOCS], {stage: [] for stage in STAGES})
+    samples = {stage: [] for stage in STAGES}
+    for _ in range(repeat):
+        timing_pass(runs, samples)
+    memory = memory_pass(runs)
+
+    return {
+        "format": RESULTS_FORMAT,
+        "created": datetime.datetime.now(datetime.timezone.utc).isoformat(timespec="seconds"),
+        "environment": environment(),
+        "config": {"repeat": repeat, "layout": layout, "warmup_docs": WARMUP_DOCS},
+        "corpus": {
+            "params": manifest["params"],
+            "sha256": manifest["sha256"],
+            "documents": len(documents),
+            "pages": sum(document["pages"] for document in documents),
+            "bytes": sum(document["bytes"] for document in documents),
+        },
+        "stages": summarize(samples, memory, documents, repeat),
+        "accuracy": score(manifest, runs),
+    }
+
+
+def _lookup(tree, keys):
+    for key in keys:
+        if not isinstance(tree, dict) or key not in tree:
+            return None
+        tree = tree[key]
+    return tree
+
+
+def _number(value):
+    return f"{value:,.0f}" if abs(value) >= 1000 else f"{value:.3f}"
+
+
+def compare(base, current, threshold):
+    """Print per-stage changes; returns the number of regressions beyond threshold percent"""
+    if base["corpus"]["sha256"] != current["corpus"]["sha256"]:
+        print("warning: the runs used different corpora; numbers are not directly comparable")
+    regressions = 0
+    print(f"{'stage':<12}{'metric':<16}{'base':>14}{'current':>14}{'change':>10}")
+    for stage in STAGES:
+        for keys, label, higher_is_better, noise_floor in COMPARED:
+            before = _lookup(base["stages"].get(stage), keys)
+            after = _lookup(current["stages"].get(stage), keys)
+            if not before or after is None:
+                continue
+            change = (after - before) / before * 100
+            worse = -change if higher_is_better else change
+            flag = ""
+            if worse > threshold and abs(after - before) >= noise_floor:
+                flag = "  REGRESSION"
+                regressions += 1
+            print(f"{stage:<12}{label:<16}{_number(before):>14}{_number(after):>14}{change:>+9.1f}%{flag}")
+    before = base["accuracy"]["documents_perfect"]
+    after = current["accuracy"]["documents_perfect"]
+    print(f"{'accuracy':<12}{'perfect docs':<16}{before:>14}{after:>14}")
+    if after < before:
+        regressions += 1
+    return regressions
+
+
+def report(results):
+    corpus_info = results["corpus"]
+    print(f"{corpus_info['documents']} documents, {corpus_info['pages']} pages, "
+          f"{corpus_info['bytes'] / 2**20:.1f} MB, {results['config']['repeat']} timed pass(es)")
+    print(f"{'stage':<12}{'docs/s':>10}{'pages/s':>10}{'MB/s':>9}{'p50 ms':>9}{'p95 ms':>9}"
+          f"{'p99 ms':>9}{'RSS +MB':>9}{'py MB':>8}")
+    for stage, summary in results["stages"].items():
+        latency = summary["latency_ms"]
+        memory = summary["memory"]
+        print(
+            f"{stage:<12}{summary['docs_per_s']:>10,.1f}{summary['pages_per_s']:>10,.1f}"
+            f"{summary['mb_per_s']:>9.2f}{latency['p50']:>9.3f}{latency['p95']:>9.3f}{latency['p99']:>9.3f}"
+            f"{memory['rss_growth_bytes']['max'] / 2**20:>9.1f}{memory['py_peak_bytes']['max'] / 2**20:>8.1f}"
+        )
+    accuracy = results["accuracy"]
+    print(f"documents with every field right: {accuracy['documents_perfect']}/{corpus_info['documents']}")
+    for field, counts in sorted(accuracy["fields"].items()):
+        rate = "-" if counts["accuracy"] is None else f"{counts['accuracy']:.1%}"
+        print(f"  {field:<12}{rate:>8}  ({counts['false_positive']} false positives)")
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--corpus", help="existing corpus directory (default: generate one in a temp dir)")
+    parser.add_argument("--docs", type=int, default=100, help="documents to generate")
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--formats", nargs="+", choices=corpus.FORMATS, default=corpus.FORMATS)
+    parser.add_argument("--max-pages", type=int, default=12)
+    parser.add_argument("--repeat", type=int, default=3, help="timed passes over the corpus")
+    parser.add_argument("--layout", action="store_true", help="end_to_end reads PDFs with aria.layout")
+    parser.add_argument("-o", "--output", help="write the results JSON here")
+    parser.add_argument("--compare", nargs="+", metavar="RESULTS",
+                        help="BASE to compare this run against, or BASE CURRENT to compare two saved runs")
+    parser.add_argument("--threshold", type=float, default=10.0,
+                        help="percent change counted as a regression (default 10)")
+    args = parser.parse_args()
+    if args.compare and len(args.compare) > 2:
+        parser.error("--compare takes BASE or BASE CURRENT")
+
+    if args.compare and len(args.compare) == 2:
+        with open(args.compare[0], encoding="utf-8") as base, open(args.compare[1], encoding="utf-8") as current:
+            sys.exit(1 if compare(json.load(base), json.load(current), args.threshold) else 0)
+
+    started = time.perf_counter()
+    with tempfile.TemporaryDirectory() as workdir:
+        corpus_dir = args.corpus
+        if corpus_dir is None:
+            corpus_dir = os.path.join(workdir, "corpus")
+            corpus.generate(corpus_dir, args.docs, args.seed, args.formats, args.max_pages)
+        results = run(corpus_dir, args.repeat, args.layout)
+    results["suite_s"] = round(time.perf_counter() - started, 3)
+
+    report(results)
+    if args.output:
+        with open(args.output, "w", encoding="utf-8") as handle:
+            json.dump(results, handle, indent=2, sort_keys=True)
+            handle.write("\n")
+    if args.compare:
+        with open(args.compare[0], encoding="utf-8") as base:
+            print()
+            sys.exit(1 if compare(json.load(base), results, args.threshold) else 0)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,72 @@
+"""Benchmark: per-record validate_fields vs columnar validate_batch.
+
+Generates synthetic extracted records (a cohort sharing a few dozen start
+dates, assorted salaries, some personal emails and missing fields) and
+checks that both paths agree before timing them.
+
+    python benchmarks/bench_validation.py --sizes 10000 100000
+"""
+import argparse
+import datetime
+import os
+import random
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from aria.batch_validation import validate_batch  # noqa: E402
+from aria.extraction import NOT_FOUND  # noqa: E402
+from aria.validation import validate_fields  # noqa: E402
+
+TODAY = datetime.date(2026, 1, 15)
+DATE_STYLES = ["%Y-%m-%d", "%m/%d/%Y", "%B %d, %Y", "%m-%d-%Y"]
+
+
+def make_records(count, seed=3):
+    rng = random.Random(seed)
+    start_dates = []
+    for _ in range(40):
+        day = TODAY + datetime.timedelta(days=rng.randint(-30, 150))
+        start_dates.append(day.strftime(rng.choice(DATE_STYLES)))
+    start_dates += ["next Monday", "Q3 2026"]
+    domains = ["example.com"] * 8 + ["gmail.com", "yahoo.com"]
+    records = []
+    for i in range(count):
+        records.append({
+            "Name": f"Employee {i}" if rng.random() > 0.02 else NOT_FOUND,
+            "Email": f"user{i}@{rng.choice(domains)}" if rng.random() > 0.03 else "user at example",
+            "Department": rng.choice(["Engineering", "Finance", "Sales", NOT_FOUND]),
+            "Role": rng.choice(["Analyst", "Engineer", "Manager"]),
+            "Start Date": rng.choice(start_dates),
+            "Salary": rng.choice([f"${rng.randint(15, 450)},000", f"{rng.randint(40, 200)}000", "TBD", NOT_FOUND]),
+            "Manager": "Pat Lee",
+            "Employee ID": f"EMP{i}",
+        })
+    return records
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--sizes", type=int, nargs="+", default=[10000, 100000])
+    args = parser.parse_args()
+
+    print(f"{'records':>10}{'per-record s':>15}{'batch s':>10}{'speedup':>10}{'records/s (batch)':>20}")
+    for size in args.sizes:
+        records = make_records(size)
+
+        start = time.perf_counter()
+        expected = [validate_fields(record, {}, today=TODAY) for record in records]
+        scalar_s = time.perf_counter() - start
+
+        start = time.perf_counter()
+        actual = validate_batch(records, today=TODAY)
+        batch_s = time.perf_counter() - start
+
+        if [tuple(result) for result in expected] != actual:
+            sys.exit(f"validate_batch disagrees with validate_fields at {size} records")
+        print(f"{size:>10,}{scalar_s:>15.3f}{batch_s:>10.3f}{scalar_s / batch_s:>9.1f}x{size / batch_s:>20,.0f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,284 @@
+"""Synthetic new-hire document corpus for the benchmark suite.
+
+Generates PDF and DOCX offer packets from a seed: an HR form (Name, Email,
+Department, Role, Start Date, Salary, Manager, Employee ID) followed by
+policy pages.  Documents vary in page count, form layout (inline
+"Label: value" lines, a two-column table, or labels stacked above their
+values), label synonyms ("Reports To", "Commencement Date", ...), extra
+tables and noise (headers, footers, a cover letter with decoy emails and
+dollar amounts, fields left out).  corpus.json records the parameters and
+the ground truth of every document, so extraction accuracy can be scored.
+The same seed always produces the same corpus.
+
+    python benchmarks/corpus.py corpus/ --docs 200 --seed 7 --formats pdf docx
+"""
+import argparse
+import datetime
+import hashlib
+import json
+import os
+import random
+import sys
+import textwrap
+import zipfile
+from xml.sax.saxutils import escape
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from aria.layout import FIELD_LABELS  # noqa: E402
+
+MANIFEST = "corpus.json"
+FORMATS = ["pdf", "docx"]
+LAYOUTS = ["inline", "table", "stacked"]
+NOISE = ["clean", "light", "heavy"]
+# Start dates are drawn relative to this day; validate against it
+REFERENCE_DATE = datetime.date(2026, 1, 5)
+DATE_FORMATS = ["%Y-%m-%d", "%m/%d/%Y", "%B %d, %Y", "%d/%m/%Y", "%m-%d-%Y"]
+
+FIRST = ["Jane", "Omar", "Priya", "Lucas", "Mei", "Tom", "Aisha", "Diego", "Sara", "Ken", "Ines", "Kwame"]
+LAST = ["Doe", "Haddad", "Raman", "Silva", "Chen", "Baker", "Bello", "Ortiz", "Novak", "Ito", "Moreau", "Mensah"]
+DEPARTMENTS = ["Engineering", "Finance", "Human Resources", "Sales", "Marketing", "Operations", "Legal"]
+ROLES = ["Software Engineer", "Financial Analyst", "HR Generalist", "Account Executive",
+         "Product Marketing Manager", "Operations Lead", "Paralegal", "Data Scientist"]
+DOMAINS = ["acme-corp.com", "example.com", "globex.io", "gmail.com"]
+
+BOILERPLATE = [
+    "This offer is contingent upon successful completion of a background check.",
+    "Employment with the company is at will and may be terminated at any time.",
+    "You will be eligible for the standard benefits package after 30 days.",
+    "Please review the enclosed code of conduct and return a signed copy.",
+    "Paid time off accrues at a rate defined in the employee handbook.",
+    "All company property must be returned upon separation of employment.",
+    "Expense reports are due within thirty days of the expense being incurred.",
+    "Remote work arrangements require written approval from your department head.",
+]
+# Cover-letter lines that look like fields to a regex
+DECOYS = [
+    "Questions? Write to onboarding@acme-corp.com or call the HR desk.",
+    "A one-time relocation allowance of $2,500 is paid with your first salary.",
+    "Start-up equipment will be shipped before your first day.",
+    "Please bring two forms of ID to orientation.",
+]
+LINES_PER_PAGE = 46
+
+CONTENT_TYPES = (
+    '<?xml version="1.0" encoding="UTF-8" standalone="yes"?>'
+    '<Types xmlns="http://schemas.openxmlformats.org/package/2006/content-types">'
+    '<Default Extension="rels" ContentType="application/vnd.openxmlformats-package.relationships+xml"/>'
+    '<Default Extension="xml" ContentType="application/xml"/>'
+    '<Override PartName="/word/document.xml" '
+    'ContentType="application/vnd.openxmlformats-officedocument.wordprocessingml.document.main+xml"/>'
+    '</Types>'
+)
+RELS = (
+    '<?xml version="1.0" encoding="UTF-8" standalone="yes"?>'
+    '<Relationships xmlns="http://schemas.openxmlformats.org/package/2006/relationships">'
+    '<Relationship Id="rId1" '
+    'Type="http://schemas.openxmlformats.org/officeDocument/2006/relationships/officeDocument" '
+    'Target="word/document.xml"/>'
+    '</Relationships>'
+)
+
+
+def new_hire(rng, index):
+    """Field values for one synthetic employee"""
+    first, last = rng.choice(FIRST), rng.choice(LAST)
+    start = REFERENCE_DATE + datetime.timedelta(days=rng.randint(-10, 120))
+    salary = rng.randrange(40_000, 260_000, 500)
+    return {
+        "Name": f"{first} {last}",
+        "Email": f"{first.lower()}.{last.lower()}{index}@{rng.choice(DOMAINS)}",
+        "Department": rng.choice(DEPARTMENTS),
+        "Role": rng.choice(ROLES),
+        "Start Date": start.strftime(rng.choice(DATE_FORMATS)),
+        "Salary": f"${salary:,}" if rng.random() < 0.8 else f"${salary:,}.00",
+        "Manager": f"{rng.choice(FIRST)} {rng.choice(LAST)}",
+        "Employee ID": f"EMP{rng.randint(10000, 99999)}",
+    }
+
+
+def page_count(rng, max_pages):
+    """Mostly short packets with a long tail"""
+    return min(max_pages, 1 + int(rng.expovariate(1 / 3)))
+
+
+def form_blocks(fields, labels, layout):
+    rows = [(labels[field], value) for field, value in fields.items()]
+    if layout == "table":
+        return [("table", rows)]
+    if layout == "stacked":
+        return [("para", line) for label, value in rows for line in (f"{label}:", value)]
+    return [("para", f"{label}: {value}") for label, value in rows]
+
+
+def document_blocks(rng, fields, labels, layout, noise, pages):
+    """Pages of ("para", text) and ("table", rows) blocks"""
+    title = ("para", "NEW HIRE INFORMATION FORM")
+    form = [title, *form_blocks(fields, labels, layout)]
+    cover = []
+    if noise == "heavy":
+        cover = [("para", "Dear new colleague,"),
+                 *(("para", line) for line in rng.sample(DECOYS, 2)),
+                 ("para", "We look forward to welcoming you.")]
+    body = []
+    for page in range(pages):
+        blocks = []
+        if noise != "clean":
+            blocks.append(("para", f"Acme Corp - Confidential - Page {page + 1} of {pages}"))
+        if page == 0:
+            blocks.extend(cover + form)
+        budget = LINES_PER_PAGE - sum(len(rows) if kind == "table" else 1 for kind, rows in blocks)
+        if noise != "clean" and page % 3 == 1:
+            blocks.append(("table", [("Task", "Owner", "Due"),
+                                     ("Laptop setup", "IT", "Day 1"),
+                                     ("Benefits enrollment", "HR", "Week 2")]))
+            budget -= 3
+        while budget > 2:
+            paragraph = " ".join(rng.sample(BOILERPLATE, rng.randint(1, 3)))
+            blocks.append(("para", paragraph))
+            budget -= len(textwrap.wrap(paragraph, 95))
+        body.append(blocks)
+    return body
+
+
+def write_pdf(path, pages):
+    import fitz  # PyMuPDF; only needed for PDF corpora
+
+    doc = fitz.open()
+    try:
+        for blocks in pages:
+            page = doc.new_page()
+            y = 72
+            for kind, content in blocks:
+                if y > page.rect.height - 72:
+                    page = doc.new_page()
+                    y = 72
+                if kind == "para":
+                    for line in textwrap.wrap(content, 95) or [""]:
+                        page.insert_text((72, y), line, fontsize=9)
+                        y += 13
+                    continue
+                width = (page.rect.width - 144) / len(content[0])
+                for row in content:
+                    for column, cell in enumerate(row):
+                        x = 72 + column * width
+                        page.draw_rect(fitz.Rect(x, y - 11, x + width, y + 5), width=0.5)
+                        page.insert_text((x + 4, y), cell, fontsize=9)
+                    y += 16
+                y += 6
+        doc.save(path, deflate=True)
+        return len(doc)
+    finally:
+        doc.close()
+
+
+def _docx_paragraph(text):
+    return f'<w:p><w:r><w:t xml:space="preserve">{escape(text)}</w:t></w:r></w:p>'
+
+
+def _docx_table(rows):
+    body = "".join(
+        "<w:tr>" + "".join(f"<w:tc>{_docx_paragraph(cell)}</w:tc>" for cell in row) + "</w:tr>"
+        for row in rows
+    )
+    return f"<w:tbl><w:tblPr/>{body}</w:tbl>"
+
+
+def write_docx(path, pages):
+    """Word has no stored pages; pages are separated by page breaks"""
+    with zipfile.ZipFile(path, "w", zipfile.ZIP_DEFLATED) as package:
+        package.writestr("[Content_Types].xml", CONTENT_TYPES)
+        package.writestr("_rels/.rels", RELS)
+        with package.open("word/document.xml", "w") as part:
+            part.write(
+                b'<?xml version="1.0" encoding="UTF-8" standalone="yes"?>'
+                b'<w:document xmlns:w="http://schemas.openxmlformats.org/wordprocessingml/2006/main"><w:body>'
+            )
+            for number, blocks in enumerate(pages):
+                if number:
+                    part.write(b'<w:p><w:r><w:br w:type="page"/></w:r></w:p>')
+                for kind, content in blocks:
+                    xml = _docx_paragraph(content) if kind == "para" else _docx_table(content)
+                    part.write(xml.encode("utf-8"))
+            part.write(b"<w:sectPr/></w:body></w:document>")
+    return len(pages)
+
+
+def generate(out_dir, docs=100, seed=0, formats=FORMATS, max_pages=12,
+             layouts=LAYOUTS, noise=NOISE, missing_rate=0.05):
+    """Write docs documents and corpus.json into out_dir; returns the manifest"""
+    os.makedirs(out_dir, exist_ok=True)
+    params = {
+        "docs": docs, "seed": seed, "formats": list(formats), "max_pages": max_pages,
+        "layouts": list(layouts), "noise": list(noise), "missing_rate": missing_rate,
+    }
+    rng = random.Random(seed)
+    documents = []
+    for index in range(docs):
+        file_format = formats[index % len(formats)]
+        layout = rng.choice(layouts)
+        noise_level = rng.choice(noise)
+        fields = new_hire(rng, index)
+        rate = missing_rate * (3 if noise_level == "heavy" else 1)
+        fields = {field: value for field, value in fields.items() if rng.random() >= rate}
+        labels = {field: rng.choice(FIELD_LABELS[field]) for field in fields}
+        planned = page_count(rng, max_pages)
+        blocks = document_blocks(rng, fields, labels, layout, noise_level, planned)
+
+        filename = f"{index:05d}-{layout}-{noise_level}.{file_format}"
+        path = os.path.join(out_dir, filename)
+        pages = write_pdf(path, blocks) if file_format == "pdf" else write_docx(path, blocks)
+        documents.append({
+            "file": filename,
+            "format": file_format,
+            "layout": layout,
+            "noise": noise_level,
+            "pages": pages,
+            "bytes": os.path.getsize(path),
+            "labels": labels,
+            "fields": fields,
+        })
+
+    manifest = {
+        "params": params,
+        "reference_date": REFERENCE_DATE.isoformat(),
+        "documents": documents,
+    }
+    with open(os.path.join(out_dir, MANIFEST), "w", encoding="utf-8") as handle:
+        json.dump(manifest, handle, indent=1, sort_keys=True)
+    return manifest
+
+
+def load(corpus_dir):
+    """The manifest of a generated corpus, with its digest under "sha256" """
+    with open(os.path.join(corpus_dir, MANIFEST), "rb") as handle:
+        raw = handle.read()
+    manifest = json.loads(raw)
+    manifest["sha256"] = hashlib.sha256(raw).hexdigest()
+    return manifest
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("out_dir")
+    parser.add_argument("--docs", type=int, default=100)
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--formats", nargs="+", choices=FORMATS, default=FORMATS)
+    parser.add_argument("--max-pages", type=int, default=12)
+    parser.add_argument("--layouts", nargs="+", choices=LAYOUTS, default=LAYOUTS)
+    parser.add_argument("--noise", nargs="+", choices=NOISE, default=NOISE)
+    parser.add_argument("--missing-rate", type=float, default=0.05)
+    args = parser.parse_args()
+
+    manifest = generate(
+        args.out_dir, args.docs, args.seed, args.formats, args.max_pages,
+        args.layouts, args.noise, args.missing_rate,
+    )
+    documents = manifest["documents"]
+    total_pages = sum(document["pages"] for document in documents)
+    total_mb = sum(document["bytes"] for document in documents) / 2**20
+    print(f"{len(documents)} documents, {total_pages} pages, {total_mb:.1f} MB in {args.out_dir}")
+
+
+if __name__ == "__main__":
+    main()